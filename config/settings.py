@@ -297,10 +297,27 @@ CACHES = {
             "STATIC_CACHE_TIMEOUT", default="60"
         ),  # Cache timeout in seconds: 1 minute
     },
+    "github_api": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:6379/3",
+        "TIMEOUT": env.int(
+            "GITHUB_API_CACHE_TIMEOUT", default=604800
+        ),  # Cache timeout in seconds: 1 week
+    },
 }
 
+# Cache holding GitHub responses and their ETags for conditional requests
+HTTP_CACHE_ALIAS = "github_api"
+
 ENABLE_DB_CACHE = env.bool("ENABLE_DB_CACHE", default=False)
 
+# How long, in seconds, each process keeps the current release
+CURRENT_RELEASE_CACHE_TIMEOUT = env.int("CURRENT_RELEASE_CACHE_TIMEOUT", default=300)
+
+# How long, in seconds, the rendered library lists are cached. Importing library
+# data makes them stale sooner.
+LIBRARY_LIST_CACHE_TIMEOUT = env.int("LIBRARY_LIST_CACHE_TIMEOUT", default=86400)
+
 # Default interval by which to clear the static content cache
 # New method: "never" clear, just overwrite, so that the id
 # field doesn't expand without bounds.
@@ -342,6 +359,11 @@ AUTHENTICATION_BACKENDS = (
 # GitHub settings
 
 GITHUB_TOKEN = env("GITHUB_TOKEN", default=None)
+# Requests left for the token below which GitHub API calls wait for the rate
+# limit to reset. Shared by all workers through Redis.
+GITHUB_RATE_LIMIT_RESERVE = env.int("GITHUB_RATE_LIMIT_RESERVE", default=100)
+# Longest single sleep while waiting, in seconds, before the limit is re-checked
+GITHUB_RATE_LIMIT_MAX_SLEEP = 60
 JDOODLE_API_CLIENT_ID = env("JDOODLE_API_CLIENT_ID", "")
 JDOODLE_API_CLIENT_SECRET = env("JDOODLE_API_CLIENT_SECRET", "")
 
@@ -559,6 +581,10 @@ CALENDAR_API_KEY = env("CALENDAR_API_KEY", default="changeme")
 EVENTS_CACHE_KEY = "homepage_events"
 EVENTS_CACHE_TIMEOUT = 300  # 5 min
 
+# How long, in seconds, a library description being rendered in the background
+# blocks another render, or a missing description is remembered
+LIBRARY_DESCRIPTION_TASK_TIMEOUT = 300
+
 # OAuth settings
 OAUTH_APP_NAME = (
     "Boost OAuth Concept"  # Stored in the admin; replicated for convenience
@@ -581,3 +607,16 @@ if DEBUG_TOOLBAR:
     MIDDLEWARE.append("debug_toolbar.middleware.DebugToolbarMiddleware")
 
 BOOST_BRANCHES = ["master", "develop"]
+
+# Persistent bare mirrors of library repos, used when importing commits
+GIT_MIRROR_DIR = env("GIT_MIRROR_DIR", default="/tmp/git-mirrors")
+# Least recently used mirrors are removed once the directory exceeds this size
+GIT_MIRROR_MAX_SIZE_MB = env.int("GIT_MIRROR_MAX_SIZE_MB", default=20480)
+# Number of libraries whose commits are imported concurrently
+COMMIT_IMPORT_WORKERS = env.int("COMMIT_IMPORT_WORKERS", default=4)
+
+# Number of concurrent libraries.json downloads while importing a version
+LIBRARIES_JSON_FETCH_WORKERS = env.int("LIBRARIES_JSON_FETCH_WORKERS", default=8)
+
+# Number of concurrent S3 requests when validating documentation URLs
+DOCS_URL_VALIDATION_WORKERS = env.int("DOCS_URL_VALIDATION_WORKERS", default=16)
@@ -1,4 +1,6 @@
 import logging
+import tempfile
+
 from .settings import *  # noqa
 
 
@@ -36,6 +38,9 @@ GITHUB_TOKEN = "changeme"
 # Make content relative to the project root
 BASE_CONTENT = BASE_DIR / "core/tests/content"  # noqa
 
+# Keep the files uploaded by tests out of the repository
+MEDIA_ROOT = tempfile.mkdtemp(prefix="boost-test-media-")
+
 # Don't use S3 in tests
 STORAGES = {
     "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
@@ -37,6 +37,7 @@ from core.views import (
 )
 from libraries.api import LibrarySearchView
 from libraries.views import (
+    LibraryDescription,
     LibraryDetail,
     LibraryListDispatcher,
     CommitAuthorEmailCreateView,
@@ -234,6 +235,11 @@ urlpatterns = (
             LibraryDetail.as_view(),
             name="library-detail",
         ),
+        path(
+            "library/<boostversionslug:version_slug>/<slug:library_slug>/description/",
+            LibraryDescription.as_view(),
+            name="library-description",
+        ),
         path(
             "libraries/commit_author_email_create/",
             CommitAuthorEmailCreateView.as_view(),
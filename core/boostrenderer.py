@@ -119,6 +119,25 @@ def get_content_from_s3(key=None, bucket_name=None):
     return {}
 
 
+def s3_content_exists(key, bucket_name=None, client=None):
+    """
+    Return True if get_content_from_s3 would find content for `key`. Uses HEAD
+    requests, so nothing is downloaded.
+    """
+    bucket_name = bucket_name or settings.STATIC_CONTENT_BUCKET_NAME
+    client = client or get_s3_client()
+
+    for s3_key in get_s3_keys(key) or []:
+        if does_s3_key_exist(client, bucket_name, s3_key):
+            return True
+        # Handle URLs that are directories looking for `index.html` files
+        if s3_key.endswith("/") and does_s3_key_exist(
+            client, bucket_name, f"{s3_key}index.html"
+        ):
+            return True
+    return False
+
+
 def get_content_type(s3_key, content_type):
     """In some cases, manually set the content-type for a given S3 key based on the
     file extension. This is useful for files types that are not recognized by S3, or for
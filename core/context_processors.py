@@ -2,12 +2,12 @@ from enum import StrEnum
 
 from django.conf import settings
 
-from versions.models import Version
+from versions.cache import get_current_release
 
 
 def current_version(request):
     """Custom context processor that adds the current release to the context"""
-    return {"current_version": Version.objects.most_recent()}
+    return {"current_version": get_current_release(request)}
 
 
 class NavItem(StrEnum):
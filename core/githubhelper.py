@@ -1,10 +1,11 @@
 import base64
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from socket import gaierror
 import time
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 from io import BytesIO
 from zipfile import ZipFile
 
@@ -19,15 +20,80 @@ from fastcore.net import (
     HTTP404NotFoundError,
     HTTP422UnprocessableEntityError,
 )
-from fastcore.xtras import obj2dict
+from fastcore.xtras import dict2obj, obj2dict
 from ghapi.all import GhApi, paged
 
+from .httpcache import (
+    conditional_get,
+    get_cached_response,
+    get_conditional_headers,
+    make_cache_key,
+    store_response,
+)
+from .ratelimit import GithubRateLimiter
+
 logger = structlog.get_logger()
 
 
+class CachingGhApi(GhApi):
+    """GhApi that revalidates GET requests against a shared cache.
+
+    JSON responses are stored with their ETag/Last-Modified validators, and
+    replayed when GitHub answers a conditional request with 304 Not Modified.
+    When a `rate_limiter` is given, every request waits for it and reports the
+    rate limit headers of the response back to it.
+    """
+
+    def __init__(self, *args, rate_limiter=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def __call__(
+        self,
+        path: str,
+        verb: str = None,
+        headers: dict = None,
+        route: dict = None,
+        query: dict = None,
+        data=None,
+        timeout=None,
+        decode=True,
+    ):
+        if (verb or ("POST" if data else "GET")) != "GET" or decode is not True:
+            return self.send(path, verb, headers, route, query, data, timeout, decode)
+
+        accept = (headers or {}).get("Accept", self.headers["Accept"])
+        key = make_cache_key(f"{path}:{sorted((route or {}).items())}", query, accept)
+        entry = get_cached_response(key)
+        headers = {**(headers or {}), **get_conditional_headers(entry)}
+        try:
+            result = self.send(path, verb, headers, route, query, data, timeout, decode)
+        except HTTPError as e:
+            if e.code == 304 and entry:
+                return dict2obj(entry["body"])
+            raise
+        store_response(key, self.recv_hdrs, obj2dict(result))
+        return result
+
+    def send(self, *args):
+        """Make the request through GhApi, respecting the shared rate limit."""
+        if not self.rate_limiter:
+            return super().__call__(*args)
+        self.rate_limiter.acquire()
+        try:
+            result = super().__call__(*args)
+        except HTTPError as e:
+            self.rate_limiter.update(e.headers)
+            raise
+        self.rate_limiter.update(self.recv_hdrs)
+        return result
+
+
 class GithubAPIClient:
     """A class to interact with the GitHub API."""
 
+    raw_content_url = "https://raw.githubusercontent.com"
+
     def __init__(
         self,
         owner: str = "boostorg",
@@ -48,6 +114,7 @@ class GithubAPIClient:
         self.ref = ref
         self.repo_slug = repo_slug
         self.logger = structlog.get_logger()
+        self.session = self.initialize_session()
 
         # Modules we need to skip as they are not really Boost Libraries
         self.skip_modules = [
@@ -75,7 +142,24 @@ class GithubAPIClient:
 
         :return: GhApi, the GitHub API
         """
-        return GhApi(token=self.token)
+        rate_limiter = GithubRateLimiter(self.token) if self.token else None
+        return CachingGhApi(token=self.token, rate_limiter=rate_limiter)
+
+    def initialize_session(self) -> requests.Session:
+        """
+        Initialize a session for raw file downloads, with a connection pool large
+        enough to be shared by the concurrent libraries.json fetches.
+
+        :return: requests.Session, the session
+        """
+        session = requests.Session()
+        pool_size = max(settings.LIBRARIES_JSON_FETCH_WORKERS, 10)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def is_authenticated(self) -> bool:
         if not self.api:
@@ -311,6 +395,10 @@ class GithubAPIClient:
                 blob = self.get_blob(repo_slug=repo_slug, file_sha=file_sha)
                 return base64.b64decode(blob["content"])
 
+    def get_libraries_json_url(self, repo_slug: str, tag: str = "master") -> str:
+        """Return the raw URL of 'meta/libraries.json' for the repo at `tag`."""
+        return f"{self.raw_content_url}/{self.owner}/{repo_slug}/{tag}/meta/libraries.json"  # noqa
+
     def get_libraries_json(self, repo_slug: str, tag: str = "master"):
         """
         Retrieve library metadata from 'meta/libraries.json'
@@ -318,10 +406,10 @@ class GithubAPIClient:
         Example:
         https://github.com/boostorg/align/blob/5ad7df63cd792fbdb801d600b93cad1a432f0151/meta/libraries.json
         """
-        url = f"https://raw.githubusercontent.com/{self.owner}/{repo_slug}/{tag}/meta/libraries.json"  # noqa
+        url = self.get_libraries_json_url(repo_slug, tag)
 
         try:
-            response = requests.get(url)
+            response = conditional_get(url, session=self.session)
             response.raise_for_status()
         # This usually happens because the library does not have a `meta/libraries.json`
         # in the requested tag. More likely to happen with older versions of libraries.
@@ -331,6 +419,63 @@ class GithubAPIClient:
         else:
             return response.json()
 
+    def get_libraries_json_for_modules(
+        self, modules: list[tuple[str, str]], workers: int = None
+    ) -> list:
+        """
+        Retrieve 'meta/libraries.json' for several repos concurrently.
+
+        :param modules: list, `(repo_slug, tag)` pairs. The tag may be a Git tag, a
+            branch or a commit SHA.
+        :param workers: int, the maximum number of concurrent requests. Defaults to
+            settings.LIBRARIES_JSON_FETCH_WORKERS.
+        :return: list, the libraries.json contents in the same order as `modules`.
+            Entries are None where the file doesn't exist, and the raised exception
+            where it couldn't be fetched or parsed.
+        """
+
+        def fetch(module):
+            repo_slug, tag = module
+            try:
+                response = conditional_get(
+                    self.get_libraries_json_url(repo_slug, tag), session=self.session
+                )
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                self.logger.warning(
+                    "get_libraries_json_failed",
+                    repo_slug=repo_slug,
+                    tag=tag,
+                    exc_msg=str(e),
+                )
+                return e
+
+        workers = workers or settings.LIBRARIES_JSON_FETCH_WORKERS
+        if workers <= 1:
+            return [fetch(module) for module in modules]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, modules))
+
+    def get_submodule_shas(self, ref: dict = None) -> dict:
+        """
+        Get the commit each submodule of the repo points at.
+
+        :param ref: dict, the Git reference object (the commit hash).
+            See https://docs.github.com/en/rest/git/refs for expected format.
+        :return: dict, the submodule commit SHAs keyed by submodule path
+        """
+        if not ref:
+            ref = self.get_ref()
+        tree = self.get_tree(tree_sha=ref["object"]["sha"], recursive=True)
+        return {
+            item["path"]: item["sha"]
+            for item in tree["tree"]
+            if item["type"] == "commit"
+        }
+
     def get_file_content(
         self,
         repo_slug: str = None,
@@ -346,9 +491,9 @@ class GithubAPIClient:
                           "library-detail.adoc" or "README.md".
         :return: str, the specified file content from the repo
         """
-        url = f"https://raw.githubusercontent.com/{self.owner}/{repo_slug}/{tag}/{file_path}"  # noqa
+        url = f"{self.raw_content_url}/{self.owner}/{repo_slug}/{tag}/{file_path}"
 
-        response = requests.get(url)
+        response = conditional_get(url, session=self.session)
 
         if not response.status_code == 200:
             logger.exception(
@@ -396,7 +541,12 @@ class GithubAPIClient:
             return
 
     def get_repo_issues(
-        self, owner: str, repo_slug: str, state: str = "all", issues_only: bool = True
+        self,
+        owner: str,
+        repo_slug: str,
+        state: str = "all",
+        issues_only: bool = True,
+        since: datetime = None,
     ):
         """
         Get all issues for a repo.
@@ -404,9 +554,12 @@ class GithubAPIClient:
         support filtering in the request, so to exclude PRs from the list of issues, we
         do some manual filtering of the results
 
+        If `since` is passed, only issues updated at or after that time are returned.
+
         Note: GhApi() returns results as AttrDict objects:
         https://fastcore.fast.ai/basics.html#attrdict
         """
+        extra = {"since": since.isoformat()} if since else {}
         pages = list(
             self.with_retry(
                 lambda: paged(
@@ -415,6 +568,7 @@ class GithubAPIClient:
                     repo=repo_slug,
                     state=state,
                     per_page=100,
+                    **extra,
                 )
             )
         )
@@ -434,26 +588,47 @@ class GithubAPIClient:
 
         return results
 
-    def get_repo_prs(self, repo_slug, state="all"):
+    def get_repo_prs(self, repo_slug, state="all", since: datetime = None):
         """
         Get all PRs for a repo
         Note: GhApi() returns results as AttrDict objects:
         https://fastcore.fast.ai/basics.html#attrdict
+
+        The pulls endpoint has no `since` filter, so when `since` is passed the PRs
+        are requested most recently updated first, and paging stops at the first PR
+        last updated before `since`.
         """
-        pages = list(
-            paged(
-                self.api.pulls.list,
-                owner=self.owner,
-                repo=repo_slug,
-                state=state,
-                per_page=100,
+        if not since:
+            pages = list(
+                paged(
+                    self.api.pulls.list,
+                    owner=self.owner,
+                    repo=repo_slug,
+                    state=state,
+                    per_page=100,
+                )
             )
-        )
-        # Concatenate all pages into a single list
-        results = []
-        for p in pages:
-            results.extend(p)
+            # Concatenate all pages into a single list
+            results = []
+            for p in pages:
+                results.extend(p)
 
+            return results
+
+        results = []
+        for page in paged(
+            self.api.pulls.list,
+            owner=self.owner,
+            repo=repo_slug,
+            state=state,
+            sort="updated",
+            direction="desc",
+            per_page=100,
+        ):
+            for pr in page:
+                if parse(pr["updated_at"]) < since:
+                    return results
+                results.append(pr)
         return results
 
     def get_release_by_tag(self, tag_name: str, repo_slug: str = None) -> dict:
@@ -494,16 +669,23 @@ class GithubAPIClient:
 
         return tags
 
-    def get_tree(self, repo_slug: str = None, tree_sha: str = None) -> dict:
+    def get_tree(
+        self, repo_slug: str = None, tree_sha: str = None, recursive: bool = False
+    ) -> dict:
         """
         Get the tree from the GitHub API.
 
         :param repo_slug: str, the repository slug
         :param tree_sha: str, the tree sha
+        :param recursive: bool, whether to include the entries of subdirectories
         :return: dict, the tree
         """
         if not repo_slug:
             repo_slug = self.repo_slug
+        if recursive:
+            return self.api.git.get_tree(
+                owner=self.owner, repo=repo_slug, tree_sha=tree_sha, recursive=1
+            )
         return self.api.git.get_tree(
             owner=self.owner, repo=repo_slug, tree_sha=tree_sha
         )
@@ -538,6 +720,9 @@ class GithubAPIClient:
         return data
 
     def get_artifact_content(self, url):
+        rate_limiter = self.api.rate_limiter
+        if rate_limiter:
+            rate_limiter.acquire()
         resp = requests.get(
             url,
             headers={
@@ -545,6 +730,8 @@ class GithubAPIClient:
                 "accept": "application/vnd.github+json",
             },
         )
+        if rate_limiter:
+            rate_limiter.update(resp.headers)
         if resp.status_code != 200:
             logger.error(
                 "Error while fetching artifact file.", status_code=resp.status_code
@@ -596,6 +783,7 @@ class GithubDataParser:
         current_submodule = None
 
         submodule_re = re.compile(r"^\[submodule \"(.*)\"\]$")
+        path_re = re.compile(r"^\s*path\s*\=\s*(.*?)\s*$")
         url_re = re.compile(r"^\s*url\s*\=\s*\.\.\/(.*)\.git\s*$")
 
         for line in gitmodules.split("\n"):
@@ -604,6 +792,11 @@ class GithubDataParser:
                 current_submodule = {"module": sub_m.group(1)}
                 continue
 
+            path_m = path_re.match(line)
+            if path_m and current_submodule is not None:
+                current_submodule["path"] = path_m.group(1)
+                continue
+
             url_m = url_re.match(line)
             if url_m:
                 name = url_m.group(1)
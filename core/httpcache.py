@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+import requests
+import structlog
+from django.conf import settings
+from django.core.cache import caches
+
+logger = structlog.get_logger()
+
+
+def get_http_cache():
+    """Return the cache shared by all workers for conditional HTTP requests."""
+    return caches[settings.HTTP_CACHE_ALIAS]
+
+
+def make_cache_key(url: str, params: dict = None, accept: str = "") -> str:
+    """Build a cache key for a GET request from its URL, query and Accept header."""
+    raw = json.dumps([url, sorted((params or {}).items()), accept], default=str)
+    return f"http_cache_{hashlib.sha256(raw.encode()).hexdigest()}"
+
+
+def get_header(headers, name: str) -> str | None:
+    """Case-insensitive header lookup that works on plain dicts."""
+    name = name.lower()
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def get_cached_response(key: str) -> dict | None:
+    """Return the stored `{"etag", "last_modified", "body"}` entry, if any."""
+    return get_http_cache().get(key)
+
+
+def get_conditional_headers(entry: dict | None) -> dict:
+    """Return the If-None-Match/If-Modified-Since headers to revalidate `entry`."""
+    headers = {}
+    if not entry:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def store_response(key: str, response_headers, body) -> None:
+    """Store `body` with the validators from `response_headers`.
+
+    Responses without an ETag or Last-Modified header can't be revalidated, so
+    they aren't stored.
+    """
+    etag = get_header(response_headers, "ETag")
+    last_modified = get_header(response_headers, "Last-Modified")
+    if not etag and not last_modified:
+        return
+    get_http_cache().set(
+        key, {"etag": etag, "last_modified": last_modified, "body": body}
+    )
+
+
+def conditional_get(url: str, params: dict = None, headers: dict = None, session=None):
+    """Send a GET request, revalidating any stored copy of the response.
+
+    If the server answers 304 Not Modified, a 200 response is rebuilt from the
+    stored body, so callers can treat the result like any `requests.Response`.
+    GitHub doesn't count 304 responses against the rate limit.
+    """
+    headers = headers or {}
+    key = make_cache_key(url, params, get_header(headers, "Accept") or "")
+    entry = get_cached_response(key)
+    response = (session or requests).get(
+        url, params=params, headers={**headers, **get_conditional_headers(entry)}
+    )
+
+    if response.status_code == 304 and entry:
+        logger.debug("conditional_get_not_modified", url=url)
+        cached = requests.Response()
+        cached.status_code = 200
+        cached._content = entry["body"]
+        cached.headers.update(response.headers)
+        cached.url = response.url
+        cached.request = response.request
+        return cached
+
+    if response.status_code == 200:
+        store_response(key, response.headers, response.content)
+    return response
@@ -0,0 +1,248 @@
+"""Record and replay the HTTP traffic of the import pipeline.
+
+GitHub API calls (made by GhApi through fastcore's `urlsend`), `requests` calls
+(raw.githubusercontent.com, archives, etc.) and S3 calls made by boto3 are captured
+once against the live services into a JSON fixture. They can then be replayed
+without network access, with a configurable latency per request, to profile the
+imports repeatably.
+
+    with HttpHarness("fixtures.json", mode="record"):
+        import_library_versions("boost-1.85.0")
+
+    with HttpHarness("fixtures.json", latency=0.05) as harness:
+        import_library_versions("boost-1.85.0")
+    print(harness.request_count)
+"""
+
+import base64
+import hashlib
+import io
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+
+import ghapi.core
+import requests
+import structlog
+from botocore.awsrequest import AWSResponse
+from botocore.httpsession import URLLib3Session
+from fastcore.net import ExceptionsHTTP
+from requests.adapters import HTTPAdapter
+
+logger = structlog.get_logger()
+
+FIXTURE_FORMAT_VERSION = 1
+
+
+class RequestNotRecorded(Exception):
+    """Raised when replaying a request that isn't in the fixture."""
+
+
+class ReplayedBody(io.BytesIO):
+    """A recorded response body that botocore can read or stream."""
+
+    def stream(self, amt=None, **kwargs):
+        while chunk := self.read(amt or 64 * 1024):
+            yield chunk
+
+
+def encode_body(body) -> dict:
+    if isinstance(body, bytes):
+        return {"base64": base64.b64encode(body).decode()}
+    return {"value": body}
+
+
+def decode_body(body: dict):
+    if "base64" in body:
+        return base64.b64decode(body["base64"])
+    return body["value"]
+
+
+def get_body_hash(body) -> str:
+    if not body:
+        return ""
+    if not isinstance(body, (bytes, str)):
+        body = json.dumps(body, sort_keys=True, default=str)
+    if isinstance(body, str):
+        body = body.encode()
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def make_request_key(kind: str, method: str, url: str, body=None) -> str:
+    return " ".join(filter(None, [kind, method.upper(), url, get_body_hash(body)]))
+
+
+class HttpHarness:
+    """Context manager that records HTTP traffic to, or replays it from, `path`.
+
+    In replay mode, identical requests get the recorded responses in the order
+    they were recorded, the last one being repeated. A request that wasn't
+    recorded raises RequestNotRecorded.
+    """
+
+    def __init__(self, path, mode: str = "replay", latency: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown mode {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.entries = defaultdict(list)
+        self.positions = Counter()
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        self.patches = []
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.counts.values())
+
+    def __enter__(self):
+        if self.mode == "replay":
+            data = json.loads(self.path.read_text())
+            self.entries.update(data["entries"])
+        self.original_urlsend = ghapi.core.urlsend
+        self.original_adapter_send = HTTPAdapter.send
+        self.original_boto_send = URLLib3Session.send
+
+        harness = self
+
+        def adapter_send(adapter, request, **kwargs):
+            return harness.send_requests(adapter, request, **kwargs)
+
+        def boto_send(session, request):
+            return harness.send_boto(session, request)
+
+        self.patches = [
+            patch.object(ghapi.core, "urlsend", self.urlsend),
+            patch.object(HTTPAdapter, "send", adapter_send),
+            patch.object(URLLib3Session, "send", boto_send),
+        ]
+        for p in self.patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for p in reversed(self.patches):
+            p.stop()
+        if self.mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(
+                    {"version": FIXTURE_FORMAT_VERSION, "entries": self.entries},
+                    indent=1,
+                    sort_keys=True,
+                )
+            )
+            logger.info(
+                "http_harness_recorded", path=str(self.path), requests=self.counts
+            )
+        return False
+
+    def record(self, key: str, entry: dict):
+        with self.lock:
+            self.counts[key.split(" ", 1)[0]] += 1
+            self.entries[key].append(entry)
+
+    def replay(self, key: str) -> dict:
+        with self.lock:
+            self.counts[key.split(" ", 1)[0]] += 1
+            responses = self.entries.get(key)
+            if not responses:
+                raise RequestNotRecorded(key)
+            position = self.positions[key]
+            self.positions[key] = position + 1
+        if self.latency:
+            time.sleep(self.latency)
+        return responses[min(position, len(responses) - 1)]
+
+    # GitHub API, through GhApi
+
+    def urlsend(self, url, verb, headers=None, route=None, query=None, data=None, **kw):
+        full_url = url.format(**route) if route else url
+        if query:
+            full_url = f"{full_url}?{urlencode(sorted(query.items()))}"
+        key = make_request_key("github", verb, full_url, data)
+
+        if self.mode == "replay":
+            entry = self.replay(key)
+            if "error" in entry:
+                code, hdrs = entry["error"], entry["headers"]
+                if 400 <= code < 500:
+                    raise ExceptionsHTTP[code](full_url, hdrs, None, msg=entry["msg"])
+                raise HTTPError(full_url, code, entry["msg"], hdrs, None)
+            result = decode_body(entry["body"])
+            if kw.get("return_headers"):
+                return result, entry["headers"]
+            return result
+
+        try:
+            result = self.original_urlsend(
+                url, verb, headers=headers, route=route, query=query, data=data, **kw
+            )
+        except HTTPError as e:
+            self.record(
+                key, {"error": e.code, "msg": str(e.msg), "headers": dict(e.headers)}
+            )
+            raise
+        body, hdrs = result if kw.get("return_headers") else (result, {})
+        self.record(key, {"body": encode_body(body), "headers": dict(hdrs)})
+        return result
+
+    # requests: raw.githubusercontent.com, archives, etc.
+
+    def send_requests(self, adapter, request, **kwargs):
+        key = make_request_key("http", request.method, request.url, request.body)
+
+        if self.mode == "replay":
+            entry = self.replay(key)
+            response = requests.Response()
+            response.status_code = entry["status"]
+            response.headers.update(entry["headers"])
+            response._content = decode_body(entry["body"])
+            response.url = request.url
+            response.request = request
+            return response
+
+        response = self.original_adapter_send(adapter, request, **kwargs)
+        self.record(
+            key,
+            {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "body": encode_body(response.content),
+            },
+        )
+        return response
+
+    # S3, through botocore
+
+    def send_boto(self, session, request):
+        key = make_request_key("s3", request.method, request.url, request.body)
+
+        if self.mode == "replay":
+            entry = self.replay(key)
+            return AWSResponse(
+                request.url,
+                entry["status"],
+                entry["headers"],
+                ReplayedBody(decode_body(entry["body"])),
+            )
+
+        response = self.original_boto_send(session, request)
+        content = response.content
+        # The body has been read, so hand botocore a fresh stream over it
+        response.raw = ReplayedBody(content)
+        self.record(
+            key,
+            {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "body": encode_body(content),
+            },
+        )
+        return response
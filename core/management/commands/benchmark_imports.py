@@ -0,0 +1,171 @@
+import threading
+import time
+
+import djclick as click
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+
+from config.celery import app
+from core.githubhelper import GithubAPIClient
+from core.httpreplay import HttpHarness
+from libraries.github import LibraryUpdater
+from libraries.models import Library
+from versions.tasks import import_library_versions, import_version
+
+STAGES = [
+    "import_version",
+    "import_library_versions",
+    "update_libraries",
+    "update_issues",
+]
+
+
+class Rollback(Exception):
+    """Raised to roll back the database changes of a stage."""
+
+
+class QueryCounter:
+    """Count the queries run on every database connection while in use.
+
+    Besides the connection of the current thread, this counts the queries of the
+    connections opened meanwhile, like the ones of the thread pool workers.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+        self.connections = []
+
+    def __call__(self, execute, sql, params, many, context):
+        with self.lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.add(connection)
+        connection_created.connect(self.on_connection_created)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self.on_connection_created)
+        for db in self.connections:
+            db.execute_wrappers.remove(self)
+
+    def add(self, db):
+        if self not in db.execute_wrappers:
+            db.execute_wrappers.append(self)
+            self.connections.append(db)
+
+    def on_connection_created(self, sender, connection, **kwargs):
+        self.add(connection)
+
+
+def run_stage(stage, version_name, library_keys):
+    if stage == "import_version":
+        tags = GithubAPIClient().get_tags()
+        tag = next(tag for tag in tags if tag["name"] == version_name)
+        import_version(version_name, tag=tag)
+    elif stage == "import_library_versions":
+        import_library_versions(version_name)
+    elif stage == "update_libraries":
+        LibraryUpdater().update_libraries()
+    elif stage == "update_issues":
+        updater = LibraryUpdater()
+        for library in Library.objects.filter(key__in=library_keys):
+            updater.update_issues(library)
+
+
+@click.command()
+@click.argument("fixture", type=click.Path(dir_okay=False))
+@click.option(
+    "--record",
+    is_flag=True,
+    default=False,
+    help="Record the live traffic into FIXTURE instead of replaying it.",
+)
+@click.option(
+    "--latency",
+    type=float,
+    default=0.0,
+    help="Seconds added to every replayed request.",
+)
+@click.option(
+    "--stage",
+    "stages",
+    type=click.Choice(STAGES),
+    multiple=True,
+    help="Stage to run. Can be repeated; defaults to all stages.",
+)
+@click.option(
+    "--release",
+    "version_name",
+    default="boost-1.85.0",
+    help="Version for the import_version and import_library_versions stages.",
+)
+@click.option(
+    "--library",
+    "library_keys",
+    multiple=True,
+    default=["align", "any", "json"],
+    help="Library key for the update_issues stage. Can be repeated.",
+)
+@click.option(
+    "--keep",
+    is_flag=True,
+    default=False,
+    help="Keep the database changes made by each stage instead of rolling back.",
+)
+def command(fixture, record, latency, stages, version_name, library_keys, keep):
+    """Benchmark the import stages against recorded HTTP traffic.
+
+    Reports the wall time, HTTP request count and database query count of each
+    stage, counting the queries of the worker threads too. Run with --record once
+    against the live services to create FIXTURE.
+    Database changes are rolled back after each stage unless --keep is passed.
+    """
+    mode = "record" if record else "replay"
+    # Conditional requests would make the recording depend on the cache contents,
+    # and replayed rate limit headers shouldn't make the benchmark wait.
+    benchmark_settings = override_settings(
+        CACHES={
+            **settings.CACHES,
+            "benchmark": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        },
+        HTTP_CACHE_ALIAS="benchmark",
+        GITHUB_RATE_LIMIT_RESERVE=0,
+    )
+    task_always_eager = app.conf.task_always_eager
+    app.conf.task_always_eager = True
+
+    results = []
+    try:
+        with benchmark_settings, HttpHarness(fixture, mode, latency) as harness:
+            for stage in stages or STAGES:
+                click.secho(f"Running {stage}...", fg="green")
+                request_count = harness.request_count
+                with QueryCounter() as queries:
+                    start = time.perf_counter()
+                    try:
+                        with transaction.atomic():
+                            run_stage(stage, version_name, library_keys)
+                            if not keep:
+                                raise Rollback
+                    except Rollback:
+                        pass
+                    seconds = time.perf_counter() - start
+                results.append(
+                    (
+                        stage,
+                        seconds,
+                        harness.request_count - request_count,
+                        queries.count,
+                    )
+                )
+    finally:
+        app.conf.task_always_eager = task_always_eager
+
+    click.secho(f"{'Stage':<25}{'Seconds':>10}{'Requests':>10}{'Queries':>10}")
+    for stage, seconds, requests, queries in results:
+        click.secho(f"{stage:<25}{seconds:>10.2f}{requests:>10}{queries:>10}")
@@ -1,16 +1,60 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import frontmatter
 from core.boostrenderer import BoostRenderer
 from mistletoe import Document
 
+# Maximum number of rendered markdown documents kept in the per-process cache
+RENDER_CACHE_SIZE = 256
+
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def _content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def clear_render_cache():
+    """Empty the per-process markdown render cache."""
+    with _render_cache_lock:
+        _render_cache.clear()
 
-def process_md(filename):
-    with open(filename) as f:
-        post = frontmatter.load(f)
-        metadata = post.metadata
-        content = post.content
 
-        with BoostRenderer() as renderer:
-            doc = Document(content)
-            rendered = renderer.render(doc)
+def render_markdown(text):
+    """Render a markdown string to HTML, returning `(metadata, rendered)`.
 
-    return metadata, rendered
+    Any frontmatter is parsed into `metadata`. Results are kept in a bounded,
+    least-recently-used cache keyed by a hash of the content, so rendering the
+    same document twice in a process only parses it once.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+
+    key = _content_hash(text)
+    with _render_cache_lock:
+        cached = _render_cache.get(key)
+        if cached is not None:
+            _render_cache.move_to_end(key)
+            metadata, rendered = cached
+            return dict(metadata), rendered
+
+    post = frontmatter.loads(text)
+    with BoostRenderer() as renderer:
+        doc = Document(post.content)
+        rendered = renderer.render(doc)
+
+    with _render_cache_lock:
+        _render_cache[key] = (post.metadata, rendered)
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+    return dict(post.metadata), rendered
+
+
+def process_md(filename):
+    with open(filename) as f:
+        return render_markdown(f.read())
@@ -0,0 +1,83 @@
+import hashlib
+import time
+
+import structlog
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from .httpcache import get_header
+
+logger = structlog.get_logger()
+
+
+class GithubRateLimiter:
+    """Token bucket shared by every worker making GitHub API calls with a token.
+
+    The bucket holds the number of requests GitHub says are left for the token
+    (`X-RateLimit-Remaining`) and the time the limit resets (`X-RateLimit-Reset`),
+    both stored in Redis. Each request takes a token; once only
+    `settings.GITHUB_RATE_LIMIT_RESERVE` are left, callers wait for the reset
+    instead of failing. Until GitHub has reported a limit, requests are allowed.
+    """
+
+    def __init__(self, token: str, reserve: int = None, connection=None):
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        self.key = f"github_rate_limit:{token_hash}"
+        self.reserve = (
+            settings.GITHUB_RATE_LIMIT_RESERVE if reserve is None else reserve
+        )
+        self._connection = connection
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = get_redis_connection("default")
+        return self._connection
+
+    def get_wait(self) -> int:
+        """Take a token from the bucket, or return the seconds until the reset."""
+        reset = self.connection.hget(self.key, "reset")
+        now = int(time.time())
+        if reset is None or now >= int(reset):
+            return 0
+        remaining = self.connection.hincrby(self.key, "remaining", -1)
+        if remaining >= self.reserve:
+            return 0
+        return int(reset) - now + 1
+
+    def acquire(self):
+        """Block until a request can be made without exhausting the rate limit."""
+        while wait := self.get_wait():
+            logger.warning("github_rate_limit_waiting", seconds=wait)
+            time.sleep(min(wait, settings.GITHUB_RATE_LIMIT_MAX_SLEEP))
+
+    def update(self, headers):
+        """Refill the bucket from the rate limit headers of a GitHub response."""
+        if not headers:
+            return
+        remaining = get_header(headers, "X-RateLimit-Remaining")
+        reset = get_header(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        remaining, reset = int(remaining), int(reset)
+
+        def set_limit(pipe):
+            current_remaining, current_reset = pipe.hmget(
+                self.key, "remaining", "reset"
+            )
+            # Responses can arrive out of order; within a window, GitHub's count
+            # only goes down, so never raise the stored count.
+            if current_reset is not None and (
+                int(current_reset) > reset
+                or (
+                    int(current_reset) == reset
+                    and current_remaining is not None
+                    and int(current_remaining) <= remaining
+                )
+            ):
+                return
+            pipe.multi()
+            pipe.hset(self.key, mapping={"remaining": remaining, "reset": reset})
+            pipe.expireat(self.key, reset + 60)
+
+        self.connection.transaction(set_limit, self.key)
@@ -1,8 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from django.core import management
 from django.conf import settings
+from django.db import connections
 import os
 
+from core.management.commands.benchmark_imports import QueryCounter
+from libraries.models import Library
+
 
 @pytest.fixture
 def cleanup_test_asciidoc():
@@ -36,3 +42,21 @@ def test_asciidoc_command_creates_output(cleanup_test_asciidoc):
     # Check that the output contains a div with the id "content"
     with open(os.path.join(settings.BASE_DIR, output_file), "r") as f:
         assert 'id="content"' in f.read()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_query_counter_counts_worker_threads():
+    def count_libraries(_):
+        try:
+            return Library.objects.count()
+        finally:
+            connections.close_all()
+
+    with QueryCounter() as queries:
+        Library.objects.count()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(count_libraries, range(4)))
+
+    assert queries.count == 5
+    Library.objects.count()
+    assert queries.count == 5
@@ -1,5 +1,11 @@
 import datetime
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
 from unittest.mock import MagicMock, Mock
+from zipfile import ZipFile
 
 import pytest
 import responses
@@ -59,6 +65,122 @@ def test_get_libraries_json(github_api_client):
     assert responses.calls[0].request.url == url
 
 
+@pytest.fixture
+def raw_content_server():
+    """A local stand-in for raw.githubusercontent.com that answers slowly.
+
+    Records the most requests it had in flight at once in `server.max_in_flight`.
+    """
+    lock = threading.Lock()
+    in_flight = 0
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            nonlocal in_flight
+            with lock:
+                in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, in_flight)
+            try:
+                time.sleep(0.05)
+                self.respond()
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        def respond(self):
+            repo_slug = self.path.split("/")[2]
+            if repo_slug == "missing":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps({"key": repo_slug}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_libraries_json_for_modules(github_api_client, raw_content_server):
+    github_api_client.raw_content_url = (
+        f"http://127.0.0.1:{raw_content_server.server_port}"
+    )
+    modules = [(f"lib{i}", "master") for i in range(20)] + [("missing", "master")]
+    expected = [{"key": f"lib{i}"} for i in range(20)] + [None]
+
+    serial = github_api_client.get_libraries_json_for_modules(modules, workers=1)
+    assert serial == expected
+    assert raw_content_server.max_in_flight == 1
+
+    result = github_api_client.get_libraries_json_for_modules(modules, workers=8)
+    assert result == expected
+    assert raw_content_server.max_in_flight > 1
+
+
+def test_get_submodule_shas(github_api_client):
+    github_api_client.api.git.get_tree = MagicMock(
+        return_value={
+            "tree": [
+                {"path": ".gitmodules", "type": "blob", "sha": "1"},
+                {"path": "libs", "type": "tree", "sha": "2"},
+                {"path": "libs/align", "type": "commit", "sha": "3"},
+                {"path": "tools/build", "type": "commit", "sha": "4"},
+            ]
+        }
+    )
+    result = github_api_client.get_submodule_shas(ref={"object": {"sha": "abc"}})
+    assert result == {"libs/align": "3", "tools/build": "4"}
+    github_api_client.api.git.get_tree.assert_called_with(
+        owner=github_api_client.owner, repo="boost", tree_sha="abc", recursive=1
+    )
+
+
+@responses.activate
+def test_get_artifact_content_without_rate_limiter(github_api_client):
+    """Artifacts can be downloaded by a client whose API has no rate limiter"""
+    github_api_client.token = ""
+    github_api_client.api = github_api_client.initialize_api()
+    assert github_api_client.api.rate_limiter is None
+    content = BytesIO()
+    with ZipFile(content, "w") as zip_file:
+        zip_file.writestr("output.txt", "Module algorithm")
+    url = "https://api.github.com/repos/boostorg/boostdep/actions/artifacts/1/zip"
+    responses.add(responses.GET, url, body=content.getvalue())
+
+    assert github_api_client.get_artifact_content(url) == "Module algorithm"
+
+
+def test_get_repo_prs_since(github_api_client):
+    """get_repo_prs stops paging at the first PR updated before `since`"""
+    since = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+    pages = [
+        [
+            {"id": 3, "updated_at": "2024-05-03T00:00:00Z"},
+            {"id": 2, "updated_at": "2024-05-01T00:00:00Z"},
+        ],
+        [{"id": 1, "updated_at": "2024-04-30T00:00:00Z"}],
+        [{"id": 0, "updated_at": "2024-04-29T00:00:00Z"}],
+    ]
+    github_api_client.api.pulls.list = MagicMock(side_effect=pages)
+
+    result = github_api_client.get_repo_prs("sample_repo", since=since)
+
+    assert [pr["id"] for pr in result] == [3, 2]
+    assert github_api_client.api.pulls.list.call_count == 2
+    assert github_api_client.api.pulls.list.call_args.kwargs["sort"] == "updated"
+
+
 def test_get_ref(github_api_client):
     """Test the get_ref method of GitHubAPIClient."""
     github_api_client.api.git.get_ref = MagicMock(
@@ -129,10 +251,12 @@ def test_parse_gitmodules():
     expected_output = [
         {
             "module": "system",
+            "path": "libs/system",
             "url": "system",
         },
         {
             "module": "multi_array",
+            "path": "libs/multi_array",
             "url": "multi_array",
         },
     ]
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+import pytest
+import responses
+
+from core.githubhelper import CachingGhApi
+from core.httpcache import conditional_get, get_http_cache
+
+URL = "https://raw.githubusercontent.com/boostorg/boost/master/meta/libraries.json"
+
+
+@pytest.fixture(autouse=True)
+def empty_http_cache():
+    get_http_cache().clear()
+    yield
+    get_http_cache().clear()
+
+
+@responses.activate
+def test_conditional_get_replays_not_modified():
+    responses.add(responses.GET, URL, json={"key": "any"}, headers={"ETag": '"v1"'})
+    first = conditional_get(URL)
+    assert first.json() == {"key": "any"}
+    assert "If-None-Match" not in responses.calls[0].request.headers
+
+    responses.replace(responses.GET, URL, status=304, headers={"ETag": '"v1"'})
+    second = conditional_get(URL)
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert second.json() == {"key": "any"}
+
+
+@responses.activate
+def test_conditional_get_without_validators_is_not_cached():
+    responses.add(responses.GET, URL, json={"key": "any"})
+    conditional_get(URL)
+    conditional_get(URL)
+    assert "If-None-Match" not in responses.calls[1].request.headers
+
+
+def test_caching_ghapi_replays_not_modified():
+    api = CachingGhApi(token="token")
+    not_modified = HTTPError(URL, 304, "Not Modified", {}, None)
+    with patch("ghapi.core.urlsend") as mock_urlsend:
+        mock_urlsend.return_value = ({"sha": "abc"}, {"ETag": '"v1"'})
+        first = api("/repos/{owner}/{repo}", route={"owner": "o", "repo": "r"})
+
+        mock_urlsend.side_effect = not_modified
+        second = api("/repos/{owner}/{repo}", route={"owner": "o", "repo": "r"})
+
+    assert first.sha == second.sha == "abc"
+    headers = mock_urlsend.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+
+
+def test_caching_ghapi_raises_other_errors():
+    api = CachingGhApi(token="token")
+    with patch("ghapi.core.urlsend") as mock_urlsend:
+        mock_urlsend.side_effect = HTTPError(URL, 304, "Not Modified", {}, None)
+        with pytest.raises(HTTPError):
+            api("/repos/{owner}/{repo}", route={"owner": "o", "repo": "r"})
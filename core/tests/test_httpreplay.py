@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import boto3
+import pytest
+import requests
+import responses
+from botocore.awsrequest import AWSResponse
+from botocore.httpsession import URLLib3Session
+from fastcore.net import HTTP404NotFoundError
+
+from core.githubhelper import CachingGhApi
+from core.httpreplay import HttpHarness, ReplayedBody, RequestNotRecorded
+
+URL = "https://raw.githubusercontent.com/boostorg/any/master/meta/libraries.json"
+
+
+@pytest.fixture
+def fixture_path(tmp_path):
+    return tmp_path / "fixture.json"
+
+
+def test_harness_requests(fixture_path):
+    with responses.RequestsMock() as mock_responses:
+        mock_responses.add(responses.GET, URL, json={"key": "any"})
+        mock_responses.add(responses.GET, URL, json={"key": "any", "name": "Any"})
+        with HttpHarness(fixture_path, mode="record") as harness:
+            requests.get(URL)
+            requests.get(URL)
+        assert harness.request_count == 2
+
+    with HttpHarness(fixture_path) as harness:
+        assert requests.get(URL).json() == {"key": "any"}
+        assert requests.get(URL).json() == {"key": "any", "name": "Any"}
+        # The last recorded response is repeated
+        assert requests.get(URL).json() == {"key": "any", "name": "Any"}
+        with pytest.raises(RequestNotRecorded):
+            requests.get(f"{URL}?other")
+    assert harness.request_count == 4
+
+
+def test_harness_github_api(fixture_path):
+    api = CachingGhApi(token="token")
+    not_found = HTTP404NotFoundError("url", {}, None, msg="Not Found")
+    with patch("ghapi.core.urlsend") as mock_urlsend:
+        mock_urlsend.side_effect = [({"name": "boost"}, {"ETag": '"v1"'}), not_found]
+        with HttpHarness(fixture_path, mode="record"):
+            api("/repos/{owner}/{repo}", "PATCH", route={"owner": "o", "repo": "r"})
+            with pytest.raises(HTTP404NotFoundError):
+                api("/repos/{owner}/{repo}", "PATCH", route={"owner": "o", "repo": "x"})
+
+    with HttpHarness(fixture_path):
+        result = api(
+            "/repos/{owner}/{repo}", "PATCH", route={"owner": "o", "repo": "r"}
+        )
+        assert result.name == "boost"
+        with pytest.raises(HTTP404NotFoundError):
+            api("/repos/{owner}/{repo}", "PATCH", route={"owner": "o", "repo": "x"})
+
+
+def test_harness_s3(fixture_path):
+    client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+    )
+
+    def send(session, request):
+        return AWSResponse(request.url, 200, {}, ReplayedBody(b"<html></html>"))
+
+    with patch.object(URLLib3Session, "send", send):
+        with HttpHarness(fixture_path, mode="record"):
+            response = client.get_object(Bucket="bucket", Key="doc/index.html")
+            assert response["Body"].read() == b"<html></html>"
+
+    with HttpHarness(fixture_path, latency=0.01) as harness:
+        response = client.get_object(Bucket="bucket", Key="doc/index.html")
+        assert response["Body"].read() == b"<html></html>"
+    assert harness.counts == {"s3": 1}
@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+
+from .. import markdown
+from ..markdown import clear_render_cache, process_md, render_markdown
+
+
+@pytest.fixture(autouse=True)
+def empty_render_cache():
+    clear_render_cache()
+    yield
+    clear_render_cache()
+
+
+def test_render_markdown():
+    metadata, rendered = render_markdown("# Title\n\nSome *text*.")
+    assert metadata == {}
+    assert "<h1>Title</h1>" in rendered
+    assert "<em>text</em>" in rendered
+
+
+def test_render_markdown_bytes_and_frontmatter():
+    content = b"---\ntitle: Hello\n---\n\nBody"
+    metadata, rendered = render_markdown(content)
+    assert metadata == {"title": "Hello"}
+    assert "<p>Body</p>" in rendered
+
+
+def test_render_markdown_youtube_shortcode():
+    _, rendered = render_markdown("[[ youtube | U4VZ9DRdXAI ]]")
+    assert "https://www.youtube.com/embed/U4VZ9DRdXAI" in rendered
+
+
+def test_render_markdown_uses_cache():
+    with patch.object(markdown, "Document", wraps=markdown.Document) as mock_doc:
+        first = render_markdown("Cached")
+        second = render_markdown("Cached")
+    assert first == second
+    assert mock_doc.call_count == 1
+
+
+def test_render_markdown_cache_is_bounded():
+    with patch.object(markdown, "RENDER_CACHE_SIZE", 2):
+        render_markdown("one")
+        render_markdown("two")
+        render_markdown("three")
+        assert len(markdown._render_cache) == 2
+
+
+def test_process_md(tmp_path):
+    path = tmp_path / "test.md"
+    path.write_text("---\ntitle: File\n---\n\nFrom a file")
+    metadata, rendered = process_md(path)
+    assert metadata == {"title": "File"}
+    assert "<p>From a file</p>" in rendered
@@ -0,0 +1,69 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.githubhelper import CachingGhApi
+from core.ratelimit import GithubRateLimiter
+
+
+@pytest.fixture
+def rate_limiter():
+    limiter = GithubRateLimiter("test-token", reserve=10)
+    limiter.connection.delete(limiter.key)
+    yield limiter
+    limiter.connection.delete(limiter.key)
+
+
+def rate_limit_headers(remaining, reset):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+
+
+def test_rate_limiter_allows_requests_without_limit(rate_limiter):
+    assert rate_limiter.get_wait() == 0
+
+
+def test_rate_limiter_waits_at_reserve(rate_limiter):
+    reset = int(time.time()) + 100
+    rate_limiter.update(rate_limit_headers(11, reset))
+    assert rate_limiter.get_wait() == 0
+    assert 0 < rate_limiter.get_wait() <= 101
+
+
+def test_rate_limiter_allows_requests_after_reset(rate_limiter):
+    rate_limiter.update(rate_limit_headers(0, int(time.time()) - 1))
+    assert rate_limiter.get_wait() == 0
+
+
+def test_rate_limiter_ignores_stale_headers(rate_limiter):
+    reset = int(time.time()) + 100
+    rate_limiter.update(rate_limit_headers(50, reset))
+    # A response that was sent earlier in the same window arrives late
+    rate_limiter.update(rate_limit_headers(60, reset))
+    assert int(rate_limiter.connection.hget(rate_limiter.key, "remaining")) == 50
+
+    # A new window replaces the count
+    rate_limiter.update(rate_limit_headers(5000, reset + 3600))
+    assert int(rate_limiter.connection.hget(rate_limiter.key, "remaining")) == 5000
+
+
+def test_rate_limiter_acquire_sleeps_until_reset(rate_limiter):
+    rate_limiter.update(rate_limit_headers(0, int(time.time()) + 100))
+    with patch("core.ratelimit.time.sleep") as mock_sleep:
+        mock_sleep.side_effect = lambda _: rate_limiter.connection.delete(
+            rate_limiter.key
+        )
+        rate_limiter.acquire()
+    mock_sleep.assert_called_once()
+
+
+def test_caching_ghapi_reports_rate_limit():
+    rate_limiter = MagicMock()
+    api = CachingGhApi(token="token", rate_limiter=rate_limiter)
+    headers = rate_limit_headers(4999, int(time.time()) + 3600)
+    with patch("ghapi.core.urlsend") as mock_urlsend:
+        mock_urlsend.return_value = ({"login": "user"}, headers)
+        api("/user", verb="PATCH")
+
+    rate_limiter.acquire.assert_called_once()
+    rate_limiter.update.assert_called_once_with(headers)
@@ -30,7 +30,7 @@ from requests.compat import chardet
 from config.settings import ENABLE_DB_CACHE
 from libraries.constants import LATEST_RELEASE_URL_PATH_STR
 from libraries.utils import legacy_path_transform
-from versions.models import Version
+from versions.cache import get_current_release
 
 from .asciidoc import convert_adoc_to_html
 from .boostrenderer import (
@@ -272,7 +272,7 @@ class BaseStaticContentTemplateView(TemplateView):
     def get_library_content_path(self, content_path):
         # here we handle the translation from "release/..." to /$version_x_y_z/...
         if content_path.startswith(f"{LATEST_RELEASE_URL_PATH_STR}/"):
-            version = Version.objects.most_recent()
+            version = get_current_release(self.request)
             content_path = content_path.replace(
                 f"{LATEST_RELEASE_URL_PATH_STR}/", f"{version.stripped_boost_url_slug}/"
             )
@@ -452,7 +452,7 @@ BOOST_LIB_PATH_RE = re.compile(r"^(boost_){0,1}([0-9_]*[0-9]+[^/]*)/(.*)")
 def normalize_boost_doc_path(content_path: str) -> str:
     content_path = content_path.lstrip("boost_")
     if content_path.startswith(LATEST_RELEASE_URL_PATH_STR):
-        version = Version.objects.most_recent()
+        version = get_current_release()
         content_path = content_path.replace(
             f"{LATEST_RELEASE_URL_PATH_STR}/", f"{version.stripped_boost_url_slug}/"
         )
@@ -845,7 +845,7 @@ class BaseRedirectView(View):
     @staticmethod
     def get_latest_library_version():
         """Return the latest version for a given library."""
-        return Version.objects.most_recent().stripped_boost_url_slug
+        return get_current_release().stripped_boost_url_slug
 
 
 class RedirectToDocsView(BaseRedirectView):
@@ -25,3 +25,13 @@ def post_fork(server, worker):
     patch_psycopg()
     worker.log.info("Made Psycopg2 Green")
     monkey.patch_all()
+
+
+def post_worker_init(worker):
+    # Build the library search index before the first search reaches the worker
+    from libraries.search import get_library_search_index
+
+    try:
+        get_library_search_index()
+    except Exception:
+        worker.log.exception("Could not build the library search index")
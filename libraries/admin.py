@@ -281,7 +281,7 @@ class LibraryAdmin(admin.ModelAdmin):
             LibraryVersion.objects.filter(
                 library_id=pk, version__in=Version.objects.minor_versions()
             )
-            .annotate(count=Count("commit"), version_name=F("version__name"))
+            .annotate(count=F("commit_count"), version_name=F("version__name"))
             .order_by("-version__name")
             .filter(count__gt=0)
         )[:10]
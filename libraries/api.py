@@ -1,5 +1,3 @@
-from django.db.models import Q
-
 from rest_framework import permissions
 from rest_framework import viewsets
 from rest_framework import serializers
@@ -7,6 +5,7 @@ from rest_framework import renderers
 from rest_framework.response import Response
 
 from .models import Library
+from .search import search_libraries
 
 
 class LibrarySearchSerializer(serializers.ModelSerializer):
@@ -32,13 +31,7 @@ class LibrarySearchView(viewsets.ModelViewSet):
         match the search params limited to 5 results
         """
         value = self.request.query_params.get("q")
-        f = (
-            Q(name__icontains=value)
-            | Q(description__icontains=value)
-            | Q(categories__name__icontains=value)
-            | Q(authors__display_name__icontains=value)
-        )
-        return Library.objects.filter(f).distinct()[:5]
+        return search_libraries(value, limit=5)
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
@@ -0,0 +1,67 @@
+import random
+import time
+
+from django.core.cache import cache
+
+from .models import LibraryVersion
+
+FEATURED_LIBRARY_VERSIONS_CACHE_KEY = "featured-library-versions"
+LIBRARY_DATA_GENERATION_KEY = "library-data-generation"
+
+
+def get_library_data_generation() -> int:
+    """Return a marker that changes whenever the library data changes.
+
+    Cached renderings of the library data, like the library lists, include it in
+    their keys so they go stale on the next change.
+    """
+    return cache.get(LIBRARY_DATA_GENERATION_KEY, 0)
+
+
+def bump_library_data_generation():
+    """Make everything cached against the library data generation stale."""
+    cache.set(LIBRARY_DATA_GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def build_featured_library_version_ids(version) -> list[int]:
+    """Return the ids of the LibraryVersions of `version` that can be featured.
+
+    These are the LibraryVersions of featured libraries, or all of them when no
+    library of `version` is featured.
+    """
+    library_versions = LibraryVersion.objects.filter(version=version)
+    ids = list(
+        library_versions.filter(library__featured=True).values_list("id", flat=True)
+    )
+    return ids or list(library_versions.values_list("id", flat=True))
+
+
+def get_featured_library_version(version) -> LibraryVersion | None:
+    """Return a random featured LibraryVersion of `version`, for the homepage.
+
+    The candidates are cached until a Library or LibraryVersion changes (see
+    libraries.signals), and the chosen one comes with its library, authors and
+    maintainers.
+    """
+    if version is None:
+        return None
+    data = cache.get(FEATURED_LIBRARY_VERSIONS_CACHE_KEY)
+    if data is None or data["version"] != version.pk:
+        data = {
+            "version": version.pk,
+            "ids": build_featured_library_version_ids(version),
+        }
+        cache.set(FEATURED_LIBRARY_VERSIONS_CACHE_KEY, data, timeout=None)
+    if not data["ids"]:
+        return None
+    return (
+        LibraryVersion.objects.select_related("library", "version")
+        .prefetch_related("authors", "maintainers", "library__authors")
+        .filter(pk=random.choice(data["ids"]))
+        .first()
+    )
+
+
+def clear_featured_library_versions():
+    """Pick the featured library candidates again on their next use."""
+    cache.delete(FEATURED_LIBRARY_VERSIONS_CACHE_KEY)
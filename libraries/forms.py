@@ -6,7 +6,7 @@ from datetime import date, timedelta
 
 from django import forms
 from django.template.loader import render_to_string
-from django.db.models import F, Q, Count, OuterRef, Sum, When, Value, Case
+from django.db.models import Q, Count, OuterRef, Sum, When, Value, Case
 from django.forms import Form, ModelChoiceField, ModelForm, BooleanField
 
 from core.models import RenderedContent
@@ -343,43 +343,18 @@ class CreateReportForm(CreateReportFullForm):
 
         return set(version_author_ids) - set(prior_version_author_ids)
 
-    def _count_new_contributors(self, libraries, library_order, version):
-        version_lt = list(
-            Version.objects.minor_versions()
-            .filter(version_array__lt=version.cleaned_version_parts_int)
-            .values_list("id", flat=True)
-        )
-        version_lte = version_lt + [version.id]
-        lt_subquery = LibraryVersion.objects.filter(
-            version__in=version_lt,
-            library=OuterRef("id"),
-        ).values("id")
-        lte_subquery = LibraryVersion.objects.filter(
-            version__in=version_lte,
-            library=OuterRef("id"),
-        ).values("id")
-        return sorted(
-            list(
-                libraries.annotate(
-                    authors_before_release_count=Count(
-                        "library_version__commit__author",
-                        filter=Q(library_version__in=lt_subquery),
-                        distinct=True,
-                    ),
-                    authors_through_release_count=Count(
-                        "library_version__commit__author",
-                        filter=Q(library_version__in=lte_subquery),
-                        distinct=True,
-                    ),
-                )
-                .annotate(
-                    count=F("authors_through_release_count")
-                    - F("authors_before_release_count")
-                )
-                .values("id", "count")
-            ),
-            key=lambda x: library_order.index(x["id"]),
-        )
+    def _count_new_contributors(self, library_order, version):
+        """Return the new commit authors of each library, from the counts stored
+        by LibraryUpdater.update_commit_counts()."""
+        counts = dict(
+            LibraryVersion.objects.filter(
+                version=version, library_id__in=library_order
+            ).values_list("library_id", "new_author_count")
+        )
+        return [
+            {"id": library_id, "count": counts.get(library_id, 0)}
+            for library_id in library_order
+        ]
 
     def _count_issues(self, libraries, library_order, version, prior_version):
         data = {
@@ -686,7 +661,7 @@ class CreateReportForm(CreateReportFullForm):
                 self._get_library_full_counts(libraries, library_order),
                 self._get_library_version_counts(library_order, version),
                 self._get_top_contributors_for_library_version(library_order, version),
-                self._count_new_contributors(libraries, library_order, version),
+                self._count_new_contributors(library_order, version),
                 self._count_issues(libraries, library_order, version, prior_version),
                 self._get_library_versions(library_order, version),
                 self._get_dependency_data(library_order, version),
@@ -746,8 +721,7 @@ class CreateReportForm(CreateReportFullForm):
         batched_library_data = conditional_batched(
             library_data,
             2,
-            lambda x: x.get("top_contributors_release").count()
-            <= AUTHORS_PER_PAGE_THRESHOLD,
+            lambda x: x["library_version"].author_count <= AUTHORS_PER_PAGE_THRESHOLD,
         )
         new_libraries = libraries.exclude(
             library_version__version__release_date__lte=prior_version.release_date
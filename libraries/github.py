@@ -1,8 +1,8 @@
 import re
 import time
-import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
 from typing import assert_never
 from dateutil.relativedelta import relativedelta
 import subprocess
@@ -11,9 +11,10 @@ import structlog
 from ghapi.core import HTTP404NotFoundError
 from fastcore.xtras import obj2dict
 
-from django.db.models import Exists, OuterRef
+from django.db.models import Count, Exists, Max, OuterRef
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils import dateparse, timezone
 
 from versions.models import Version
@@ -23,14 +24,24 @@ from .models import (
     Commit,
     CommitAuthor,
     CommitAuthorEmail,
+    CommitImportWatermark,
+    ContributorRanking,
     Issue,
     Library,
+    LibrariesJsonSnapshot,
     LibraryVersion,
     PullRequest,
+    VersionCommitAuthor,
 )
 from core.githubhelper import GithubAPIClient, GithubDataParser
 
-from .utils import generate_fake_email, parse_boostdep_artifact, parse_date
+from .mirrors import git_mirror
+from .utils import (
+    batched,
+    generate_fake_email,
+    parse_boostdep_artifact,
+    parse_date,
+)
 
 logger = structlog.get_logger()
 
@@ -66,111 +77,220 @@ class VersionDiffStat:
     deletions: int
 
 
-def get_commit_data_for_repo_versions(key, min_version=""):
+@dataclass
+class RefWatermark:
+    ref: str
+    base: str
+    sha: str
+
+
+@dataclass
+class CommitImportResult:
+    key: str
+    commits: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+
+# Fields of each commit are separated by the ASCII unit separator, and `git log -z`
+# terminates each commit with a NUL byte. Neither appears in commit metadata.
+GIT_LOG_FIELD_SEPARATOR = "\x1f"
+GIT_LOG_FORMAT = GIT_LOG_FIELD_SEPARATOR.join(["%H", "%P", "%an", "%ae", "%aI", "%B"])
+GIT_LOG_CHUNK_SIZE = 64 * 1024
+# Number of emails per query when looking up existing commit authors
+AUTHOR_EMAIL_CHUNK_SIZE = 1000
+# Issues and pull requests saved per query
+GITHUB_ITEMS_CHUNK_SIZE = 500
+
+
+def parse_git_log_record(record: bytes, version: str) -> ParsedCommit:
+    """Parse a single commit record produced with GIT_LOG_FORMAT."""
+    sha, parents, name, email, date, message = record.decode(
+        "utf-8", errors="replace"
+    ).split(GIT_LOG_FIELD_SEPARATOR, 5)
+    committed_at = dateparse.parse_datetime(date)
+    assert committed_at  # should always exist
+    return ParsedCommit(
+        email=email.strip(),
+        name=name.strip(),
+        message=message.strip("\n"),
+        sha=sha.strip(),
+        committed_at=committed_at,
+        is_merge=len(parents.split()) > 1,
+        version=version,
+    )
+
+
+def iter_git_log(git_dir, rev_range: str, version: str, exclude: str = None):
+    """Yield a ParsedCommit for each commit in `rev_range`, skipping commits
+    reachable from `exclude` if given. Returns whether `git log` succeeded.
+
+    The log is read from the subprocess pipe in fixed size chunks and split on the
+    NUL record terminators, so memory use doesn't grow with the size of the history.
+    """
+    process = subprocess.Popen(
+        [
+            "git",
+            "--git-dir",
+            str(git_dir),
+            "log",
+            "-z",
+            f"--format={GIT_LOG_FORMAT}",
+            rev_range,
+            *([f"^{exclude}"] if exclude else []),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        remainder = b""
+        while chunk := process.stdout.read(GIT_LOG_CHUNK_SIZE):
+            *records, remainder = (remainder + chunk).split(b"\0")
+            for record in records:
+                if record:
+                    yield parse_git_log_record(record, version)
+        if remainder.strip():
+            yield parse_git_log_record(remainder, version)
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        if process.wait() not in (0, -9):
+            logger.warning(f"git log {rev_range} failed", returncode=process.returncode)
+    return process.returncode == 0
+
+
+def resolve_commit(git_dir, ref: str) -> str | None:
+    """Return the commit SHA `ref` points to, or None if it doesn't exist."""
+    completed = subprocess.run(
+        ["git", "--git-dir", str(git_dir), "rev-parse", "-q", "--verify"]
+        + [f"{ref}^{{commit}}"],
+        capture_output=True,
+    )
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.decode().strip()
+
+
+def is_ancestor(git_dir, ancestor: str, descendant: str) -> bool:
+    """Return True if `ancestor` is reachable from `descendant`."""
+    completed = subprocess.run(
+        ["git", "--git-dir", str(git_dir), "merge-base", "--is-ancestor"]
+        + [ancestor, descendant],
+        capture_output=True,
+    )
+    return completed.returncode == 0
+
+
+def get_commit_data_for_repo_versions(key, min_version="", watermarks=None):
     """Fetch commit data between minor versions (ignore patches).
 
-    Get commits from one x.x.0 release to the next x.x.0 release. Commits
+    Get commits from one x.x.0 release to the next x.x.0 release, and from the
+    most recent x.x.0 release to the master and develop branches. Commits
     to and from patches or beta versions are ignored.
 
+    `watermarks` maps a ref to the RefWatermark recorded by a previous import.
+    Ranges whose head hasn't moved are skipped, and branches that moved forward
+    only have their new commits walked. A RefWatermark is yielded after each
+    range is read successfully, so a range that git failed to read, e.g. because
+    its base tag is missing from the mirror, is retried next time. The diff stats
+    of every range that is read are yielded in full.
+
+    The repository is read from a persistent bare mirror (see `libraries.mirrors`)
+    which is fetched rather than cloned on each run.
     """
     library = Library.objects.get(key=key)
-    parser = re.compile(
-        r"^commit (?P<sha>\w+)(?:\n(?P<merge>Merge).*)?\nAuthor: (?P<name>[^\<]+)"
-        r"\s+\<(?P<email>[^\>]+)\>\nDate:\s+(?P<date>.*)\n(?P<message>(.|\n)+?)"
-        r"(?=(commit|\Z))",
-        flags=re.MULTILINE,
-    )
-    re.compile(
-        r"(?:(?P<files_changed>\d+) files changed)?.*?"
-        r"(?:(?P<insertions>\d+) insertions)?.*?(?:(?P<deletions>\d+) deletions)?",
-    )
+    watermarks = watermarks or {}
 
-    retry_count = 0
-    with tempfile.TemporaryDirectory() as temp_dir:
-        git_dir = Path(temp_dir) / f"{library.key}.git"
-        is_clone_successful = False
-        while retry_count < 5:
-            retry_count += 1
-            completed = subprocess.run(
-                ["git", "clone", f"{library.github_url}.git", "--bare", str(git_dir)],
-                capture_output=True,
-            )
-            message = completed.stdout.decode()
-            error = completed.stderr.decode()
-            # successful output always startswith 'Cloning into bare repository'
-            # Clone message comes out from stderr, not stdout
-            if not error.startswith("Cloning into bare repository"):
-                logger.warning(
-                    f"{completed.args} failed. Retrying git clone. Retry {retry_count}."
-                )
-                time.sleep(2**retry_count)
-                continue
-            else:
-                is_clone_successful = True
-                break
-        if not is_clone_successful:
-            logger.error(f"Clone failed for {library.key}. {message=} {error=}")
+    if not library.github_repo:
+        logger.error(f"No GitHub repo for {library.key}, skipping commit import.")
+        return
+
+    with git_mirror(f"{library.github_url}.git", library.github_repo) as git_dir:
+        if not git_dir:
             return
-        versions = (
-            [""]
-            + list(
-                Version.objects.minor_versions()
-                .filter(library_version__library__key=library.key)
-                .order_by("version_array")
-                .values_list("name", flat=True)
-            )
-            + ["master"]
+        versions = [""] + list(
+            Version.objects.minor_versions()
+            .filter(library_version__library__key=library.key)
+            .order_by("version_array")
+            .values_list("name", flat=True)
         )
-        for a, b in zip(versions, versions[1:]):
+        ranges = list(zip(versions, versions[1:]))
+        ranges += [(versions[-1], branch) for branch in settings.BOOST_BRANCHES]
+        for a, b in ranges:
             if a < min_version and b < min_version:
                 # Don't bother comparing two versions we don't care about
                 continue
+            if not (head := resolve_commit(git_dir, b)):
+                logger.info(f"{b} not found in {library.key}, skipping.")
+                continue
+            exclude = None
+            if (watermark := watermarks.get(b)) and watermark.base == a:
+                if watermark.sha == head:
+                    # Nothing new since the last import
+                    continue
+                if b in settings.BOOST_BRANCHES and is_ancestor(
+                    git_dir, watermark.sha, head
+                ):
+                    exclude = watermark.sha
+
             shortstat = subprocess.run(
                 ["git", "--git-dir", str(git_dir), "diff", f"{a}..{b}", "--shortstat"],
                 capture_output=True,
             )
-            stat_output = shortstat.stdout.decode()
-            files_changed = insertions = deletions = 0
-            if m := re.search(r"(\d+) files? changed", stat_output):
-                files_changed = int(m.group(1))
-            if m := re.search(r"(\d+) insertions?", stat_output):
-                insertions = int(m.group(1))
-            if m := re.search(r"(\d+) deletions?", stat_output):
-                deletions = int(m.group(1))
-            yield VersionDiffStat(
-                version=b,
-                insertions=insertions,
-                deletions=deletions,
-                files_changed=files_changed,
-            )
-
-            log_output = subprocess.run(
-                ["git", "--git-dir", str(git_dir), "log", f"{a}..{b}", "--date", "iso"],
-                capture_output=True,
-            )
-            commits = log_output.stdout.decode()
-            for match in parser.finditer(commits):
-                groups = match.groupdict()
-                name = groups["name"].strip()
-                email = groups["email"].strip()
-                sha = groups["sha"].strip()
-                is_merge = bool(groups.get("merge", False))
-                message = groups["message"].strip("\n")
-                message = "\n".join(
-                    [m[4:] if m.startswith("    ") else m for m in message.split("\n")]
-                )
-                committed_at = dateparse.parse_datetime(groups["date"])
-                assert committed_at  # should always exist
-                yield ParsedCommit(
-                    email=email,
-                    name=name,
-                    message=message,
-                    sha=sha,
-                    committed_at=committed_at,
-                    is_merge=is_merge,
+            if shortstat.returncode == 0:
+                stat_output = shortstat.stdout.decode()
+                files_changed = insertions = deletions = 0
+                if m := re.search(r"(\d+) files? changed", stat_output):
+                    files_changed = int(m.group(1))
+                if m := re.search(r"(\d+) insertions?", stat_output):
+                    insertions = int(m.group(1))
+                if m := re.search(r"(\d+) deletions?", stat_output):
+                    deletions = int(m.group(1))
+                yield VersionDiffStat(
                     version=b,
+                    insertions=insertions,
+                    deletions=deletions,
+                    files_changed=files_changed,
+                )
+            else:
+                logger.warning(
+                    f"git diff {a}..{b} failed", returncode=shortstat.returncode
                 )
 
+            log_read = yield from iter_git_log(
+                git_dir, f"{a}..{b}", version=b, exclude=exclude
+            )
+            if shortstat.returncode == 0 and log_read:
+                yield RefWatermark(ref=b, base=a, sha=head)
+
+
+def get_commit_authors_by_email(emails) -> dict[str, CommitAuthor]:
+    """Return a mapping of email to CommitAuthor for the emails that exist."""
+    authors = {}
+    for chunk in batched(emails, AUTHOR_EMAIL_CHUNK_SIZE):
+        for author_email in CommitAuthorEmail.objects.filter(
+            email__in=chunk
+        ).select_related("author"):
+            authors[author_email.email] = author_email.author
+    return authors
+
+
+def get_commit_counts_by_author(library: Library) -> dict[int, Counter]:
+    """Return the commit count of each author per LibraryVersion id of `library`.
+
+    Commits without an author are counted under None.
+    """
+    counts = defaultdict(Counter)
+    for library_version_id, author_id, count in (
+        Commit.objects.filter(library_version__library=library)
+        .values("library_version", "author")
+        .annotate(count=Count("id"))
+        .values_list("library_version", "author", "count")
+    ):
+        counts[library_version_id][author_id] = count
+    return counts
+
 
 class LibraryUpdater:
     """
@@ -243,6 +363,56 @@ class LibraryUpdater:
 
         return libraries
 
+    def get_libraries_json_for_submodules(
+        self, submodules: list[tuple[str, str | None]], tag: str
+    ) -> list:
+        """Return the libraries.json data for each `(repo_slug, sha)` submodule.
+
+        Files are stored by commit in LibrariesJsonSnapshot, so each (repo, commit)
+        pair is only downloaded once across all versions. Submodules whose commit is
+        unknown (`sha` is None) are fetched at `tag` and not stored.
+
+        Returns a list in the same order as `submodules`. Entries are None where the
+        file doesn't exist or couldn't be fetched.
+        """
+        stored = {
+            (snapshot.repo_slug, snapshot.sha): snapshot.data
+            for snapshot in LibrariesJsonSnapshot.objects.filter(
+                sha__in={sha for _, sha in submodules if sha}
+            )
+        }
+        to_fetch = list(
+            dict.fromkeys(
+                (repo_slug, sha or tag)
+                for repo_slug, sha in submodules
+                if (repo_slug, sha) not in stored
+            )
+        )
+        fetched = dict(
+            zip(to_fetch, self.client.get_libraries_json_for_modules(to_fetch))
+        )
+        snapshots = [
+            LibrariesJsonSnapshot(repo_slug=repo_slug, sha=sha, data=data)
+            for (repo_slug, sha), data in fetched.items()
+            if (repo_slug, sha) in submodules and not isinstance(data, Exception)
+        ]
+        LibrariesJsonSnapshot.objects.bulk_create(snapshots, ignore_conflicts=True)
+        self.logger.info(
+            "get_libraries_json_for_submodules",
+            tag=tag,
+            stored=len(stored),
+            fetched=len(to_fetch),
+        )
+
+        results = []
+        for repo_slug, sha in submodules:
+            if (repo_slug, sha) in stored:
+                results.append(stored[(repo_slug, sha)])
+                continue
+            data = fetched[(repo_slug, sha or tag)]
+            results.append(None if isinstance(data, Exception) else data)
+        return results
+
     def update_libraries(self):
         """
         Update all libraries with the metadata from their libraries.json file.
@@ -263,6 +433,8 @@ class LibraryUpdater:
             self.update_categories(obj, categories=lib["category"])
             # self.update_authors(obj, authors=lib["authors"])
 
+        Library.objects.update_search_vectors()
+
     def update_library(self, library_data: dict) -> Library:
         """Update an individual library"""
         logger = self.logger.bind(library=library_data)
@@ -361,12 +533,22 @@ class LibraryUpdater:
             self.logger.info(f"User {user.email} added as a maintainer of {obj}")
 
     def update_issues(self, library):
-        """Import GitHub issues for the library and update the database"""
+        """Import GitHub issues for the library and update the database
+
+        Only issues updated since the most recently modified stored issue are
+        requested, so a library without stored issues gets a full import.
+        """
         self.logger.info("updating_repo_issues")
 
+        since = library.issues.aggregate(since=Max("modified"))["since"]
         issues_data = self.client.get_repo_issues(
-            self.client.owner, library.github_repo, state="all", issues_only=True
+            self.client.owner,
+            library.github_repo,
+            state="all",
+            issues_only=True,
+            since=since,
         )
+        issues = []
         for issue_dict in issues_data:
             # Get the date information
             closed_at = None
@@ -382,41 +564,39 @@ class LibraryUpdater:
             if issue_dict.get("updated_at"):
                 modified_at = parse_date(issue_dict["updated_at"])
 
-            # Create or update the Issue object
-            try:
-                issue, created = Issue.objects.update_or_create(
+            issues.append(
+                Issue(
                     library=library,
-                    github_id=issue_dict["id"],
-                    defaults={
-                        "title": issue_dict["title"][:255],
-                        "number": issue_dict["number"],
-                        "is_open": issue_dict["state"] == "open",
-                        "closed": closed_at,
-                        "created": created_at,
-                        "modified": modified_at,
-                        "data": obj2dict(issue_dict),
-                    },
-                )
-                self.logger.debug(
-                    "issue_updated_successfully",
-                    issue_id=issue.id,
-                    created_issue=created,
-                    issue_github_id=issue.github_id,
-                )
-            except Exception as e:
-                self.logger.exception(
-                    "update_issues_error_skipped_issue",
-                    issue_github_id=issue_dict.get("id"),
-                    exc_msg=str(e),
+                    github_id=str(issue_dict["id"]),
+                    title=issue_dict["title"][:255],
+                    number=issue_dict["number"],
+                    is_open=issue_dict["state"] == "open",
+                    closed=closed_at,
+                    created=created_at,
+                    modified=modified_at,
+                    data=obj2dict(issue_dict),
                 )
-                continue
+            )
+
+        self.save_github_items(library, issues)
+        self.logger.info(
+            "updated_repo_issues", library=library.key, since=since, count=len(issues)
+        )
 
     def update_prs(self, library: Library):
-        """Update all PRs for a library"""
+        """Update all PRs for a library
+
+        Only PRs updated since the most recently modified stored PR are requested,
+        so a library without stored PRs gets a full import.
+        """
         self.logger.info("updating_repo_prs")
 
-        prs_data = self.client.get_repo_prs(library.github_repo, state="all")
+        since = library.pull_requests.aggregate(since=Max("modified"))["since"]
+        prs_data = self.client.get_repo_prs(
+            library.github_repo, state="all", since=since
+        )
 
+        pull_requests = []
         for pr_dict in prs_data:
             # Get the date information
             closed_at = None
@@ -436,38 +616,87 @@ class LibraryUpdater:
             if pr_dict.get("updated_at"):
                 modified_at = parse_date(pr_dict["updated_at"])
 
-            try:
-                pull_request, created = PullRequest.objects.update_or_create(
+            pull_requests.append(
+                PullRequest(
                     library=library,
-                    github_id=pr_dict["id"],
-                    defaults={
-                        "title": pr_dict["title"][:255],
-                        "number": pr_dict["number"],
-                        "is_open": pr_dict["state"] == "open",
-                        "closed": closed_at,
-                        "merged": merged_at,
-                        "created": created_at,
-                        "modified": modified_at,
-                        "data": obj2dict(pr_dict),
-                    },
-                )
-                self.logger.info(
-                    "pull_request_updated_successfully",
-                    pr_id=pull_request.id,
-                    created_pr=created,
-                    pr_github_id=pull_request.github_id,
+                    github_id=str(pr_dict["id"]),
+                    title=pr_dict["title"][:255],
+                    number=pr_dict["number"],
+                    is_open=pr_dict["state"] == "open",
+                    closed=closed_at,
+                    merged=merged_at,
+                    created=created_at,
+                    modified=modified_at,
+                    data=obj2dict(pr_dict),
                 )
+            )
+
+        self.save_github_items(library, pull_requests)
+        self.logger.info(
+            "updated_repo_prs",
+            library=library.key,
+            since=since,
+            count=len(pull_requests),
+        )
+
+    def save_github_items(self, library: Library, items: list):
+        """Create or update Issue or PullRequest rows for a library in bulk.
+
+        Rows are matched to stored ones by `github_id`, and written in chunks of
+        GITHUB_ITEMS_CHUNK_SIZE, oldest change first. Saving stops at the first
+        chunk that fails, so the most recent stored change, which the next import
+        starts from, is never newer than an item that wasn't saved.
+        """
+        if not items:
+            return
+        model = type(items[0])
+        fields = [
+            field.name
+            for field in model._meta.concrete_fields
+            if field.name not in ("id", "library", "github_id")
+        ]
+        # The same item can appear on two pages if it's updated while paging
+        items = list({item.github_id: item for item in items}.values())
+        items.sort(key=lambda item: (item.modified is not None, item.modified or 0))
+        for i, chunk in enumerate(batched(items, GITHUB_ITEMS_CHUNK_SIZE)):
+            try:
+                with transaction.atomic():
+                    existing = dict(
+                        model.objects.filter(
+                            library=library,
+                            github_id__in=[item.github_id for item in chunk],
+                        ).values_list("github_id", "pk")
+                    )
+                    to_update = []
+                    to_create = []
+                    for item in chunk:
+                        item.pk = existing.get(item.github_id)
+                        (to_update if item.pk else to_create).append(item)
+                    model.objects.bulk_create(to_create)
+                    model.objects.bulk_update(to_update, fields)
             except Exception as e:
                 self.logger.exception(
-                    "update_prs_error_skipped_pr",
-                    pr_github_id=pr_dict.get("id"),
+                    "save_github_items_error_stopped",
+                    model=model.__name__,
+                    library=library.key,
+                    skipped=len(items) - i * GITHUB_ITEMS_CHUNK_SIZE,
                     exc_msg=str(e),
                 )
+                return
 
     def update_commits(self, library: Library, clean=False, min_version=""):
-        """Import a record of all commits between LibraryVersions."""
-        authors = {}
-        commits = []
+        """Import a record of all commits between LibraryVersions.
+
+        Unless `clean` is set, only commits added since the watermarks recorded by
+        the previous import are walked.
+        """
+        watermarks = {}
+        if not clean:
+            watermarks = {
+                x.ref: RefWatermark(ref=x.ref, base=x.base, sha=x.sha)
+                for x in CommitImportWatermark.objects.filter(library=library)
+            }
+        new_watermarks = []
         library_versions = {
             x.version.name: x
             for x in LibraryVersion.objects.filter(
@@ -477,27 +706,10 @@ class LibraryUpdater:
         library_version_updates = []
 
         def handle_commit(commit: ParsedCommit):
-            author = authors.get(commit.email, None)
-            if not author:
-                if (
-                    commit_author_email := CommitAuthorEmail.objects.filter(
-                        email=commit.email,
-                    )
-                    .select_related("author")
-                    .first()
-                ):
-                    author = commit_author_email.author
-                else:
-                    author = CommitAuthor.objects.create(
-                        name=commit.name, avatar_url=commit.avatar_url
-                    )
-                    CommitAuthorEmail.objects.create(email=commit.email, author=author)
-                authors[commit.email] = author
-
             try:
                 library_version = library_versions[commit.version]
                 return Commit(
-                    author=author,
+                    author=authors[commit.email],
                     library_version=library_version,
                     sha=commit.sha,
                     message=commit.message,
@@ -521,24 +733,33 @@ class LibraryUpdater:
             lv.files_changed = diff.files_changed
             return lv
 
-        commits_handled = 0
-        for item in get_commit_data_for_repo_versions(library.key, min_version):
+        parsed_commits = []
+        for item in get_commit_data_for_repo_versions(
+            library.key, min_version, watermarks=watermarks
+        ):
             match item:
                 case ParsedCommit():
-                    commit_item = handle_commit(item)
-                    if commit_item:
-                        commits.append(commit_item)
-                        commits_handled += 1
+                    parsed_commits.append(item)
                 case VersionDiffStat():
                     lv_update = handle_version_diff_stat(item)
                     if lv_update:
                         library_version_updates.append(lv_update)
+                case RefWatermark():
+                    # Commits for a ref without a LibraryVersion aren't saved, so
+                    # don't mark them as imported.
+                    if item.ref in library_versions:
+                        new_watermarks.append(item)
                 case _:
                     assert_never()
 
+        authors = self.resolve_commit_authors(parsed_commits)
+        commits = [x for x in map(handle_commit, parsed_commits) if x]
+        commits_handled = len(commits)
+
         with transaction.atomic():
             if clean:
                 Commit.objects.filter(library_version__library=library).delete()
+                CommitImportWatermark.objects.filter(library=library).delete()
             Commit.objects.bulk_create(
                 commits,
                 update_conflicts=True,
@@ -549,8 +770,244 @@ class LibraryUpdater:
                 library_version_updates,
                 ["insertions", "deletions", "files_changed"],
             )
+            CommitImportWatermark.objects.bulk_create(
+                [
+                    CommitImportWatermark(
+                        library=library, ref=x.ref, base=x.base, sha=x.sha
+                    )
+                    for x in new_watermarks
+                ],
+                update_conflicts=True,
+                update_fields=["base", "sha", "updated"],
+                unique_fields=["library", "ref"],
+            )
+        self.update_commit_counts(library)
+        self.update_contributor_rankings(
+            library,
+            library_versions=None if clean else {x.library_version for x in commits},
+        )
         return commits_handled
 
+    def update_commit_counts(self, library: Library):
+        """Store the commit and commit author counts of each LibraryVersion.
+
+        An author is new in a version when they have no commits to the library in
+        the previous x.x.0 versions.
+        """
+        library_versions = list(
+            LibraryVersion.objects.filter(library=library).select_related("version")
+        )
+        commit_counts = get_commit_counts_by_author(library)
+        authors = {
+            lv.id: commit_counts[lv.id].keys() - {None} for lv in library_versions
+        }
+
+        minor_versions = [
+            (lv.version.version_array, authors[lv.id])
+            for lv in library_versions
+            if lv.version.version_array and lv.version.patch == 0
+        ]
+        for lv in library_versions:
+            version_parts = lv.version.cleaned_version_parts_int
+            previous_authors = set().union(
+                *(
+                    version_authors
+                    for version_array, version_authors in minor_versions
+                    if version_array < version_parts
+                )
+            )
+            lv.commit_count = commit_counts[lv.id].total()
+            lv.author_count = len(authors[lv.id])
+            lv.new_author_count = len(authors[lv.id] - previous_authors)
+        LibraryVersion.objects.bulk_update(
+            library_versions, ["commit_count", "author_count", "new_author_count"]
+        )
+
+    def update_contributor_rankings(self, library: Library, library_versions=None):
+        """Rebuild the ContributorRankings of the given LibraryVersions of `library`.
+
+        The rankings of the later LibraryVersions, which count the commits of the
+        given ones as previous commits, are rebuilt too. Every ranking of the library
+        is rebuilt when `library_versions` is None or none exist yet.
+        """
+        all_library_versions = list(
+            LibraryVersion.objects.filter(library=library).select_related("version")
+        )
+        commit_counts = get_commit_counts_by_author(library)
+        minor_versions = [
+            (lv.version.version_array, lv.id)
+            for lv in all_library_versions
+            if lv.version.version_array and lv.version.patch == 0
+        ]
+
+        rebuilt = all_library_versions
+        if (
+            library_versions is not None
+            and ContributorRanking.objects.filter(
+                library_version__library=library
+            ).exists()
+        ):
+            changed_ids = {lv.id for lv in library_versions}
+            oldest = min(
+                (parts for parts, lv_id in minor_versions if lv_id in changed_ids),
+                default=None,
+            )
+            rebuilt = [
+                lv
+                for lv in all_library_versions
+                if lv.id in changed_ids
+                or (oldest and oldest < lv.version.cleaned_version_parts_int)
+            ]
+        if not rebuilt:
+            return 0
+
+        rankings = []
+        for lv in rebuilt:
+            version_parts = lv.version.cleaned_version_parts_int
+            counts = commit_counts[lv.id]
+            previous_counts = Counter()
+            for parts, lv_id in minor_versions:
+                if parts < version_parts:
+                    previous_counts.update(commit_counts[lv_id])
+            for author_id in (counts.keys() | previous_counts.keys()) - {None}:
+                rankings.append(
+                    ContributorRanking(
+                        library_version=lv,
+                        author_id=author_id,
+                        commit_count=counts[author_id],
+                        previous_commit_count=previous_counts[author_id],
+                        is_new=not previous_counts[author_id],
+                    )
+                )
+        with transaction.atomic():
+            ContributorRanking.objects.filter(library_version__in=rebuilt).delete()
+            ContributorRanking.objects.bulk_create(rankings, batch_size=1000)
+        return len(rankings)
+
+    def update_version_commit_authors(self, min_version="", version_ids=None):
+        """Store the number of commits of each author in each version.
+
+        The counts of versions older than `min_version`, or not in `version_ids`
+        when given, are left as they are.
+        """
+        versions = Version.objects.filter(name__gte=min_version)
+        if version_ids is not None:
+            versions = versions.filter(pk__in=version_ids)
+        counts = (
+            Commit.objects.filter(
+                library_version__version__in=versions, author__isnull=False
+            )
+            .values("library_version__version", "author")
+            .annotate(count=Count("id"))
+            .values_list("library_version__version", "author", "count")
+        )
+        with transaction.atomic():
+            VersionCommitAuthor.objects.filter(version__in=versions).delete()
+            VersionCommitAuthor.objects.bulk_create(
+                [
+                    VersionCommitAuthor(
+                        version_id=version_id, author_id=author_id, commit_count=count
+                    )
+                    for version_id, author_id, count in counts
+                ],
+                batch_size=1000,
+            )
+
+    def resolve_commit_authors(
+        self, parsed_commits: list[ParsedCommit]
+    ) -> dict[str, CommitAuthor]:
+        """Return a mapping of email to CommitAuthor for the given commits.
+
+        Existing authors are looked up in chunks, and a CommitAuthor and
+        CommitAuthorEmail are bulk created for each new email, named after the
+        first commit seen from it.
+        """
+        first_commits = {}
+        for commit in parsed_commits:
+            first_commits.setdefault(commit.email, commit)
+
+        authors = get_commit_authors_by_email(first_commits)
+        new_emails = [email for email in first_commits if email not in authors]
+        if not new_emails:
+            return authors
+
+        with transaction.atomic():
+            new_authors = CommitAuthor.objects.bulk_create(
+                [
+                    CommitAuthor(
+                        name=first_commits[email].name,
+                        avatar_url=first_commits[email].avatar_url,
+                    )
+                    for email in new_emails
+                ]
+            )
+            CommitAuthorEmail.objects.bulk_create(
+                [
+                    CommitAuthorEmail(email=email, author=author)
+                    for email, author in zip(new_emails, new_authors)
+                ],
+                ignore_conflicts=True,
+            )
+        # Another import may have created some of these emails concurrently, in
+        # which case its author wins and ours is removed.
+        authors.update(get_commit_authors_by_email(new_emails))
+        resolved_ids = {author.pk for author in authors.values()}
+        CommitAuthor.objects.filter(
+            pk__in=[x.pk for x in new_authors if x.pk not in resolved_ids]
+        ).delete()
+        return authors
+
+    def update_commits_for_libraries(
+        self, libraries, clean=False, min_version="", workers=1
+    ) -> list[CommitImportResult]:
+        """Import commits for several libraries, up to `workers` at a time.
+
+        Each library is imported in its own transaction, and a failure in one library
+        doesn't stop the others. Returns a result per library, in the order given,
+        with the commit count, the time taken and the error if the import failed.
+        """
+
+        def import_library(library: Library) -> CommitImportResult:
+            start = time.monotonic()
+            try:
+                commits = self.update_commits(
+                    library, clean=clean, min_version=min_version
+                )
+                return CommitImportResult(
+                    key=library.key,
+                    commits=commits or 0,
+                    seconds=time.monotonic() - start,
+                )
+            except Exception as e:
+                self.logger.exception("update_commits_failed", library=library.key)
+                return CommitImportResult(
+                    key=library.key, seconds=time.monotonic() - start, error=str(e)
+                )
+
+        def import_library_in_thread(library: Library) -> CommitImportResult:
+            try:
+                return import_library(library)
+            finally:
+                # Django opens a connection per thread; don't leave them open.
+                connections.close_all()
+
+        if workers <= 1:
+            results = [import_library(library) for library in libraries]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(import_library_in_thread, libraries))
+
+        for result in results:
+            self.logger.info(
+                "update_commits_library_finished",
+                library=result.key,
+                commits=result.commits,
+                seconds=round(result.seconds, 2),
+                error=result.error,
+            )
+        self.update_version_commit_authors(min_version=min_version)
+        return results
+
     def update_commit_author_github_data(self, obj=None, email=None, overwrite=False):
         """Update CommitAuthor data by parsing data on their most recent commit."""
         if email:
@@ -637,15 +1094,42 @@ class LibraryUpdater:
         content = self.fetch_most_recent_boost_dep_artifact_content(owner=owner)
         if not content:
             return
+        version_ids = set()
         for library_version, dependencies in parse_boostdep_artifact(content):
             if clean:
                 library_version.dependencies.set(dependencies, clear=True)
             else:
                 library_version.dependencies.add(*dependencies)
+            version_ids.add(library_version.version_id)
             saved_library_versions += 1
             saved_dependencies += len(dependencies)
+        saved_diffs = self.update_dependency_diffs(version_ids)
         logger.info(
             "update_library_version_dependencies finished",
             saved_dependencies=saved_dependencies,
             saved_library_versions=saved_library_versions,
+            saved_diffs=saved_diffs,
+        )
+
+    def update_dependency_diffs(self, version_ids):
+        """Recompute the stored dependency diffs affected by new dependencies.
+
+        A version is diffed against the previous x.x.0 version, so the diffs of
+        every x.x.0 version newer than the oldest updated version are recomputed
+        too.
+        """
+        versions = {v.id: v for v in Version.objects.filter(id__in=version_ids)}
+        oldest = min(
+            (
+                v.cleaned_version_parts_int
+                for v in versions.values()
+                if v.cleaned_version_parts_int
+            ),
+            default=None,
         )
+        if oldest:
+            for version in Version.objects.minor_versions().filter(
+                version_array__gt=oldest
+            ):
+                versions.setdefault(version.id, version)
+        return sum(version.update_dependency_diffs() for version in versions.values())
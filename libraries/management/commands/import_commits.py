@@ -1,4 +1,6 @@
 import djclick as click
+from django.conf import settings
+
 from libraries.github import LibraryUpdater
 from libraries.models import Library
 
@@ -6,16 +8,32 @@ from libraries.models import Library
 @click.command()
 @click.option("--key", is_flag=False, help="Library Key", default=None)
 @click.option("--clean", is_flag=True, help="Library Key", default=False)
-def command(key, clean):
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of libraries to import at once. Defaults to COMMIT_IMPORT_WORKERS.",
+)
+def command(key, clean, workers):
     updater = LibraryUpdater()
     click.secho("Importing individual library commits...", fg="green")
     if key is None:
-        for library in Library.objects.all():
-            click.secho(f"Importing commits for {library}")
-            updater.update_commits(library, clean=clean)
+        results = updater.update_commits_for_libraries(
+            Library.objects.all(),
+            clean=clean,
+            workers=workers or settings.COMMIT_IMPORT_WORKERS,
+        )
+        for result in results:
+            if result.error:
+                click.secho(f"{result.key}: failed ({result.error})", fg="red")
+            else:
+                click.secho(
+                    f"{result.key}: {result.commits} commits in {result.seconds:.1f}s"
+                )
         updater.update_commit_author_github_data()
     else:
         library = Library.objects.get(key=key)
         updater.update_commits(library, clean=clean)
+        updater.update_version_commit_authors()
         updater.update_commit_author_github_data(obj=library)
     click.secho("Finished importing individual library commits.", fg="green")
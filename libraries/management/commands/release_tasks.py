@@ -15,7 +15,8 @@ from slack_sdk.errors import SlackApiError
 
 from core.githubhelper import GithubAPIClient
 from libraries.forms import CreateReportForm
-from libraries.tasks import update_commits
+from libraries.github import LibraryUpdater
+from libraries.models import Library
 from reports.models import WebsiteStatReport
 from slack.management.commands.fetch_slack_activity import get_my_channels, locked
 from versions.models import Version
@@ -108,7 +109,26 @@ class ReleaseTasksManager:
         call_command("import_library_versions", min_release=latest_version_number)
 
     def handle_commits(self):
-        self.handled_commits = update_commits(min_version=self.latest_version.name)
+        results = LibraryUpdater().update_commits_for_libraries(
+            Library.objects.all(),
+            min_version=self.latest_version.name,
+            workers=settings.COMMIT_IMPORT_WORKERS,
+        )
+        self.handled_commits = {result.key: result.commits for result in results}
+        slowest = sorted(results, key=lambda result: result.seconds, reverse=True)
+        self.progress_messages.append(
+            progress_message(
+                "Slowest commit imports: "
+                + ", ".join(f"{r.key} ({r.seconds:.1f}s)" for r in slowest[:5])
+            )
+        )
+        for result in results:
+            if result.error:
+                self.progress_messages.append(
+                    progress_message(
+                        f"Importing commits for {result.key} failed: {result.error}"
+                    )
+                )
 
     def update_website_statistics(self):
         report, _ = WebsiteStatReport.objects.get_or_create(version=self.latest_version)
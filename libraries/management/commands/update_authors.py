@@ -28,4 +28,6 @@ def command(library_name):
 
         updater.update_authors(library, authors=library.data.get("authors", []))
 
+    # Author names are part of the library search vectors
+    libraries.update_search_vectors()
     click.secho("Finished adding library authors.", fg="green")
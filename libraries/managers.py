@@ -1,7 +1,13 @@
+import re
 from datetime import date
 
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.db import models
-from django.db.models import Q, Count
+from django.db.models import Q, Count, F, Value
+
+# No stemming, so that partial words typed in the search box match as prefixes
+SEARCH_CONFIG = "simple"
 
 
 class IssueQuerySet(models.QuerySet):
@@ -67,3 +73,76 @@ class IssueManager(models.Manager):
                 ),
             ),
         )
+
+
+class LibraryQuerySet(models.QuerySet):
+    def search(self, value):
+        """Return the libraries matching every word of `value`, best matches first.
+
+        Each word matches the words of the library's search vector that start with
+        it, so that partial words typed in the search box match.
+        """
+        words = re.findall(r"\w+", value or "")
+        if not words:
+            return self.none()
+        query = SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            config=SEARCH_CONFIG,
+            search_type="raw",
+        )
+        return (
+            self.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "name")
+        )
+
+    def with_search_names(self):
+        """Annotate the space separated names of the categories and authors."""
+        return self.annotate(
+            category_names=StringAgg(
+                "categories__name", " ", distinct=True, default=""
+            ),
+            author_names=StringAgg(
+                "authors__display_name", " ", distinct=True, default=""
+            ),
+        )
+
+    def update_search_vectors(self):
+        """Store the search vector of each library.
+
+        The name weighs most, then the category names, then the author names and
+        finally the description.
+        """
+        libraries = list(self.with_search_names().only("id", "name", "description"))
+        for library in libraries:
+            library.search_vector = (
+                SearchVector(Value(library.name), weight="A", config=SEARCH_CONFIG)
+                + SearchVector(
+                    Value(library.category_names), weight="B", config=SEARCH_CONFIG
+                )
+                + SearchVector(
+                    Value(library.author_names), weight="C", config=SEARCH_CONFIG
+                )
+                + SearchVector(
+                    Value(library.description or ""), weight="D", config=SEARCH_CONFIG
+                )
+            )
+        self.model.objects.bulk_update(libraries, ["search_vector"], batch_size=100)
+        return len(libraries)
+
+
+class LibraryManager(models.Manager):
+    # Lets the migration that adds the search vectors fill them
+    use_in_migrations = True
+
+    def get_queryset(self):
+        return LibraryQuerySet(self.model, using=self._db)
+
+    def search(self, value):
+        return self.get_queryset().search(value)
+
+    def with_search_names(self):
+        return self.get_queryset().with_search_names()
+
+    def update_search_vectors(self):
+        return self.get_queryset().update_search_vectors()
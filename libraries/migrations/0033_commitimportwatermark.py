@@ -0,0 +1,47 @@
+# Generated by Django 4.2.24 on 2026-10-18 23:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("libraries", "0032_merge_20250905_1825"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CommitImportWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ref", models.CharField(max_length=256)),
+                ("base", models.CharField(blank=True, default="", max_length=256)),
+                ("sha", models.CharField(max_length=40)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="commit_import_watermarks",
+                        to="libraries.library",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="commitimportwatermark",
+            constraint=models.UniqueConstraint(
+                fields=("library", "ref"),
+                name="libraries_commitimportwatermark_library_ref_unique",
+            ),
+        ),
+    ]
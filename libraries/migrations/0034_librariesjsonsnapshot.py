@@ -0,0 +1,38 @@
+# Generated by Django 4.2.24 on 2026-10-18 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("libraries", "0033_commitimportwatermark"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LibrariesJsonSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("repo_slug", models.CharField(max_length=100)),
+                ("sha", models.CharField(max_length=40)),
+                ("data", models.JSONField(blank=True, null=True)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="librariesjsonsnapshot",
+            constraint=models.UniqueConstraint(
+                fields=("repo_slug", "sha"),
+                name="libraries_librariesjsonsnapshot_repo_slug_sha_unique",
+            ),
+        ),
+    ]
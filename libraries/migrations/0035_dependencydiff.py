@@ -0,0 +1,71 @@
+# Generated by Django 4.2.24 on 2026-10-19 00:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("versions", "0024_alter_versionfile_checksum_and_more"),
+        ("libraries", "0034_librariesjsonsnapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DependencyDiff",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "change",
+                    models.CharField(
+                        choices=[
+                            ("added", "Added"),
+                            ("removed", "Removed"),
+                            ("unchanged", "Unchanged"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "dependency",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="libraries.library",
+                    ),
+                ),
+                (
+                    "library",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependency_diffs",
+                        to="libraries.library",
+                    ),
+                ),
+                (
+                    "version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependency_diffs",
+                        to="versions.version",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="dependencydiff",
+            constraint=models.UniqueConstraint(
+                fields=("version", "library", "dependency"),
+                name="libraries_dependencydiff_version_library_dependency_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,153 @@
+# Generated by Django 4.2.24 on 2026-10-19 00:16
+
+import re
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def version_parts(name):
+    """Version.cleaned_version_parts_int"""
+    cleaned = re.sub(r"^[^0-9]*", "", name or "").split("beta")[0]
+    return [int(x) if x.isdigit() else 0 for x in cleaned.split(".") if x]
+
+
+def backfill_commit_counts(apps, schema_editor):
+    """Fill in what LibraryUpdater.update_commit_counts() and
+    update_version_commit_authors() keep up to date on each commit import."""
+    Commit = apps.get_model("libraries", "Commit")
+    LibraryVersion = apps.get_model("libraries", "LibraryVersion")
+    VersionCommitAuthor = apps.get_model("libraries", "VersionCommitAuthor")
+
+    commit_counts = defaultdict(Counter)
+    for library_version_id, author_id, count in (
+        Commit.objects.values("library_version", "author")
+        .annotate(count=Count("id"))
+        .values_list("library_version", "author", "count")
+    ):
+        commit_counts[library_version_id][author_id] = count
+
+    library_versions_by_library = defaultdict(list)
+    for lv in LibraryVersion.objects.select_related("version"):
+        library_versions_by_library[lv.library_id].append(lv)
+    for library_versions in library_versions_by_library.values():
+        authors = {
+            lv.id: commit_counts[lv.id].keys() - {None} for lv in library_versions
+        }
+        minor_versions = [
+            (lv.version.version_array, authors[lv.id])
+            for lv in library_versions
+            if lv.version.version_array and lv.version.patch == 0
+        ]
+        for lv in library_versions:
+            parts = version_parts(lv.version.name)
+            previous_authors = set().union(
+                *(
+                    version_authors
+                    for version_array, version_authors in minor_versions
+                    if version_array < parts
+                )
+            )
+            lv.commit_count = commit_counts[lv.id].total()
+            lv.author_count = len(authors[lv.id])
+            lv.new_author_count = len(authors[lv.id] - previous_authors)
+        LibraryVersion.objects.bulk_update(
+            library_versions,
+            ["commit_count", "author_count", "new_author_count"],
+            batch_size=1000,
+        )
+
+    VersionCommitAuthor.objects.bulk_create(
+        [
+            VersionCommitAuthor(
+                version_id=version_id, author_id=author_id, commit_count=count
+            )
+            for version_id, author_id, count in (
+                Commit.objects.filter(author__isnull=False)
+                .values("library_version__version", "author")
+                .annotate(count=Count("id"))
+                .values_list("library_version__version", "author", "count")
+            )
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("versions", "0026_populate_version_array"),
+        ("libraries", "0035_dependencydiff"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="libraryversion",
+            name="author_count",
+            field=models.IntegerField(
+                default=0, help_text="Number of distinct commit authors."
+            ),
+        ),
+        migrations.AddField(
+            model_name="libraryversion",
+            name="commit_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="libraryversion",
+            name="new_author_count",
+            field=models.IntegerField(
+                default=0,
+                help_text="Number of commit authors without commits to the library in previous x.x.0 versions.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="VersionCommitAuthor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("commit_count", models.IntegerField(default=0)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="version_commit_authors",
+                        to="libraries.commitauthor",
+                    ),
+                ),
+                (
+                    "version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="commit_authors",
+                        to="versions.version",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["version", "-commit_count"],
+                        name="libraries_v_version_b0d07f_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="versioncommitauthor",
+            constraint=models.UniqueConstraint(
+                fields=("version", "author"),
+                name="libraries_versioncommitauthor_version_author_unique",
+            ),
+        ),
+        migrations.RunPython(backfill_commit_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 4.2.24 on 2026-10-19 00:20
+
+import re
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def version_parts(name):
+    """Version.cleaned_version_parts_int"""
+    cleaned = re.sub(r"^[^0-9]*", "", name or "").split("beta")[0]
+    return [int(x) if x.isdigit() else 0 for x in cleaned.split(".") if x]
+
+
+def backfill_contributor_rankings(apps, schema_editor):
+    """Fill in what LibraryUpdater.update_contributor_rankings() keeps up to date on
+    each commit import."""
+    Commit = apps.get_model("libraries", "Commit")
+    ContributorRanking = apps.get_model("libraries", "ContributorRanking")
+    LibraryVersion = apps.get_model("libraries", "LibraryVersion")
+
+    commit_counts = defaultdict(Counter)
+    for library_version_id, author_id, count in (
+        Commit.objects.filter(author__isnull=False)
+        .values("library_version", "author")
+        .annotate(count=Count("id"))
+        .values_list("library_version", "author", "count")
+    ):
+        commit_counts[library_version_id][author_id] = count
+
+    library_versions_by_library = defaultdict(list)
+    for lv in LibraryVersion.objects.select_related("version"):
+        library_versions_by_library[lv.library_id].append(lv)
+    for library_versions in library_versions_by_library.values():
+        minor_versions = [
+            (lv.version.version_array, lv.id)
+            for lv in library_versions
+            if lv.version.version_array and lv.version.patch == 0
+        ]
+        rankings = []
+        for lv in library_versions:
+            parts = version_parts(lv.version.name)
+            counts = commit_counts[lv.id]
+            previous_counts = Counter()
+            for version_array, lv_id in minor_versions:
+                if version_array < parts:
+                    previous_counts.update(commit_counts[lv_id])
+            for author_id in counts.keys() | previous_counts.keys():
+                rankings.append(
+                    ContributorRanking(
+                        library_version=lv,
+                        author_id=author_id,
+                        commit_count=counts[author_id],
+                        previous_commit_count=previous_counts[author_id],
+                        is_new=not previous_counts[author_id],
+                    )
+                )
+        ContributorRanking.objects.bulk_create(rankings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("libraries", "0036_commit_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContributorRanking",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("commit_count", models.IntegerField(default=0)),
+                ("previous_commit_count", models.IntegerField(default=0)),
+                ("is_new", models.BooleanField(default=False)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contributor_rankings",
+                        to="libraries.commitauthor",
+                    ),
+                ),
+                (
+                    "library_version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contributor_rankings",
+                        to="libraries.libraryversion",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["library_version", "-commit_count"],
+                        name="libraries_c_library_e64ade_idx",
+                    ),
+                    models.Index(
+                        fields=["library_version", "-previous_commit_count"],
+                        name="libraries_c_library_0ad19e_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="contributorranking",
+            constraint=models.UniqueConstraint(
+                fields=("library_version", "author"),
+                name="libraries_contributorranking_library_version_author_unique",
+            ),
+        ),
+        migrations.RunPython(backfill_contributor_rankings, migrations.RunPython.noop),
+    ]
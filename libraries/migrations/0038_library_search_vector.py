@@ -0,0 +1,43 @@
+# Generated by Django 4.2.24 on 2026-10-19 00:29
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+import libraries.managers
+
+
+def update_search_vectors(apps, schema_editor):
+    Library = apps.get_model("libraries", "Library")
+    Library.objects.update_search_vectors()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("libraries", "0037_contributorranking"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="library",
+            managers=[
+                ("objects", libraries.managers.LibraryManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="library",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Refreshed by Library.objects.update_search_vectors().",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="library",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="libraries_l_search__551d38_gin"
+            ),
+        ),
+        migrations.RunPython(update_search_vectors, migrations.RunPython.noop),
+    ]
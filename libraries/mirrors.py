@@ -0,0 +1,136 @@
+import fcntl
+import os
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import structlog
+from django.conf import settings
+
+logger = structlog.get_logger()
+
+# Only branches and tags are mirrored; GitHub's refs/pull/* would bloat the mirrors.
+MIRROR_REFSPECS = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+
+
+def get_mirror_root() -> Path:
+    """Return the directory holding the bare repository mirrors, creating it."""
+    root = Path(settings.GIT_MIRROR_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def get_directory_size(path: Path) -> int:
+    """Return the total size in bytes of the files under `path`."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except FileNotFoundError:
+                continue
+    return total
+
+
+@contextmanager
+def mirror_lock(name: str, blocking=True):
+    """Hold an exclusive file lock for the mirror `name`.
+
+    Yields True if the lock was acquired. With `blocking=False`, yields False
+    instead of waiting when another process holds the lock.
+    """
+    lock_path = get_mirror_root() / f"{name}.lock"
+    with open(lock_path, "w") as lock_file:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(lock_file, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def run_git_with_retry(args: list[str], retries=5) -> bool:
+    """Run a git command, retrying with exponential backoff. Returns success."""
+    for retry_count in range(1, retries + 1):
+        completed = subprocess.run(["git", *args], capture_output=True)
+        if completed.returncode == 0:
+            return True
+        logger.warning(
+            f"{completed.args} failed. Retrying. Retry {retry_count}.",
+            error=completed.stderr.decode(errors="replace"),
+        )
+        if retry_count < retries:
+            time.sleep(2**retry_count)
+    return False
+
+
+def clone_mirror(url: str, git_dir: Path) -> bool:
+    """Create a bare mirror of `url` at `git_dir`."""
+    if not run_git_with_retry(["clone", "--bare", url, str(git_dir)]):
+        shutil.rmtree(git_dir, ignore_errors=True)
+        return False
+    return True
+
+
+def fetch_mirror(git_dir: Path) -> bool:
+    """Bring an existing mirror up to date, pruning deleted branches and tags."""
+    return run_git_with_retry(
+        ["--git-dir", str(git_dir), "fetch", "--prune", "origin", *MIRROR_REFSPECS]
+    )
+
+
+def prune_mirrors(keep: str = None):
+    """Delete least recently used mirrors until the total size is under the cap.
+
+    Mirrors that are locked by another worker, and the mirror named `keep`, are
+    never removed.
+    """
+    max_size = settings.GIT_MIRROR_MAX_SIZE_MB * 1024 * 1024
+    root = get_mirror_root()
+    mirrors = [(path, get_directory_size(path)) for path in root.glob("*.git")]
+    total_size = sum(size for _, size in mirrors)
+    if total_size <= max_size:
+        return
+
+    mirrors.sort(key=lambda item: item[0].stat().st_mtime)
+    for path, size in mirrors:
+        if total_size <= max_size:
+            break
+        name = path.name.removesuffix(".git")
+        if name == keep:
+            continue
+        with mirror_lock(name, blocking=False) as acquired:
+            if not acquired:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+        total_size -= size
+        logger.info("git_mirror_pruned", mirror=name, size=size)
+
+
+@contextmanager
+def git_mirror(url: str, name: str):
+    """Yield the path to an up to date bare mirror of `url`, or None on failure.
+
+    Mirrors persist in `settings.GIT_MIRROR_DIR` between runs, so only new objects
+    are downloaded. The mirror is locked while in use so concurrent workers don't
+    fetch into, or prune, a repository that is being read.
+    """
+    git_dir = get_mirror_root() / f"{name}.git"
+    with mirror_lock(name):
+        if git_dir.exists() and not fetch_mirror(git_dir):
+            logger.warning("git_mirror_fetch_failed_recloning", mirror=name)
+            shutil.rmtree(git_dir, ignore_errors=True)
+        if not git_dir.exists() and not clone_mirror(url, git_dir):
+            logger.error(f"Clone failed for {name}.", url=url)
+            yield None
+            return
+        # The directory mtime is used to find the least recently used mirrors.
+        os.utime(git_dir)
+        yield git_dir
+    prune_mirrors(keep=name)
@@ -1,7 +1,7 @@
 import structlog
 from types import SimpleNamespace
 
-from django.db.models import Count, Exists, OuterRef
+from django.db.models import Count, F
 from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
@@ -11,13 +11,14 @@ from libraries.constants import (
     MASTER_RELEASE_URL_PATH_STR,
     DEVELOP_RELEASE_URL_PATH_STR,
 )
+from libraries.cache import get_featured_library_version
 from libraries.models import (
-    Commit,
     CommitAuthor,
     CommitAuthorEmail,
     Library,
     LibraryVersion,
 )
+from versions.cache import get_current_release, get_dropdown_versions
 from versions.models import Version
 
 logger = structlog.get_logger()
@@ -49,7 +50,7 @@ class BoostVersionMixin:
         if not self.extra_context:
             self.extra_context = {}
         if not self.extra_context.get("current_version"):
-            self.extra_context["current_version"] = Version.objects.most_recent()
+            self.extra_context["current_version"] = get_current_release(request)
         self.extra_context.update(
             {
                 "version_str": self.kwargs.get("version_slug"),
@@ -75,9 +76,7 @@ class BoostVersionMixin:
             version_path_kwargs["flag_versions_without_library"] = get_object_or_404(
                 Library, slug=self.kwargs.get("library_slug")
             )
-        self.extra_context["versions"] = Version.objects.get_dropdown_versions(
-            **version_path_kwargs
-        )
+        self.extra_context["versions"] = get_dropdown_versions(**version_path_kwargs)
         # here we hack extra_context into the request so we can access for cookie checks
         request.extra_context = self.extra_context
 
@@ -91,7 +90,7 @@ class ContributorMixin:
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["latest_version"] = Version.objects.most_recent()
+        context["latest_version"] = get_current_release(self.request)
 
         if hasattr(self, "object") and isinstance(self.object, Library):
             library = self.object
@@ -143,24 +142,7 @@ class ContributorMixin:
 
     def get_featured_library(self):
         """Returns latest LibraryVersion associated with the featured Library"""
-        # If multiple are featured, pick one at random
-        latest_version = Version.objects.most_recent()
-        library = Library.objects.filter(featured=True).order_by("?").first()
-
-        # If we don't have a featured library, return a random library
-        if not library:
-            library = (
-                Library.objects.filter(library_version__version=latest_version)
-                .order_by("?")
-                .first()
-            )
-        if not library:
-            return None
-        libversion = LibraryVersion.objects.filter(
-            library_id=library.id, version=latest_version
-        ).first()
-
-        return libversion
+        return get_featured_library_version(get_current_release(self.request))
 
     def get_related(self, library_version, relation="maintainers", exclude_ids=None):
         """Get the maintainers|authors for the current LibraryVersion.
@@ -173,9 +155,8 @@ class ContributorMixin:
             qs = library_version.authors.all()
         else:
             raise ValueError("relation must be maintainers or authors.")
-        if exclude_ids:
-            qs = qs.exclude(id__in=exclude_ids)
-        qs = list(qs)
+        # Filtered in Python so authors and maintainers can be prefetched
+        qs = [x for x in qs if x.id not in (exclude_ids or [])]
         commit_authors = {
             author_email.email: author_email
             for author_email in CommitAuthorEmail.objects.annotate(
@@ -197,9 +178,7 @@ class ContributorMixin:
 
     def get_author_tag(self, library_version):
         """Format the authors for the author meta tag in the template."""
-        author_names = list(
-            library_version.library.authors.values_list("display_name", flat=True)
-        )
+        author_names = [x.display_name for x in library_version.library.authors.all()]
         if len(author_names) > 1:
             final_output = ", ".join(author_names[:-1]) + " and " + author_names[-1]
         else:
@@ -209,40 +188,28 @@ class ContributorMixin:
 
     def get_top_contributors(self, library_version=None, exclude=None):
         if library_version:
-            prev_versions = Version.objects.minor_versions().filter(
-                version_array__lt=library_version.version.cleaned_version_parts_int
-            )
             qs = CommitAuthor.objects.filter(
-                commit__library_version=library_version
+                contributor_rankings__library_version=library_version,
+                contributor_rankings__commit_count__gt=0,
             ).annotate(
-                is_new=~Exists(
-                    Commit.objects.filter(
-                        author_id=OuterRef("id"),
-                        library_version__in=LibraryVersion.objects.filter(
-                            version__in=prev_versions, library=library_version.library
-                        ),
-                    )
-                )
+                count=F("contributor_rankings__commit_count"),
+                is_new=F("contributor_rankings__is_new"),
             )
         else:
             qs = CommitAuthor.objects.filter(
                 commit__library_version__library=self.object
-            )
+            ).annotate(count=Count("commit"))
         if exclude:
             qs = qs.exclude(id__in=exclude)
-        qs = qs.annotate(count=Count("commit")).order_by("-count")
-        return qs
+        return qs.order_by("-count")
 
     def get_previous_contributors(self, library_version, exclude=None):
-        library_versions = LibraryVersion.objects.filter(
-            library=library_version.library,
-            version__in=Version.objects.minor_versions().filter(
-                version_array__lt=library_version.version.cleaned_version_parts_int
-            ),
-        )
         qs = (
-            CommitAuthor.objects.filter(commit__library_version__in=library_versions)
-            .annotate(count=Count("commit"))
+            CommitAuthor.objects.filter(
+                contributor_rankings__library_version=library_version,
+                contributor_rankings__previous_commit_count__gt=0,
+            )
+            .annotate(count=F("contributor_rankings__previous_commit_count"))
             .order_by("-count")
         )
         if exclude:
@@ -4,6 +4,8 @@ from datetime import timedelta
 from typing import Self
 from urllib.parse import urlparse
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.cache import caches
 from django.db import models, transaction
 from django.db.models import Sum
@@ -15,15 +17,15 @@ from django.db.models.functions import Upper
 
 from config import settings
 from core.custom_model_fields import NullableFileField
-from core.markdown import process_md
+from core.markdown import render_markdown
 from core.models import RenderedContent
 from core.asciidoc import convert_adoc_to_html
 from core.validators import image_validator, max_file_size_validator
-from libraries.managers import IssueManager
+from libraries.managers import IssueManager, LibraryManager
 from mailing_list.models import EmailData
 from .constants import LIBRARY_GITHUB_URL_OVERRIDES
 
-from .utils import generate_random_string, write_content_to_tempfile
+from .utils import generate_random_string
 
 
 class Category(models.Model):
@@ -74,10 +76,18 @@ class CommitAuthor(models.Model):
     def merge_author(self, other: Self):
         """Update references to `other` to point to `self`.
 
-        Deletes `other` after updating references.
+        Deletes `other` after updating references, and refreshes the commit counts
+        and contributor rankings of the libraries and versions its commits are in.
         """
+        from libraries.github import LibraryUpdater
+
         if self.pk == other.pk:
             return
+        affected = list(
+            other.commit_set.values_list(
+                "library_version__library", "library_version__version"
+            ).distinct()
+        )
         other.commitauthoremail_set.update(author=self)
         other.commit_set.update(author=self)
         self.merge_author_email_data(other)
@@ -88,6 +98,14 @@ class CommitAuthor(models.Model):
         self.save(update_fields=["avatar_url", "github_profile_url", "user_id"])
         other.delete()
 
+        if affected:
+            library_ids, version_ids = zip(*affected)
+            updater = LibraryUpdater()
+            for library in Library.objects.filter(pk__in=library_ids):
+                updater.update_commit_counts(library)
+                updater.update_contributor_rankings(library)
+            updater.update_version_commit_authors(version_ids=version_ids)
+
     @transaction.atomic
     def merge_author_email_data(self, other: Self):
         """Merge EmailData for the 2 authors.
@@ -166,6 +184,124 @@ class Commit(models.Model):
         return self.sha
 
 
+class VersionCommitAuthor(models.Model):
+    """The number of commits of an author in a version, across all libraries.
+
+    Refreshed by LibraryUpdater.update_version_commit_authors().
+    """
+
+    version = models.ForeignKey(
+        "versions.Version",
+        related_name="commit_authors",
+        on_delete=models.CASCADE,
+    )
+    author = models.ForeignKey(
+        CommitAuthor, related_name="version_commit_authors", on_delete=models.CASCADE
+    )
+    commit_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["version", "author"],
+                name="%(app_label)s_%(class)s_version_author_unique",
+            )
+        ]
+        indexes = [models.Index(fields=["version", "-commit_count"])]
+
+    def __str__(self):
+        return f"{self.author} ({self.version}): {self.commit_count}"
+
+
+class ContributorRanking(models.Model):
+    """The commits of an author to a LibraryVersion and to its previous versions.
+
+    `previous_commit_count` counts the commits to the library in the previous x.x.0
+    versions, and `is_new` is set when there are none. Refreshed by
+    LibraryUpdater.update_contributor_rankings().
+    """
+
+    library_version = models.ForeignKey(
+        "libraries.LibraryVersion",
+        related_name="contributor_rankings",
+        on_delete=models.CASCADE,
+    )
+    author = models.ForeignKey(
+        CommitAuthor, related_name="contributor_rankings", on_delete=models.CASCADE
+    )
+    commit_count = models.IntegerField(default=0)
+    previous_commit_count = models.IntegerField(default=0)
+    is_new = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["library_version", "author"],
+                name="%(app_label)s_%(class)s_library_version_author_unique",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["library_version", "-commit_count"]),
+            models.Index(fields=["library_version", "-previous_commit_count"]),
+        ]
+
+    def __str__(self):
+        return f"{self.author} ({self.library_version}): {self.commit_count}"
+
+
+class CommitImportWatermark(models.Model):
+    """The last commit imported for a library at a given ref.
+
+    `ref` is a version tag or a branch (master, develop), and `base` the ref the
+    commits were walked from. Later imports skip ranges whose head hasn't moved and
+    only walk the commits added to a branch since `sha`.
+    """
+
+    library = models.ForeignKey(
+        "Library", related_name="commit_import_watermarks", on_delete=models.CASCADE
+    )
+    ref = models.CharField(max_length=256)
+    base = models.CharField(max_length=256, blank=True, default="")
+    sha = models.CharField(max_length=40)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["library", "ref"],
+                name="%(app_label)s_%(class)s_library_ref_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.library_id} {self.ref}: {self.sha}"
+
+
+class LibrariesJsonSnapshot(models.Model):
+    """The `meta/libraries.json` file of a library repo at a given commit.
+
+    Boost versions often point at the same commit of slow-moving libraries, so the
+    version import fetches each (repo, commit) pair once and reuses it. `data` is
+    null when the repo has no libraries.json file at that commit.
+    """
+
+    repo_slug = models.CharField(max_length=100)
+    sha = models.CharField(max_length=40)
+    data = models.JSONField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["repo_slug", "sha"],
+                name="%(app_label)s_%(class)s_repo_slug_sha_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.repo_slug}@{self.sha}"
+
+
 class Library(models.Model):
     """
     Model to represent component Libraries of Boost
@@ -233,12 +369,20 @@ class Library(models.Model):
     data = models.JSONField(
         default=dict, help_text="Contains the libraries.json for this library"
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Refreshed by Library.objects.update_search_vectors().",
+    )
+
+    objects = LibraryManager()
 
     class Meta:
         verbose_name_plural = "Libraries"
         constraints = [
             models.UniqueConstraint(Upper("slug"), name="slug_unique_case_insensitive")
         ]
+        indexes = [GinIndex(fields=["search_vector"])]
 
     @cached_property
     def display_name(self):
@@ -311,6 +455,26 @@ class Library(models.Model):
             self.slug = slug
         return super().save(*args, **kwargs)
 
+    def get_description_cache_key(self, tag):
+        return f"library_description_{self.github_repo}_{tag}"
+
+    def get_cached_description(self, tag="develop"):
+        """Get the description rendered by get_description() from the static
+        content cache or the database, without fetching it from GitHub."""
+        # Try to get the content from the cache first
+        cache_key = self.get_description_cache_key(tag)
+        cached_result = caches["static_content"].get(cache_key)
+        if cached_result:
+            return cached_result
+
+        # Now try to get the content from the database
+        try:
+            content_obj = RenderedContent.objects.get(cache_key=cache_key)
+            # TODO: if master or develop, fire a task to update the content
+            return content_obj.content_html
+        except RenderedContent.DoesNotExist:
+            return None
+
     def get_description(self, client, tag="develop"):
         """Get description from the appropriate file on GitHub.
 
@@ -322,21 +486,12 @@ class Library(models.Model):
         # File paths/names where description data might be stored.
         files = ["doc/library-detail.adoc", "README.md"]
 
-        # Try to get the content from the cache first
-        static_content_cache = caches["static_content"]
-        cache_key = f"library_description_{self.github_repo}_{tag}"
-        cached_result = static_content_cache.get(cache_key)
+        cached_result = self.get_cached_description(tag=tag)
         if cached_result:
             return cached_result
 
-        # Now try to get the content from the database
-        try:
-            content_obj = RenderedContent.objects.get(cache_key=cache_key)
-            # TODO: if master or develop, fire a task to update the content
-            return content_obj.content_html
-        except RenderedContent.DoesNotExist:
-            pass
-
+        static_content_cache = caches["static_content"]
+        cache_key = self.get_description_cache_key(tag)
         # It's not in a cache -- now try to get the content of each file in turn
         for file_path in files:
             content = client.get_file_content(
@@ -347,8 +502,7 @@ class Library(models.Model):
                 if file_path.endswith(".adoc"):
                     body_content = convert_adoc_to_html(content.decode("utf-8"))
                 else:
-                    temp_file = write_content_to_tempfile(content)
-                    _, body_content = process_md(temp_file.name)
+                    _, body_content = render_markdown(content)
                 static_content_cache.set(cache_key, body_content)
                 RenderedContent.objects.update_or_create(
                     cache_key=cache_key,
@@ -448,6 +602,16 @@ class LibraryVersion(models.Model):
     insertions = models.IntegerField(default=0)
     deletions = models.IntegerField(default=0)
     files_changed = models.IntegerField(default=0)
+    # commit stats, refreshed by LibraryUpdater.update_commit_counts()
+    commit_count = models.IntegerField(default=0)
+    author_count = models.IntegerField(
+        default=0, help_text="Number of distinct commit authors."
+    )
+    new_author_count = models.IntegerField(
+        default=0,
+        help_text="Number of commit authors without commits to the library in "
+        "previous x.x.0 versions.",
+    )
     cpp_standard_minimum = models.CharField(max_length=50, blank=True, null=True)
     dependencies = models.ManyToManyField(
         "libraries.Library",
@@ -485,6 +649,42 @@ class LibraryVersion(models.Model):
         return display_names.get(self.cpp_standard_minimum, self.cpp_standard_minimum)
 
 
+class DependencyDiff(models.Model):
+    """A dependency of a library in a version, compared with the previous x.x.0
+    version. Computed by Version.update_dependency_diffs()."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    UNCHANGED = "unchanged"
+    CHANGE_CHOICES = (
+        (ADDED, "Added"),
+        (REMOVED, "Removed"),
+        (UNCHANGED, "Unchanged"),
+    )
+
+    version = models.ForeignKey(
+        "versions.Version",
+        related_name="dependency_diffs",
+        on_delete=models.CASCADE,
+    )
+    library = models.ForeignKey(
+        Library, related_name="dependency_diffs", on_delete=models.CASCADE
+    )
+    dependency = models.ForeignKey(Library, related_name="+", on_delete=models.CASCADE)
+    change = models.CharField(choices=CHANGE_CHOICES, max_length=10)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["version", "library", "dependency"],
+                name="libraries_dependencydiff_version_library_dependency_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.library.name} -> {self.dependency.name} ({self.change})"
+
+
 class Issue(models.Model):
     """
     Model that tracks Library repository issues in Github
@@ -0,0 +1,148 @@
+"""In-memory library search, for the typeahead of the library search box.
+
+Each process keeps a prefix index over the words of the library names, category
+names, author names and descriptions. Searches don't touch the database; the index
+is rebuilt when the library data generation changes (see libraries.cache). When the
+index can't be built, searches fall back to the full-text search of the database.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+
+import structlog
+
+from .cache import get_library_data_generation
+from .models import Library
+
+# Same order of importance as the weights of Library.search_vector
+FIELD_WEIGHTS = {"name": 8, "category_names": 4, "author_names": 2, "description": 1}
+logger = structlog.get_logger()
+
+# A word typed in full scores higher than a word starting with it
+PREFIX_MATCH_FACTOR = 0.5
+
+_lock = threading.Lock()
+_index = {}
+
+
+def tokenize(text) -> list[str]:
+    return re.findall(r"\w+", (text or "").lower())
+
+
+@dataclass(frozen=True)
+class LibrarySearchResult:
+    """The fields of a Library returned by the library search."""
+
+    name: str
+    slug: str
+    description: str
+
+
+class LibrarySearchIndex:
+    """A prefix index over the words of a set of libraries.
+
+    `tokens` holds every distinct word, sorted, so the words starting with a prefix
+    are a contiguous range found by bisection. `postings[i]` maps the position of
+    each library containing `tokens[i]` to the weight of the most important field
+    it appears in.
+    """
+
+    def __init__(self, libraries):
+        self.libraries = []
+        postings = defaultdict(dict)
+        for position, library in enumerate(libraries):
+            self.libraries.append(
+                LibrarySearchResult(
+                    name=library["name"],
+                    slug=library["slug"],
+                    description=library["description"] or "",
+                )
+            )
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(library[field]):
+                    if weight > postings[token].get(position, 0):
+                        postings[token][position] = weight
+        self.tokens = sorted(postings)
+        self.postings = [postings[token] for token in self.tokens]
+
+    def match(self, word: str) -> dict[int, float]:
+        """Return the score of each library with a word starting with `word`."""
+        scores = {}
+        for i in range(bisect_left(self.tokens, word), len(self.tokens)):
+            token = self.tokens[i]
+            if not token.startswith(word):
+                break
+            factor = 1 if token == word else PREFIX_MATCH_FACTOR
+            for position, weight in self.postings[i].items():
+                if weight * factor > scores.get(position, 0):
+                    scores[position] = weight * factor
+        return scores
+
+    def search(self, value, limit=None) -> list[LibrarySearchResult]:
+        """Return the libraries matching every word of `value`, best matches first.
+
+        A library scores the sum over the words of the best field weight of its
+        words starting with each of them. Ties are ordered by name.
+        """
+        scores = None
+        for word in tokenize(value):
+            matches = self.match(word)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    position: score + matches[position]
+                    for position, score in scores.items()
+                    if position in matches
+                }
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        ranked = sorted(
+            scores,
+            key=lambda position: (-scores[position], self.libraries[position].name),
+        )
+        return [self.libraries[position] for position in ranked[:limit]]
+
+
+def build_library_search_index() -> LibrarySearchIndex:
+    return LibrarySearchIndex(
+        Library.objects.with_search_names()
+        .order_by("name")
+        .values("name", "slug", "description", "category_names", "author_names")
+    )
+
+
+def get_library_search_index() -> LibrarySearchIndex:
+    """Return the search index of this process, rebuilt if the library data changed."""
+    generation = get_library_data_generation()
+    with _lock:
+        cached = dict(_index)
+    if cached.get("generation") == generation:
+        return cached["index"]
+
+    index = build_library_search_index()
+    with _lock:
+        _index.update(index=index, generation=generation)
+    return index
+
+
+def search_libraries(value, limit=None) -> list[LibrarySearchResult]:
+    """Return the libraries matching `value`, best matches first."""
+    try:
+        index = get_library_search_index()
+    except Exception:
+        logger.exception("library_search_index_failed")
+        return [
+            LibrarySearchResult(
+                name=library.name,
+                slug=library.slug,
+                description=library.description or "",
+            )
+            for library in Library.objects.search(value)[:limit]
+        ]
+    return index.search(value, limit=limit)
@@ -0,0 +1,50 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from libraries.cache import (
+    bump_library_data_generation,
+    clear_featured_library_versions,
+)
+from libraries.models import Category, Library, LibraryVersion
+
+
+@receiver(post_save, sender=Library)
+@receiver(post_delete, sender=Library)
+@receiver(post_save, sender=LibraryVersion)
+@receiver(post_delete, sender=LibraryVersion)
+def invalidate_featured_library_versions(sender, instance, **kwargs):
+    """Pick the featured library candidates again, e.g. after `featured` changes."""
+    clear_featured_library_versions()
+
+
+@receiver(post_save, sender=Library)
+@receiver(post_delete, sender=Library)
+@receiver(post_save, sender=LibraryVersion)
+@receiver(post_delete, sender=LibraryVersion)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=Library.categories.through)
+@receiver(m2m_changed, sender=Library.authors.through)
+def invalidate_library_data(sender, instance, **kwargs):
+    """Make the cached library lists and search indexes stale."""
+    bump_library_data_generation()
+
+
+@receiver(post_save, sender=Library)
+def update_search_vector(sender, instance, raw=False, **kwargs):
+    """Make a created or edited library findable by the database search."""
+    if not raw:
+        Library.objects.filter(pk=instance.pk).update_search_vectors()
+
+
+@receiver(m2m_changed, sender=Library.categories.through)
+@receiver(m2m_changed, sender=Library.authors.through)
+def update_search_vectors(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the search vectors, which include the category and author names."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        libraries = Library.objects.filter(pk__in=pk_set or [])
+    else:
+        libraries = Library.objects.filter(pk=instance.pk)
+    libraries.update_search_vectors()
@@ -1,4 +1,8 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 from celery import shared_task, chain
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
 from django.core.management import call_command
 import structlog
@@ -6,8 +10,10 @@ import structlog
 from config.celery import app
 from django.conf import settings
 from django.db.models import Q, Count
-from core.boostrenderer import get_content_from_s3
+from core.boostrenderer import get_content_from_s3, get_s3_client, s3_content_exists
+from core.githubhelper import GithubAPIClient
 from core.htmlhelper import get_library_documentation_urls
+from libraries.cache import bump_library_data_generation
 from libraries.forms import CreateReportForm, CreateReportFullForm
 from libraries.github import LibraryUpdater
 from libraries.models import Library, LibraryVersion, CommitAuthorEmail, CommitAuthor
@@ -22,6 +28,10 @@ from .utils import version_within_range
 
 logger = structlog.getLogger(__name__)
 
+# States of a library description being rendered by update_library_description
+DESCRIPTION_PENDING = "pending"
+DESCRIPTION_MISSING = "missing"
+
 
 @app.task
 def update_library_version_documentation_urls_all_versions():
@@ -68,40 +78,51 @@ def get_and_store_library_version_documentation_urls_for_version(version_pk):
 
     content = result["content"]
     library_tags = get_library_documentation_urls(content)
-    library_versions = LibraryVersion.objects.filter(version=version)
+    library_versions_by_name = defaultdict(list)
+    for library_version in LibraryVersion.objects.filter(
+        version=version
+    ).select_related("library"):
+        library_versions_by_name[library_version.library.name.lower()].append(
+            library_version
+        )
 
+    updated = []
     for library_name, url_path in library_tags:
-        try:
-            # In most cases, the name matches close enough to get the correct object
-            library_version = library_versions.get(library__name__iexact=library_name)
-            library_version.documentation_url = f"/{base_path}{url_path}"
-            library_version.save()
-        except LibraryVersion.DoesNotExist:
+        # In most cases, the name matches close enough to get the correct object
+        matches = library_versions_by_name.get(library_name.lower(), [])
+        if not matches:
             logger.info(
                 f"get_library_version_documentation_urls_version_does_not_exist"
                 f"{library_name=} {version.slug=}",
             )
             continue
-        except LibraryVersion.MultipleObjectsReturned:
+        if len(matches) > 1:
             logger.info(
                 "get_library_version_documentation_urls_multiple_objects_returned",
                 library_name=library_name,
                 version_slug=version.slug,
             )
             continue
+        library_version = matches[0]
+        library_version.documentation_url = f"/{base_path}{url_path}"
+        updated.append(library_version)
+    LibraryVersion.objects.bulk_update(updated, ["documentation_url"])
 
     # See if we can load missing docs URLS another way
     library_versions = (
         LibraryVersion.objects.filter(missing_docs=False)
         .filter(version=version)
         .filter(Q(documentation_url="") | Q(documentation_url__isnull=True))
+        .select_related("library", "version")
     )
+    missing_docs = []
+    candidates = []
     for library_version in library_versions:
         # Check whether we know this library-version doesn't have docs
         if library_version_missing_docs(library_version):
             # Record that the docs are missing, since we know they are
             library_version.missing_docs = True
-            library_version.save()
+            missing_docs.append(library_version)
             continue
 
         # Check whether this library-version stores its docs in another location
@@ -126,15 +147,30 @@ def get_and_store_library_version_documentation_urls_for_version(version_pk):
                 break  # Stop looking once a matching version is found
 
         if documentation_url:
-            # validate this in S3
-            key = documentation_url.split("#")
-            content = get_content_from_s3(key[0])
-
-            if content:
+            candidates.append((library_version, documentation_url))
+    LibraryVersion.objects.bulk_update(missing_docs, ["missing_docs"])
+
+    # Validate the candidate URLs in S3 concurrently
+    s3_client = get_s3_client()
+    with ThreadPoolExecutor(
+        max_workers=settings.DOCS_URL_VALIDATION_WORKERS
+    ) as executor:
+        exists = executor.map(
+            lambda candidate: s3_content_exists(
+                candidate[1].split("#")[0], client=s3_client
+            ),
+            candidates,
+        )
+        found = []
+        for (library_version, documentation_url), valid in zip(candidates, exists):
+            if valid:
                 library_version.documentation_url = documentation_url
-                library_version.save()
+                found.append(library_version)
             else:
                 logger.info(f"No valid docs in S3 for key {documentation_url}")
+    LibraryVersion.objects.bulk_update(found, ["documentation_url"])
+    # bulk_update() doesn't send post_save
+    bump_library_data_generation()
 
 
 def version_missing_docs(version):
@@ -188,6 +224,50 @@ def update_libraries():
     logger.info("libraries_tasks_update_all_libraries_finished")
 
 
+def get_description_status_key(library, tag):
+    return f"library_description_status_{library.github_repo}_{tag}"
+
+
+def get_library_description_status(library, tag):
+    """Return DESCRIPTION_PENDING while update_library_description() runs for the
+    library and tag, DESCRIPTION_MISSING if it found no description, else None."""
+    return cache.get(get_description_status_key(library, tag))
+
+
+def queue_library_description(library, tag):
+    """Render the description of a library at a tag in the background.
+
+    Only one task is queued per repo and tag until it finishes.
+    """
+    status_key = get_description_status_key(library, tag)
+    if cache.add(
+        status_key, DESCRIPTION_PENDING, settings.LIBRARY_DESCRIPTION_TASK_TIMEOUT
+    ):
+        update_library_description.delay(library.pk, tag)
+
+
+@app.task
+def update_library_description(library_pk, tag):
+    """Fetch and render a library description into the caches."""
+    library = Library.objects.get(pk=library_pk)
+    status_key = get_description_status_key(library, tag)
+    client = GithubAPIClient(repo_slug=library.github_repo)
+    try:
+        description = library.get_description(client, tag=tag)
+    except Exception:
+        logger.exception(
+            "update_library_description_failed", library=library.key, tag=tag
+        )
+        description = None
+    if description:
+        cache.delete(status_key)
+    else:
+        # Let the pages show that there is no description until the status expires
+        cache.set(
+            status_key, DESCRIPTION_MISSING, settings.LIBRARY_DESCRIPTION_TASK_TIMEOUT
+        )
+
+
 @app.task
 def update_authors_and_maintainers():
     call_command("update_authors")
@@ -196,19 +276,22 @@ def update_authors_and_maintainers():
 
 
 @app.task
-def update_commits(token=None, clean=False, min_version=""):
-    # dictionary of library_key: int
-    commits_handled: dict[str, int] = {}
+def update_commits(token=None, clean=False, min_version="", workers=None):
+    """Import commits for all libraries, `workers` libraries at a time.
+
+    Returns a dictionary of library key to the number of commits handled.
+    """
     updater = LibraryUpdater(token=token)
     all_libs = Library.objects.all()
-    lib_count = len(all_libs)
-    for idx, library in enumerate(all_libs):
-        logger.info(f"Importing commits for library {library} ({idx}/{lib_count}).")
-        commits_handled[library.key] = updater.update_commits(
-            library=library, clean=clean, min_version=min_version
-        )
+    workers = workers or settings.COMMIT_IMPORT_WORKERS
+    logger.info(f"Importing commits for {len(all_libs)} libraries, {workers=}.")
+    results = updater.update_commits_for_libraries(
+        all_libs, clean=clean, min_version=min_version, workers=workers
+    )
+    if failed := [result.key for result in results if result.error]:
+        logger.error(f"update_commits failed for libraries: {', '.join(failed)}")
     logger.info("update_commits finished.")
-    return commits_handled
+    return {result.key: result.commits for result in results}
 
 
 @app.task
@@ -3,6 +3,21 @@ from fastcore.xtras import dict2obj
 from model_bakery import baker
 from textwrap import dedent
 
+from libraries.cache import (
+    bump_library_data_generation,
+    clear_featured_library_versions,
+)
+
+
+@pytest.fixture(autouse=True)
+def library_caches():
+    # Libraries are rolled back between tests without sending signals
+    clear_featured_library_versions()
+    bump_library_data_generation()
+    yield
+    clear_featured_library_versions()
+    bump_library_data_generation()
+
 
 @pytest.fixture
 def category(db):
@@ -1,3 +1,8 @@
+from model_bakery import baker
+
+from libraries.models import Library
+
+
 def test_library_search(library, tp):
     """
     GET /api/v1/libraries/?q=
@@ -7,3 +12,36 @@ def test_library_search(library, tp):
     res = tp.get(f"/api/v1/libraries/?q={library.name[:3]}")
     tp.response_200(res)
     assert len(res.context["libraries"]) == 1
+
+
+def test_library_search_ranking(db):
+    category = baker.make("libraries.Category", name="Containers")
+    author = baker.make("users.User", display_name="Jane Container")
+    by_description = baker.make(
+        "libraries.Library", name="Any", description="Holds values of any type"
+    )
+    by_category = baker.make("libraries.Library", name="Bimap", categories=[category])
+    by_author = baker.make("libraries.Library", name="Heap", authors=[author])
+    by_name = baker.make("libraries.Library", name="Container", description="")
+    baker.make("libraries.Library", name="Json", description="JSON parsing")
+    assert Library.objects.update_search_vectors() == 5
+
+    assert list(Library.objects.search("contain")) == [
+        by_name,
+        by_category,
+        by_author,
+    ]
+    assert list(Library.objects.search("values ty")) == [by_description]
+    assert not Library.objects.search("").exists()
+    assert not Library.objects.search(None).exists()
+
+
+def test_library_search_vector_kept_current(db):
+    library = baker.make("libraries.Library", name="Bimap", description="")
+    assert list(Library.objects.search("bim")) == [library]
+
+    category = baker.make("libraries.Category", name="Containers")
+    library.categories.add(category)
+    assert list(Library.objects.search("contain")) == [library]
+    category.libraries.remove(library)
+    assert not Library.objects.search("contain").exists()
@@ -0,0 +1,31 @@
+from model_bakery import baker
+
+from libraries.cache import get_featured_library_version
+
+
+def test_get_featured_library_version(version, django_assert_num_queries):
+    baker.make("libraries.LibraryVersion", version=version, library__featured=False)
+    featured = baker.make(
+        "libraries.LibraryVersion", version=version, library__featured=True
+    )
+    # A featured library without the version isn't a candidate
+    baker.make("libraries.LibraryVersion", library__featured=True)
+
+    # The candidates, the LibraryVersion and its three prefetched relations
+    with django_assert_num_queries(5):
+        assert get_featured_library_version(version) == featured
+    with django_assert_num_queries(4):
+        library_version = get_featured_library_version(version)
+    assert library_version == featured
+    with django_assert_num_queries(0):
+        assert library_version.library.featured
+        list(library_version.authors.all())
+
+    featured.library.featured = False
+    featured.library.save()
+    assert get_featured_library_version(version).version == version
+
+
+def test_get_featured_library_version_empty(version):
+    assert get_featured_library_version(version) is None
+    assert get_featured_library_version(None) is None
@@ -1,8 +1,12 @@
+from unittest.mock import patch
+
 import pytest
 
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
 
+from libraries.github import LibraryUpdater
+
 
 User = get_user_model()
 
@@ -43,3 +47,20 @@ def test_update_maintainers_command(library_version):
     assert library_version.maintainers.count() == 2
     assert library_version.maintainers.filter(email="jane@boost.com").exists()
     assert library_version.maintainers.filter(email="juan@boost.com").exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("args", [[], ["--key"]])
+def test_import_commits_command_refreshes_version_authors(library, args):
+    """Every import_commits run refreshes the commit authors of each version."""
+    library.key = "multi_array"
+    library.save()
+    if args:
+        args = [*args, library.key]
+    with (
+        patch.object(LibraryUpdater, "update_commits", return_value=0),
+        patch.object(LibraryUpdater, "update_commit_author_github_data"),
+        patch.object(LibraryUpdater, "update_version_commit_authors") as mock_refresh,
+    ):
+        call_command("import_commits", *args)
+    mock_refresh.assert_called_once()
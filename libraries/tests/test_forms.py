@@ -1,6 +1,32 @@
-from ..forms import LibraryForm
+from model_bakery import baker
+
+from ..forms import CreateReportForm, LibraryForm
 
 
 def test_library_form_success(tp, library, category):
     form = LibraryForm(data={"categories": [category]})
     assert form.is_valid() is True
+
+
+def test_count_new_contributors(db):
+    version = baker.make("versions.Version", name="boost-1.85.0")
+    libraries = baker.make("libraries.Library", _quantity=3)
+    baker.make(
+        "libraries.LibraryVersion",
+        library=libraries[0],
+        version=version,
+        new_author_count=2,
+    )
+    baker.make(
+        "libraries.LibraryVersion",
+        library=libraries[2],
+        version=version,
+        new_author_count=1,
+    )
+    library_order = [libraries[2].id, libraries[1].id, libraries[0].id]
+
+    assert CreateReportForm()._count_new_contributors(library_order, version) == [
+        {"id": libraries[2].id, "count": 1},
+        {"id": libraries[1].id, "count": 0},
+        {"id": libraries[0].id, "count": 2},
+    ]
@@ -1,12 +1,29 @@
+import datetime
+import subprocess
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
 from ghapi.all import GhApi
 from model_bakery import baker
 
-from libraries.github import LibraryUpdater
+from libraries.github import LibraryUpdater, ParsedCommit, iter_git_log
 from core.githubhelper import GithubAPIClient
-from libraries.models import Category, Issue, Library, LibraryVersion, PullRequest
+from libraries.models import (
+    Category,
+    Commit,
+    CommitAuthor,
+    CommitAuthorEmail,
+    CommitImportWatermark,
+    ContributorRanking,
+    DependencyDiff,
+    Issue,
+    LibrariesJsonSnapshot,
+    Library,
+    LibraryVersion,
+    PullRequest,
+    VersionCommitAuthor,
+)
 
 
 @pytest.fixture
@@ -84,6 +101,43 @@ def test_get_library_list_skip(library_updater):
     assert result == []
 
 
+def test_get_libraries_json_for_submodules(library_updater):
+    fetch = MagicMock(side_effect=lambda modules: [{"key": m} for m, _ in modules])
+    library_updater.client.get_libraries_json_for_modules = fetch
+    submodules = [("align", "a" * 40), ("any", None), ("array", "b" * 40)]
+
+    result = library_updater.get_libraries_json_for_submodules(
+        submodules, tag="boost-1.85.0"
+    )
+    assert result == [{"key": "align"}, {"key": "any"}, {"key": "array"}]
+    fetch.assert_called_once_with(
+        [("align", "a" * 40), ("any", "boost-1.85.0"), ("array", "b" * 40)]
+    )
+    assert LibrariesJsonSnapshot.objects.count() == 2
+
+    # A later version pointing at the same commits only fetches the unknown one
+    fetch.reset_mock()
+    result = library_updater.get_libraries_json_for_submodules(
+        submodules, tag="boost-1.86.0"
+    )
+    assert result == [{"key": "align"}, {"key": "any"}, {"key": "array"}]
+    fetch.assert_called_once_with([("any", "boost-1.86.0")])
+
+
+def test_get_libraries_json_for_submodules_failures(library_updater):
+    library_updater.client.get_libraries_json_for_modules = MagicMock(
+        return_value=[None, ValueError("invalid json")]
+    )
+    result = library_updater.get_libraries_json_for_submodules(
+        [("align", "a" * 40), ("any", "b" * 40)], tag="boost-1.85.0"
+    )
+    assert result == [None, None]
+    # Missing files are stored, failed downloads are retried on the next import
+    snapshot = LibrariesJsonSnapshot.objects.get()
+    assert snapshot.repo_slug == "align"
+    assert snapshot.data is None
+
+
 def test_update_authors(library_updater, user, library_version):
     library = library_version.library
     assert library.authors.exists() is False
@@ -184,6 +238,288 @@ def test_update_categories(library, library_updater):
     assert Category.objects.filter(name="Container").exists() is False
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_update_commits_for_libraries(library_updater, workers):
+    """Test that commit imports report per-library results and isolate failures."""
+    libraries = [baker.prepare("libraries.Library", key=key) for key in ["a", "b", "c"]]
+
+    def update_commits(library, clean=False, min_version=""):
+        if library.key == "b":
+            raise ValueError("clone failed")
+        return 2
+
+    with patch.object(library_updater, "update_commits", side_effect=update_commits):
+        results = library_updater.update_commits_for_libraries(
+            libraries, min_version="boost-1.85.0", workers=workers
+        )
+
+    assert [result.key for result in results] == ["a", "b", "c"]
+    assert [result.commits for result in results] == [2, 0, 2]
+    assert results[0].error is None
+    assert results[1].error == "clone failed"
+
+
+@pytest.fixture
+def git_repo_with_history(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+    git("init", "-q", "-b", "master")
+    git("config", "user.email", "jane@example.com")
+    git("config", "user.name", "Jane Doe")
+    (path / "a.txt").write_text("a\n")
+    git("add", "a.txt")
+    git("commit", "-q", "-m", "First")
+    git("tag", "boost-1.0.0")
+    git("checkout", "-q", "-b", "feature")
+    (path / "b.txt").write_text("b\n")
+    git("add", "b.txt")
+    git("commit", "-q", "-m", "Add b\n\ncommit messages may mention commit\n  indented")
+    git("checkout", "-q", "master")
+    git("merge", "-q", "--no-ff", "-m", "Merge feature", "feature")
+    return path / ".git"
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64 * 1024])
+def test_iter_git_log(git_repo_with_history, chunk_size):
+    with patch("libraries.github.GIT_LOG_CHUNK_SIZE", chunk_size):
+        commits = list(
+            iter_git_log(git_repo_with_history, "boost-1.0.0..master", "master")
+        )
+
+    assert len(commits) == 2
+    merge, feature = commits
+    assert merge.is_merge is True
+    assert merge.message == "Merge feature"
+    assert feature.is_merge is False
+    assert feature.name == "Jane Doe"
+    assert feature.email == "jane@example.com"
+    assert feature.version == "master"
+    assert len(feature.sha) == 40
+    assert feature.committed_at.tzinfo is not None
+    assert feature.message == (
+        "Add b\n\ncommit messages may mention commit\n  indented"
+    )
+
+
+def test_iter_git_log_unknown_revision(git_repo_with_history):
+    assert list(iter_git_log(git_repo_with_history, "boost-9.9.9..master", "x")) == []
+
+
+def test_update_commits_incremental(library_updater, git_repo_with_history):
+    """Later imports only walk commits added since the recorded watermarks."""
+    library = baker.make(
+        "libraries.Library", key="repo", github_url="https://github.com/boostorg/repo"
+    )
+    for name in ["boost-1.0.0", "master"]:
+        version = baker.make("versions.Version", name=name)
+        baker.make("libraries.LibraryVersion", library=library, version=version)
+
+    @contextmanager
+    def local_mirror(url, name):
+        yield git_repo_with_history
+
+    work_tree = git_repo_with_history.parent
+    with patch("libraries.github.git_mirror", local_mirror):
+        assert library_updater.update_commits(library) == 2
+        watermarks = dict(
+            CommitImportWatermark.objects.filter(library=library).values_list(
+                "ref", "base"
+            )
+        )
+        assert watermarks == {"boost-1.0.0": "", "master": "boost-1.0.0"}
+
+        # Nothing changed, so no ranges are walked
+        with patch("libraries.github.iter_git_log") as mock_log:
+            assert library_updater.update_commits(library) == 0
+        mock_log.assert_not_called()
+
+        (work_tree / "c.txt").write_text("c\n")
+        subprocess.run(["git", "add", "c.txt"], cwd=work_tree, check=True)
+        subprocess.run(
+            ["git", "commit", "-q", "-m", "Add c"], cwd=work_tree, check=True
+        )
+        assert library_updater.update_commits(library) == 1
+
+    assert Commit.objects.filter(library_version__library=library).count() == 3
+    master = LibraryVersion.objects.get(library=library, version__name="master")
+    assert master.files_changed == 2
+
+
+def test_update_commits_failed_range(library_updater, git_repo_with_history):
+    """A range git can't read gets no watermark, so it is read again next time."""
+    library = baker.make(
+        "libraries.Library", key="repo", github_url="https://github.com/boostorg/repo"
+    )
+    for name in ["boost-0.9.0", "master"]:
+        version = baker.make("versions.Version", name=name)
+        baker.make("libraries.LibraryVersion", library=library, version=version)
+
+    @contextmanager
+    def local_mirror(url, name):
+        yield git_repo_with_history
+
+    with patch("libraries.github.git_mirror", local_mirror):
+        # The boost-0.9.0 tag is missing from the repository
+        assert library_updater.update_commits(library) == 0
+
+    assert not CommitImportWatermark.objects.filter(library=library).exists()
+
+
+def test_update_commit_counts(library_updater):
+    library = baker.make("libraries.Library")
+    jane, john = baker.make("libraries.CommitAuthor", _quantity=2)
+    library_versions = {}
+    for name in ["boost-1.84.0", "boost-1.84.1", "boost-1.85.0", "master"]:
+        version = baker.make("versions.Version", name=name)
+        library_versions[name] = baker.make(
+            "libraries.LibraryVersion", library=library, version=version
+        )
+    for name, author in [
+        ("boost-1.84.0", jane),
+        ("boost-1.84.1", john),
+        ("boost-1.85.0", jane),
+        ("boost-1.85.0", jane),
+        ("boost-1.85.0", john),
+    ]:
+        baker.make(
+            "libraries.Commit", library_version=library_versions[name], author=author
+        )
+
+    library_updater.update_commit_counts(library)
+
+    counts = {}
+    for name, lv in library_versions.items():
+        lv.refresh_from_db()
+        counts[name] = (lv.commit_count, lv.author_count, lv.new_author_count)
+    # John's commit in a patch release doesn't count towards 1.85.0
+    assert counts == {
+        "boost-1.84.0": (1, 1, 1),
+        "boost-1.84.1": (1, 1, 1),
+        "boost-1.85.0": (3, 2, 1),
+        "master": (0, 0, 0),
+    }
+
+
+def test_update_contributor_rankings(library_updater):
+    library = baker.make("libraries.Library")
+    jane, john = baker.make("libraries.CommitAuthor", _quantity=2)
+    library_versions = {}
+    for name in ["boost-1.84.0", "boost-1.85.0", "boost-1.86.0"]:
+        version = baker.make("versions.Version", name=name)
+        library_versions[name] = baker.make(
+            "libraries.LibraryVersion", library=library, version=version
+        )
+    for name, author in [
+        ("boost-1.84.0", jane),
+        ("boost-1.85.0", jane),
+        ("boost-1.85.0", john),
+    ]:
+        baker.make(
+            "libraries.Commit", library_version=library_versions[name], author=author
+        )
+
+    def get_rankings():
+        return set(
+            ContributorRanking.objects.values_list(
+                "library_version__version__name",
+                "author",
+                "commit_count",
+                "previous_commit_count",
+                "is_new",
+            )
+        )
+
+    # Nothing is ranked yet, so every LibraryVersion is
+    assert library_updater.update_contributor_rankings(library, []) == 5
+    assert get_rankings() == {
+        ("boost-1.84.0", jane.pk, 1, 0, True),
+        ("boost-1.85.0", jane.pk, 1, 1, False),
+        ("boost-1.85.0", john.pk, 1, 0, True),
+        ("boost-1.86.0", jane.pk, 0, 2, False),
+        ("boost-1.86.0", john.pk, 0, 1, False),
+    }
+
+    baker.make(
+        "libraries.Commit",
+        library_version=library_versions["boost-1.85.0"],
+        author=john,
+    )
+    # 1.84.0 doesn't count the commits of 1.85.0, so it is left as is
+    assert (
+        library_updater.update_contributor_rankings(
+            library, [library_versions["boost-1.85.0"]]
+        )
+        == 4
+    )
+    assert ("boost-1.85.0", john.pk, 2, 0, True) in get_rankings()
+    assert ("boost-1.86.0", john.pk, 0, 2, False) in get_rankings()
+
+
+def test_update_version_commit_authors(library_updater):
+    jane, john = baker.make("libraries.CommitAuthor", _quantity=2)
+    old_version = baker.make("versions.Version", name="boost-1.84.0")
+    version = baker.make("versions.Version", name="boost-1.85.0")
+    baker.make("libraries.VersionCommitAuthor", version=old_version, author=jane)
+    for author in [jane, jane, john]:
+        baker.make(
+            "libraries.Commit",
+            library_version__version=version,
+            author=author,
+        )
+    baker.make("libraries.Commit", library_version__version=old_version, author=john)
+
+    library_updater.update_version_commit_authors(min_version="boost-1.85.0")
+
+    assert set(
+        VersionCommitAuthor.objects.values_list(
+            "version__name", "author", "commit_count"
+        )
+    ) == {
+        ("boost-1.84.0", jane.pk, 0),
+        ("boost-1.85.0", jane.pk, 2),
+        ("boost-1.85.0", john.pk, 1),
+    }
+
+
+def test_resolve_commit_authors(library_updater, django_assert_max_num_queries):
+    existing = baker.make("libraries.CommitAuthor", name="Existing")
+    baker.make("libraries.CommitAuthorEmail", email="old@example.com", author=existing)
+
+    def parsed_commit(email, name):
+        return ParsedCommit(
+            email=email,
+            name=name,
+            message="",
+            sha="",
+            version="master",
+            is_merge=False,
+            committed_at=None,
+        )
+
+    commits = [
+        parsed_commit("old@example.com", "Old"),
+        parsed_commit("new@example.com", "New"),
+        parsed_commit("new@example.com", "New Again"),
+        parsed_commit("other@example.com", "Other"),
+    ]
+    # One lookup, one transaction with two inserts, one re-check and one cleanup,
+    # however many commits there are.
+    with django_assert_max_num_queries(8):
+        authors = library_updater.resolve_commit_authors(commits)
+
+    assert authors["old@example.com"] == existing
+    assert authors["new@example.com"].name == "New"
+    assert authors["other@example.com"].name == "Other"
+    assert CommitAuthor.objects.count() == 3
+    assert CommitAuthorEmail.objects.get(email="new@example.com").author == (
+        authors["new@example.com"]
+    )
+
+
 def test_update_issues_new(
     tp, library, github_api_repo_issues_response, library_updater
 ):
@@ -328,6 +664,92 @@ def test_update_prs_existing(
     assert pull.title == existing_pr_data.title
 
 
+def test_update_issues_since_latest_stored(
+    tp,
+    library,
+    github_api_repo_issues_response,
+    library_updater,
+    django_assert_max_num_queries,
+):
+    """update_issues only requests issues updated since the last stored change"""
+    latest = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+    baker.make(Issue, library=library, modified=latest - datetime.timedelta(days=1))
+    baker.make(Issue, library=library, modified=latest)
+    library_updater.client.get_repo_issues = MagicMock(
+        return_value=github_api_repo_issues_response
+    )
+
+    with django_assert_max_num_queries(8):
+        library_updater.update_issues(library)
+
+    assert library_updater.client.get_repo_issues.call_args.kwargs["since"] == latest
+    assert Issue.objects.filter(library=library).count() == 2 + len(
+        github_api_repo_issues_response
+    )
+
+
+def test_update_issues_full_import_without_stored_issues(
+    tp, library, github_api_repo_issues_response, library_updater
+):
+    library_updater.client.get_repo_issues = MagicMock(return_value=[])
+    library_updater.update_issues(library)
+    assert library_updater.client.get_repo_issues.call_args.kwargs["since"] is None
+
+
+def test_save_github_items_stops_at_failed_chunk(library, library_updater):
+    """Items newer than a chunk that failed aren't saved, so they're fetched again"""
+    day = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+    issues = [
+        Issue(
+            library=library,
+            github_id=str(n),
+            number=n,
+            created=day,
+            modified=day + datetime.timedelta(days=n),
+        )
+        for n in [3, 1, 2]
+    ]
+    bulk_create = Issue.objects.bulk_create
+
+    def fail_on_second_issue(objs, *args, **kwargs):
+        if any(issue.github_id == "2" for issue in objs):
+            raise ValueError("boom")
+        return bulk_create(objs, *args, **kwargs)
+
+    with (
+        patch("libraries.github.GITHUB_ITEMS_CHUNK_SIZE", 1),
+        patch.object(Issue.objects, "bulk_create", side_effect=fail_on_second_issue),
+    ):
+        library_updater.save_github_items(library, issues)
+
+    assert list(
+        Issue.objects.filter(library=library).values_list("github_id", flat=True)
+    ) == ["1"]
+
+
+def test_update_dependency_diffs(library_updater):
+    library = baker.make("libraries.Library", name="algorithm")
+    dependency = baker.make("libraries.Library", name="core")
+    versions = [
+        baker.make("versions.Version", name=name)
+        for name in ["boost-1.84.0", "boost-1.85.0", "boost-1.86.0"]
+    ]
+    for version in versions:
+        baker.make(
+            "libraries.LibraryVersion",
+            library=library,
+            version=version,
+            dependencies=[dependency],
+        )
+
+    # Updating 1.85.0 recomputes its diff and the diff of 1.86.0 against it
+    assert library_updater.update_dependency_diffs({versions[1].id}) == 2
+    assert set(DependencyDiff.objects.values_list("version__name", "change")) == {
+        ("boost-1.85.0", "unchanged"),
+        ("boost-1.86.0", "unchanged"),
+    }
+
+
 def test_parse_boostdep_artifact(
     github_action_boostdep_output_artifact, library_updater
 ):
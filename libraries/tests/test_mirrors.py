@@ -0,0 +1,79 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from libraries.mirrors import git_mirror, mirror_lock, prune_mirrors
+
+
+def git(*args, cwd=None):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def mirror_settings(settings, tmp_path):
+    settings.GIT_MIRROR_DIR = str(tmp_path / "mirrors")
+    settings.GIT_MIRROR_MAX_SIZE_MB = 1024
+    return settings
+
+
+@pytest.fixture
+def origin_repo(tmp_path):
+    path = tmp_path / "origin"
+    path.mkdir()
+    git("init", "-q", "-b", "master", cwd=path)
+    git("config", "user.email", "author@example.com", cwd=path)
+    git("config", "user.name", "Author", cwd=path)
+    (path / "file.txt").write_text("one\n")
+    git("add", "file.txt", cwd=path)
+    git("commit", "-q", "-m", "first", cwd=path)
+    git("tag", "boost-1.0.0", cwd=path)
+    return path
+
+
+def test_git_mirror_clones_then_fetches(mirror_settings, origin_repo):
+    with git_mirror(str(origin_repo), "origin") as git_dir:
+        assert git_dir.exists()
+        assert git("--git-dir", str(git_dir), "tag") == "boost-1.0.0"
+
+    (origin_repo / "file.txt").write_text("two\n")
+    git("commit", "-q", "-am", "second", cwd=origin_repo)
+    git("tag", "-d", "boost-1.0.0", cwd=origin_repo)
+    head = git("rev-parse", "HEAD", cwd=origin_repo)
+
+    with patch("libraries.mirrors.clone_mirror") as mock_clone:
+        with git_mirror(str(origin_repo), "origin") as git_dir:
+            assert git("--git-dir", str(git_dir), "rev-parse", "master") == head
+            # deleted tags are pruned from the mirror
+            assert git("--git-dir", str(git_dir), "tag") == ""
+    mock_clone.assert_not_called()
+
+
+def test_git_mirror_clone_failure(mirror_settings, tmp_path):
+    with patch("libraries.mirrors.time.sleep"):
+        with git_mirror(str(tmp_path / "missing"), "missing") as git_dir:
+            assert git_dir is None
+
+
+def test_mirror_lock_non_blocking(mirror_settings):
+    with mirror_lock("repo") as acquired:
+        assert acquired
+        with mirror_lock("repo", blocking=False) as acquired_again:
+            assert not acquired_again
+
+
+def test_prune_mirrors(mirror_settings, origin_repo):
+    mirror_settings.GIT_MIRROR_MAX_SIZE_MB = 0
+    with git_mirror(str(origin_repo), "first") as first_dir:
+        pass
+    with git_mirror(str(origin_repo), "second") as second_dir:
+        pass
+    # Pruning after the second mirror keeps the mirror that was just used
+    assert not first_dir.exists()
+    assert second_dir.exists()
+
+    with mirror_lock("second"):
+        prune_mirrors()
+    assert second_dir.exists()
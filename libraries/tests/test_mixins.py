@@ -2,7 +2,7 @@ import datetime
 import pytest
 from django.test import RequestFactory
 from model_bakery import baker
-from libraries.mixins import VersionAlertMixin
+from libraries.mixins import ContributorMixin, VersionAlertMixin
 from libraries.views import LibraryListBase
 
 
@@ -40,3 +40,32 @@ def test_version_alert_mixin(version):
     assert context["version"] == old_version
     assert context["latest_version"] == latest_version
     assert context["version_alert"]
+
+
+@pytest.mark.django_db
+def test_contributor_mixin_rankings():
+    library_version = baker.make("libraries.LibraryVersion")
+    jane, john, jim = baker.make("libraries.CommitAuthor", _quantity=3)
+    for author, commit_count, previous_commit_count in [
+        (jane, 3, 0),
+        (john, 1, 4),
+        (jim, 0, 2),
+    ]:
+        baker.make(
+            "libraries.ContributorRanking",
+            library_version=library_version,
+            author=author,
+            commit_count=commit_count,
+            previous_commit_count=previous_commit_count,
+            is_new=not previous_commit_count,
+        )
+
+    top_contributors = ContributorMixin().get_top_contributors(library_version)
+    assert [(x, x.count, x.is_new) for x in top_contributors] == [
+        (jane, 3, True),
+        (john, 1, False),
+    ]
+    previous_contributors = ContributorMixin().get_previous_contributors(
+        library_version, exclude=[john.id]
+    )
+    assert [(x, x.count) for x in previous_contributors] == [(jim, 2)]
@@ -2,7 +2,8 @@ import datetime
 from django.db.models import Sum
 from model_bakery import baker
 
-from libraries.models import CommitAuthor
+from libraries.github import LibraryUpdater
+from libraries.models import CommitAuthor, ContributorRanking, VersionCommitAuthor
 from mailing_list.models import EmailData
 
 
@@ -164,6 +165,28 @@ def test_merge_author_reassigns_commits():
     assert author_1.commit_set.count() == 20
 
 
+def test_merge_author_refreshes_commit_stats():
+    version = baker.make("versions.Version", name="boost-1.85.0")
+    lv = baker.make("libraries.LibraryVersion", version=version)
+    author_1 = baker.make("libraries.CommitAuthor")
+    author_2 = baker.make("libraries.CommitAuthor")
+    baker.make("libraries.Commit", author=author_1, library_version=lv)
+    baker.make("libraries.Commit", author=author_2, library_version=lv, _quantity=2)
+    updater = LibraryUpdater()
+    updater.update_commit_counts(lv.library)
+    updater.update_contributor_rankings(lv.library)
+    updater.update_version_commit_authors()
+
+    author_1.merge_author(author_2)
+
+    lv.refresh_from_db()
+    assert (lv.commit_count, lv.author_count, lv.new_author_count) == (3, 1, 1)
+    ranking = ContributorRanking.objects.get(library_version=lv)
+    assert (ranking.author, ranking.commit_count) == (author_1, 3)
+    version_author = VersionCommitAuthor.objects.get(version=version)
+    assert (version_author.author, version_author.commit_count) == (author_1, 3)
+
+
 def test_merge_author_reassigns_emaildata():
     versions = []
     for i in range(10):
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from model_bakery import baker
+
+from libraries.models import Library
+from libraries.search import (
+    LibrarySearchIndex,
+    LibrarySearchResult,
+    get_library_search_index,
+    search_libraries,
+)
+
+
+def make_library(name, description="", category_names="", author_names=""):
+    return {
+        "name": name,
+        "slug": name.lower(),
+        "description": description,
+        "category_names": category_names,
+        "author_names": author_names,
+    }
+
+
+def test_library_search_index():
+    index = LibrarySearchIndex(
+        [
+            make_library("Any", description="Holds values of any type"),
+            make_library("Bimap", category_names="Containers"),
+            make_library("Container"),
+            make_library("Containers", description="Container adaptors"),
+            make_library("Heap", author_names="Jane Container"),
+            make_library("Json", description="JSON parsing", category_names="IO"),
+        ]
+    )
+
+    assert [x.name for x in index.search("container")] == [
+        "Container",
+        "Containers",
+        "Bimap",
+        "Heap",
+    ]
+    assert [x.name for x in index.search("contain", limit=2)] == [
+        "Container",
+        "Containers",
+    ]
+    assert index.search("VALUES ty") == [
+        LibrarySearchResult(
+            name="Any", slug="any", description="Holds values of any type"
+        )
+    ]
+    assert index.search("json io") == index.search("js")
+    assert index.search("json heap") == []
+    assert index.search("") == []
+    assert index.search(None) == []
+
+
+def test_search_libraries(db, django_assert_num_queries):
+    category = baker.make("libraries.Category", name="Containers")
+    baker.make("libraries.Library", name="Bimap", slug="bimap", categories=[category])
+    baker.make("libraries.Library", name="Any", slug="any")
+
+    assert [x.slug for x in search_libraries("contain")] == ["bimap"]
+    # The index is reused until the library data changes
+    with django_assert_num_queries(0):
+        assert [x.slug for x in search_libraries("an")] == ["any"]
+    index = get_library_search_index()
+    baker.make("libraries.Library", name="Anything", slug="anything")
+    assert get_library_search_index() is not index
+    assert [x.slug for x in search_libraries("an", limit=5)] == ["any", "anything"]
+
+
+def test_search_libraries_database_fallback(db):
+    baker.make("libraries.Library", name="Bimap", slug="bimap", description="Maps")
+    Library.objects.update_search_vectors()
+
+    with patch("libraries.search.build_library_search_index", side_effect=MemoryError):
+        assert search_libraries("bim", limit=5) == [
+            LibrarySearchResult(name="Bimap", slug="bimap", description="Maps")
+        ]
@@ -1,9 +1,18 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from model_bakery import baker
+
+from django.core.cache import cache
+
 from libraries.tasks import (
+    DESCRIPTION_MISSING,
+    DESCRIPTION_PENDING,
     get_and_store_library_version_documentation_urls_for_version,
+    get_description_status_key,
+    get_library_description_status,
     library_version_missing_docs,
+    queue_library_description,
     version_missing_docs,
 )
 
@@ -71,6 +80,61 @@ def test_get_and_store_library_version_documentation_urls_for_version_no_content
     assert library_version.documentation_url == old_documentation_url
 
 
+@patch("libraries.tasks.get_s3_client")
+@patch("libraries.tasks.get_content_from_s3")
+def test_get_and_store_library_version_documentation_urls_batched(
+    mock_get_content, mock_get_s3_client, django_assert_max_num_queries, tp
+):
+    version = baker.make("versions.Version", name="boost-1.56.0")
+    listed = [
+        baker.make(
+            "libraries.LibraryVersion",
+            version=version,
+            library__name=f"Library {i}",
+            library__slug=f"library-{i}",
+        )
+        for i in range(5)
+    ]
+    exception = baker.make(
+        "libraries.LibraryVersion",
+        version=version,
+        library__name="Circular Buffer",
+        library__slug="circular-buffer",
+    )
+    unlisted = baker.make(
+        "libraries.LibraryVersion",
+        version=version,
+        library__name="Unlisted",
+        library__slug="unlisted",
+    )
+    items = "".join(
+        f'<li><a href="library_{i}/index.html">Library {i}</a></li>' for i in range(5)
+    )
+    mock_get_content.return_value = {
+        "content": f"""
+        <h2>Libraries Listed <a name="Alphabetically">Alphabetically</a></h2>
+        <ul>{items}</ul>
+        """
+    }
+    s3_client = mock_get_s3_client.return_value
+
+    with django_assert_max_num_queries(8):
+        get_and_store_library_version_documentation_urls_for_version(version.pk)
+
+    for i, library_version in enumerate(listed):
+        library_version.refresh_from_db()
+        assert library_version.documentation_url == (
+            f"/doc/libs/boost_1_56_0/libs/library_{i}/index.html"
+        )
+    exception.refresh_from_db()
+    assert "circular_buffer" in exception.documentation_url
+    unlisted.refresh_from_db()
+    assert not unlisted.documentation_url
+    # Only the exception URL is validated, with HEAD requests
+    assert s3_client.head_object.called
+    s3_client.get_object.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "library_slug, version_name, expected_result",
     [
@@ -110,3 +174,35 @@ def test_version_missing_docs(version, version_name, expected):
     version.save()
     result = version_missing_docs(version)
     assert result == expected
+
+
+@pytest.fixture
+def description_status_key(library):
+    key = get_description_status_key(library, "boost-1.85.0")
+    cache.delete(key)
+    yield key
+    cache.delete(key)
+
+
+@patch("libraries.tasks.update_library_description.delay")
+def test_queue_library_description(mock_delay, library, description_status_key):
+    queue_library_description(library, "boost-1.85.0")
+    queue_library_description(library, "boost-1.85.0")
+    mock_delay.assert_called_once_with(library.pk, "boost-1.85.0")
+    assert get_library_description_status(library, "boost-1.85.0") == (
+        DESCRIPTION_PENDING
+    )
+
+
+@pytest.mark.parametrize(
+    "description, status", [("<p>Arrays</p>", None), (None, DESCRIPTION_MISSING)]
+)
+def test_update_library_description(
+    description, status, library, description_status_key
+):
+    with patch(
+        "libraries.models.Library.get_description", return_value=description
+    ) as mock_get_description:
+        queue_library_description(library, "boost-1.85.0")
+    mock_get_description.assert_called_once()
+    assert get_library_description_status(library, "boost-1.85.0") == status
@@ -1,11 +1,14 @@
 import datetime
+from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 
 from model_bakery import baker
 
 from ..constants import README_MISSING
 from ..models import Library
+from ..tasks import get_description_status_key
 from versions.models import Version
 
 
@@ -106,6 +109,23 @@ def test_library_list_select_category(library_version, category, tp):
     assert new_lib_version not in res.context["object_list"]
 
 
+def test_library_list_cached(library_version, tp):
+    """GET /libraries/latest/grid/ renders the list from the cache"""
+    url = "/libraries/latest/grid/"
+    res = tp.get(url)
+    tp.response_200(res)
+    assert library_version.library.name in res.content.decode()
+
+    # Saving a library makes the cached list stale
+    Library.objects.filter(pk=library_version.library.pk).update(name="Renamed")
+    res = tp.get(url)
+    assert "Renamed" not in res.content.decode()
+    library_version.library.refresh_from_db()
+    library_version.library.save()
+    res = tp.get(url)
+    assert "Renamed" in res.content.decode()
+
+
 @pytest.mark.skip(
     reason="This test is failing due to the way the library list is being filtered"
 )
@@ -324,14 +344,40 @@ def test_libraries_by_version_detail_no_version_found(tp, library_version):
 def test_library_detail_context_missing_readme(tp, user, library_version):
     """
     GET /library/latest/{library_slug}/
-    Test that the missing readme message appears as expected
+    Test that the missing readme message appears as expected, once the description
+    has been looked up in the background
     """
 
     library = library_version.library
+    status_key = get_description_status_key(library, library_version.version.name)
+    cache.delete(status_key)
     url = tp.reverse("library-detail", "latest", library.slug)
 
-    response = tp.get(url)
+    with patch("libraries.models.Library.get_description", return_value=None):
+        response = tp.get(url)
+        tp.response_200(response)
+        assert response.context["description_pending"]
+
+        url = tp.reverse("library-description", "latest", library.slug)
+        response = tp.get(url)
+    cache.delete(status_key)
 
     tp.response_200(response)
     assert "description" in response.context
     assert response.context["description"] == README_MISSING
+
+
+def test_library_description(tp, library_version):
+    """GET /library/{version_slug}/{library_slug}/description/"""
+    library = library_version.library
+    version = library_version.version
+    baker.make(
+        "core.RenderedContent",
+        cache_key=library.get_description_cache_key(version.name),
+        content_html="<p>N-dimensional arrays</p>",
+    )
+    url = tp.reverse("library-description", version.slug, library.slug)
+    response = tp.get(url)
+    tp.response_200(response)
+    assert "N-dimensional arrays" in response.content.decode()
+    assert "hx-get" not in response.content.decode()
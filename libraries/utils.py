@@ -20,7 +20,7 @@ from libraries.constants import (
     DEVELOP_RELEASE_URL_PATH_STR,
     MASTER_RELEASE_URL_PATH_STR,
 )
-from versions.models import Version
+from versions.cache import get_dropdown_versions
 
 logger = structlog.get_logger()
 
@@ -152,7 +152,7 @@ def determine_selected_boost_version(request_value, request):
         version_args = {f"allow_{version_slug}": True}
 
     valid_versions = getattr(request, "extra_context", {}).get(
-        "versions", Version.objects.get_dropdown_versions(**version_args)
+        "versions", get_dropdown_versions(**version_args)
     )
     if version_slug in [v.slug for v in valid_versions] + [LATEST_RELEASE_URL_PATH_STR]:
         return version_slug
@@ -166,7 +166,7 @@ def set_selected_boost_version(version_slug: str, response) -> None:
     if version_slug in [MASTER_RELEASE_URL_PATH_STR, DEVELOP_RELEASE_URL_PATH_STR]:
         versions_kwargs[f"allow_{version_slug}"] = True
 
-    valid_versions = Version.objects.get_dropdown_versions(**versions_kwargs)
+    valid_versions = get_dropdown_versions(**versions_kwargs)
     if version_slug in [v.slug for v in valid_versions]:
         response.set_cookie(SELECTED_BOOST_VERSION_COOKIE_NAME, version_slug)
     elif version_slug == LATEST_RELEASE_URL_PATH_STR:
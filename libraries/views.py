@@ -1,21 +1,24 @@
 import datetime
 import structlog
 
+from django.conf import settings
 from django.contrib import messages
-from django.db.models import F, Count, Prefetch
+from django.db.models import F, Prefetch
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.utils import timezone
 from django.utils.decorators import method_decorator
+from django.utils.functional import SimpleLazyObject
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import DetailView, ListView, FormView, TemplateView
 
-from core.githubhelper import GithubAPIClient
 from versions.exceptions import BoostImportedDataException
+from versions.cache import get_current_release
 from versions.models import Version
 
+from .cache import get_library_data_generation
 from .constants import README_MISSING
 from .forms import CommitAuthorEmailForm
 from .mixins import VersionAlertMixin, BoostVersionMixin, ContributorMixin
@@ -25,6 +28,11 @@ from .models import (
     LibraryVersion,
     CommitAuthorEmail,
 )
+from .tasks import (
+    DESCRIPTION_MISSING,
+    get_library_description_status,
+    queue_library_description,
+)
 from .utils import (
     get_view_from_cookie,
     set_view_in_cookie,
@@ -76,7 +84,7 @@ class LibraryListBase(BoostVersionMixin, VersionAlertMixin, ListView):
             self.kwargs.get("version_slug"), self.request
         )
         if version_slug == LATEST_RELEASE_URL_PATH_STR:
-            version = Version.objects.most_recent()
+            version = get_current_release(self.request)
             if not version:
                 messages.add_message(
                     self.request,
@@ -101,6 +109,10 @@ class LibraryListBase(BoostVersionMixin, VersionAlertMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**self.kwargs)
+        # The library list and the categories are rendered inside {% cache %} tags,
+        # so their queries only run on a cache miss.
+        context["library_data_generation"] = get_library_data_generation()
+        context["library_list_cache_timeout"] = settings.LIBRARY_LIST_CACHE_TIMEOUT
         context["categories"] = self.get_categories(context["selected_version"])
         # todo: add tests for sort order
         if self.kwargs.get("category_slug"):
@@ -167,8 +179,10 @@ class LibraryCategorized(LibraryListBase):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["library_versions_by_category"] = self.get_results_by_category(
-            version=context.get("selected_version")
+        context["library_versions_by_category"] = SimpleLazyObject(
+            lambda: self.get_results_by_category(
+                version=context.get("selected_version")
+            )
         )
         return context
 
@@ -211,6 +225,24 @@ class LibraryCategorized(LibraryListBase):
         return results_by_category
 
 
+def get_library_description_context(library, tag):
+    """Return the rendered description of a library at a tag.
+
+    On a cache miss, the description is rendered by a task and
+    `description_pending` is set, so that the page shows a placeholder that
+    LibraryDescription replaces once the description is ready.
+    """
+    description = library.get_cached_description(tag=tag)
+    if description:
+        return {"description": description, "description_pending": False}
+    status = get_library_description_status(library, tag)
+    if status == DESCRIPTION_MISSING:
+        return {"description": README_MISSING, "description_pending": False}
+    if status is None:
+        queue_library_description(library, tag)
+    return {"description": None, "description_pending": True}
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class LibraryDetail(VersionAlertMixin, BoostVersionMixin, ContributorMixin, DetailView):
     """Display a single Library in insolation"""
@@ -254,11 +286,15 @@ class LibraryDetail(VersionAlertMixin, BoostVersionMixin, ContributorMixin, Deta
             context["dependency_diff"] = {}
             context["dependencies_not_calculated"] = True
 
-        # Populate the library description
-        client = GithubAPIClient(repo_slug=self.object.github_repo)
-        context["description"] = (
-            self.object.get_description(client, tag=context["selected_version"].name)
-            or README_MISSING
+        # Populate the library description, or a placeholder loading it when it has
+        # to be rendered first
+        context.update(
+            get_library_description_context(
+                self.object, context["selected_version"].name
+            )
+        )
+        context["version_slug"] = self.kwargs.get(
+            "version_slug", LATEST_RELEASE_URL_PATH_STR
         )
         return context
 
@@ -274,13 +310,13 @@ class LibraryDetail(VersionAlertMixin, BoostVersionMixin, ContributorMixin, Deta
                 library=self.object,
                 version__in=Version.objects.minor_versions(),
             )
-            .annotate(count=Count("commit"), version_name=F("version__name"))
+            .annotate(version_name=F("version__name"))
             .order_by("-version__name")
         )[:20]
         return [
             {
                 "release": x.version_name.strip("boost-"),
-                "commit_count": x.count,
+                "commit_count": x.commit_count,
             }
             for x in reversed(list(qs))
         ]
@@ -318,7 +354,7 @@ class LibraryDetail(VersionAlertMixin, BoostVersionMixin, ContributorMixin, Deta
         if not version_slug:
             version_slug = get_version_from_cookie(self.request)
         if not version_slug or version_slug == LATEST_RELEASE_URL_PATH_STR:
-            return Version.objects.most_recent()
+            return get_current_release(self.request)
         return get_object_or_404(Version, slug=version_slug)
 
     def dispatch(self, request, *args, **kwargs):
@@ -340,6 +376,28 @@ class LibraryDetail(VersionAlertMixin, BoostVersionMixin, ContributorMixin, Deta
         return response
 
 
+class LibraryDescription(TemplateView):
+    """Returns the description of a library for the htmx placeholder of the
+    library detail page, or the placeholder again while it's being rendered."""
+
+    template_name = "libraries/includes/description.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        library = get_object_or_404(Library, slug=self.kwargs["library_slug"])
+        version_slug = self.kwargs["version_slug"]
+        if version_slug == LATEST_RELEASE_URL_PATH_STR:
+            version = get_current_release(self.request)
+            if not version:
+                raise Http404("No version found")
+        else:
+            version = get_object_or_404(Version, slug=version_slug)
+        context["object"] = library
+        context["version_slug"] = version_slug
+        context.update(get_library_description_context(library, version.name))
+        return context
+
+
 class CommitAuthorEmailCreateView(FormView):
     template_name = "libraries/profile_commit_email_address_form.html"
     form_class = CommitAuthorEmailForm
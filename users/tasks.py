@@ -1,5 +1,3 @@
-from time import sleep
-
 import structlog
 
 from django.contrib.auth import get_user_model
@@ -54,9 +52,8 @@ def refresh_users_github_photos():
     for user in users:
         try:
             logger.info(f"updating {user.pk=}")
+            # GitHub calls are throttled by the shared rate limiter
             update_user_github_photo.delay(user.pk)
-            # not strictly necessary, but helps to avoid hammering the GitHub API
-            sleep(0.5)
         except UserMissingGithubUsername:
             logger.warning(
                 "users_tasks_refresh_gh_photos_no_github_username",
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VersionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "versions"
+
+    def ready(self):
+        import versions.signals  # noqa
@@ -0,0 +1,151 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from libraries.constants import (
+    DEVELOP_RELEASE_URL_PATH_STR,
+    MASTER_RELEASE_URL_PATH_STR,
+)
+
+from .models import Version
+
+CURRENT_RELEASE_GENERATION_KEY = "current-release-generation"
+DROPDOWN_VERSIONS_CACHE_KEY = "dropdown-versions"
+
+_lock = threading.Lock()
+_current_release = {}
+
+
+def get_generation() -> int:
+    return cache.get(CURRENT_RELEASE_GENERATION_KEY, 0)
+
+
+def get_current_release(request=None) -> Version | None:
+    """Return `Version.objects.most_recent()`, cached.
+
+    The result is memoized on `request` when one is passed, and kept in the process
+    for `settings.CURRENT_RELEASE_CACHE_TIMEOUT` seconds. Saving or deleting a
+    Version changes a generation marker in the default cache, which drops the
+    cached release in every process (see versions.signals).
+    """
+    if request is not None and hasattr(request, "_current_release"):
+        return request._current_release
+
+    generation = get_generation()
+    with _lock:
+        cached = dict(_current_release)
+    if (
+        cached
+        and cached["generation"] == generation
+        and cached["expires"] > time.monotonic()
+    ):
+        version = cached["version"]
+    else:
+        version = Version.objects.most_recent()
+        with _lock:
+            _current_release.update(
+                version=version,
+                generation=generation,
+                expires=time.monotonic() + settings.CURRENT_RELEASE_CACHE_TIMEOUT,
+            )
+
+    if request is not None:
+        request._current_release = version
+    return version
+
+
+def clear_current_release():
+    """Drop the cached current release in this and every other process."""
+    with _lock:
+        _current_release.clear()
+    cache.set(CURRENT_RELEASE_GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+@dataclass(frozen=True)
+class DropdownVersion:
+    """The fields of a Version shown in the version drop-down."""
+
+    id: int
+    name: str
+    slug: str
+    has_library: int | None = None
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def display_name(self):
+        return self.name.replace("boost-", "")
+
+
+def build_dropdown_versions() -> dict:
+    """Return the drop-down versions with a bitmap of their libraries.
+
+    `versions` holds (id, name, slug) for every version that can appear in the
+    drop-down, master and develop included. `libraries` maps a library id to an int
+    whose bit `i` is set when the library is part of `versions[i]`.
+    """
+    from libraries.models import LibraryVersion
+
+    versions = list(
+        Version.objects.get_dropdown_versions(
+            allow_develop=True, allow_master=True
+        ).values_list("id", "name", "slug")
+    )
+    positions = {version_id: i for i, (version_id, _, _) in enumerate(versions)}
+    libraries = {}
+    library_versions = LibraryVersion.objects.filter(
+        version_id__in=positions
+    ).values_list("library_id", "version_id")
+    for library_id, version_id in library_versions:
+        libraries[library_id] = libraries.get(library_id, 0) | (
+            1 << positions[version_id]
+        )
+    return {"versions": versions, "libraries": libraries}
+
+
+def get_dropdown_versions(
+    *,
+    allow_develop: bool = False,
+    allow_master: bool = False,
+    flag_versions_without_library: "Library" = None,  # noqa: F821
+) -> list[DropdownVersion]:
+    """Cached `Version.objects.get_dropdown_versions()`, for rendering.
+
+    The drop-down is rebuilt after a Version or LibraryVersion changes (see
+    versions.signals). When `flag_versions_without_library` is passed, each version
+    has `has_library` set to 1 if it includes that library and to 0 otherwise.
+    """
+    data = cache.get(DROPDOWN_VERSIONS_CACHE_KEY)
+    if data is None:
+        data = build_dropdown_versions()
+        cache.set(DROPDOWN_VERSIONS_CACHE_KEY, data, timeout=None)
+
+    excluded_names = set()
+    if not allow_develop:
+        excluded_names.add(DEVELOP_RELEASE_URL_PATH_STR)
+    if not allow_master:
+        excluded_names.add(MASTER_RELEASE_URL_PATH_STR)
+    bitmap = None
+    if flag_versions_without_library:
+        bitmap = data["libraries"].get(flag_versions_without_library.id, 0)
+
+    return [
+        DropdownVersion(
+            id=version_id,
+            name=name,
+            slug=slug,
+            has_library=None if bitmap is None else (bitmap >> i) & 1,
+        )
+        for i, (version_id, name, slug) in enumerate(data["versions"])
+        if name not in excluded_names
+    ]
+
+
+def clear_dropdown_versions():
+    """Rebuild the version drop-down on its next use."""
+    cache.delete(DROPDOWN_VERSIONS_CACHE_KEY)
@@ -1,7 +1,5 @@
 from django.db import models
-from django.db.models import Func, Value, Count, Q
-from django.db.models.functions import Replace
-from django.contrib.postgres.fields import ArrayField
+from django.db.models import Count, Q
 
 from libraries.constants import (
     MASTER_RELEASE_URL_PATH_STR,
@@ -31,9 +29,9 @@ class VersionQuerySet(models.QuerySet):
         return self.active().filter(beta=True).order_by("-name").first()
 
     def with_version_split(self):
-        """Separates name into an array of [major, minor, patch].
+        """Returns versions with a name of the form [boost-]major.minor.patch.
 
-        Anything not matching the regex is removed from the queryset.
+        version_array, major, minor and patch are stored on save.
 
         Example:
             name = boost-1.85.0
@@ -43,20 +41,7 @@ class VersionQuerySet(models.QuerySet):
             patch -> 0
 
         """
-        return self.filter(name__regex=r"^(boost-)?\d+\.\d+\.\d+$").annotate(
-            simple_version=Replace("name", Value("boost-"), Value("")),
-            version_array=Func(
-                "simple_version",
-                Value(r"\."),
-                function="regexp_split_to_array",
-                template="(%(function)s(%(expressions)s)::int[])",
-                arity=2,
-                output_field=ArrayField(models.IntegerField()),
-            ),
-            major=models.F("version_array__0"),
-            minor=models.F("version_array__1"),
-            patch=models.F("version_array__2"),
-        )
+        return self.filter(version_array__isnull=False)
 
 
 class VersionManager(models.Manager):
@@ -112,7 +97,9 @@ class VersionManager(models.Manager):
             Returns bool for whether to show beta version in dropdown. Returns True only
             when the most recent beta version is newer than the most recent full release
             """
-            most_recent = self.most_recent()
+            from versions.cache import get_current_release
+
+            most_recent = get_current_release()
             if not most_recent_beta or most_recent is None:
                 return False
 
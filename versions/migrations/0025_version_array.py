@@ -0,0 +1,43 @@
+# Generated by Django 4.2.24 on 2026-10-19 00:08
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("versions", "0024_alter_versionfile_checksum_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="version",
+            name="major",
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="version",
+            name="minor",
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="version",
+            name="patch",
+            field=models.IntegerField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="version",
+            name="version_array",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                db_index=True,
+                editable=False,
+                null=True,
+                size=None,
+            ),
+        ),
+    ]
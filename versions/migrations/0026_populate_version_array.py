@@ -0,0 +1,30 @@
+import re
+
+from django.db import migrations
+
+VERSION_ARRAY_RE = re.compile(r"^(?:boost-)?(\d+)\.(\d+)\.(\d+)$")
+
+
+def populate_version_array(apps, schema_editor):
+    Version = apps.get_model("versions", "Version")
+
+    versions = []
+    for version in Version.objects.all():
+        match = VERSION_ARRAY_RE.match(version.name)
+        if not match:
+            continue
+        version.version_array = [int(x) for x in match.groups()]
+        version.major, version.minor, version.patch = version.version_array
+        versions.append(version)
+    Version.objects.bulk_update(versions, ["version_array", "major", "minor", "patch"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("versions", "0025_version_array"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_version_array, migrations.RunPython.noop)
+    ]
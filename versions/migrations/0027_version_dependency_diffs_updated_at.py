@@ -0,0 +1,95 @@
+# Generated by Django 4.2.24 on 2026-10-19 01:12
+
+import re
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def version_parts(name):
+    """Version.cleaned_version_parts_int"""
+    cleaned = re.sub(r"^[^0-9]*", "", name or "").split("beta")[0]
+    return [int(x) if x.isdigit() else 0 for x in cleaned.split(".") if x]
+
+
+def backfill_dependency_diffs(apps, schema_editor):
+    """Store the dependency diffs of every version, as
+    Version.update_dependency_diffs() does."""
+    DependencyDiff = apps.get_model("libraries", "DependencyDiff")
+    LibraryVersion = apps.get_model("libraries", "LibraryVersion")
+    Version = apps.get_model("versions", "Version")
+
+    library_ids = defaultdict(set)
+    for version_id, library_id in LibraryVersion.objects.values_list(
+        "version", "library"
+    ):
+        library_ids[version_id].add(library_id)
+    Dependency = LibraryVersion.dependencies.through
+    dependencies = defaultdict(set)
+    for version_id, library_id, dependency_id in Dependency.objects.values_list(
+        "libraryversion__version", "libraryversion__library", "library"
+    ):
+        dependencies[version_id, library_id].add(dependency_id)
+    minor_versions = sorted(
+        Version.objects.filter(patch=0, version_array__isnull=False).values_list(
+            "version_array", "id"
+        )
+    )
+
+    rows = []
+    for version_id, name in Version.objects.values_list("id", "name"):
+        parts = version_parts(name)
+        previous = [pk for version_array, pk in minor_versions if version_array < parts]
+        if not previous:
+            continue
+        previous_id = previous[-1]
+        version_rows = []
+        dependencies_count = 0
+        for library_id in library_ids[version_id] & library_ids[previous_id]:
+            old = dependencies[previous_id, library_id]
+            current = dependencies[version_id, library_id]
+            dependencies_count += len(current)
+            for dependency_id in old | current:
+                if dependency_id not in old:
+                    change = "added"
+                elif dependency_id not in current:
+                    change = "removed"
+                else:
+                    change = "unchanged"
+                version_rows.append(
+                    DependencyDiff(
+                        version_id=version_id,
+                        library_id=library_id,
+                        dependency_id=dependency_id,
+                        change=change,
+                    )
+                )
+        # Like compute_dependency_diffs(), which finds nothing in that case
+        if dependencies_count:
+            rows.extend(version_rows)
+
+    DependencyDiff.objects.all().delete()
+    DependencyDiff.objects.bulk_create(rows, batch_size=1000)
+    Version.objects.update(dependency_diffs_updated_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("versions", "0026_populate_version_array"),
+        ("libraries", "0035_dependencydiff"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="version",
+            name="dependency_diffs_updated_at",
+            field=models.DateTimeField(
+                editable=False,
+                help_text="When update_dependency_diffs() last stored the dependency diffs.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_dependency_diffs, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 import re
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.text import slugify
 
@@ -12,6 +15,9 @@ from .utils.model_validators import validate_version_name_format
 
 User = get_user_model()
 
+VERSION_ARRAY_RE = re.compile(r"^(?:boost-)?(\d+)\.(\d+)\.(\d+)$")
+VERSION_ARRAY_FIELDS = ["version_array", "major", "minor", "patch"]
+
 
 class Version(models.Model):
     name = models.CharField(
@@ -43,6 +49,18 @@ class Version(models.Model):
         default=False,
         help_text="Whether this version has been fully imported and is ready for use.",
     )
+    # [major, minor, patch] for names like boost-1.85.0, set on save
+    version_array = ArrayField(
+        models.IntegerField(), null=True, blank=True, editable=False, db_index=True
+    )
+    major = models.IntegerField(null=True, blank=True, editable=False)
+    minor = models.IntegerField(null=True, blank=True, editable=False)
+    patch = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
+    dependency_diffs_updated_at = models.DateTimeField(
+        null=True,
+        editable=False,
+        help_text="When update_dependency_diffs() last stored the dependency diffs.",
+    )
     objects = VersionManager()
 
     def __str__(self):
@@ -51,8 +69,19 @@ class Version(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = self.get_slug()
+        self.set_version_array()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, *VERSION_ARRAY_FIELDS}
         return super(Version, self).save(*args, **kwargs)
 
+    def set_version_array(self):
+        """Split a name like boost-1.85.0 into version_array, major, minor and
+        patch. They are left empty for other names (betas, master, develop)."""
+        match = VERSION_ARRAY_RE.match(self.name or "")
+        self.version_array = [int(x) for x in match.groups()] if match else None
+        self.major, self.minor, self.patch = self.version_array or (None, None, None)
+
     def get_absolute_url(self):
         return reverse("release-detail", args=[to_url(str(self.slug))])
 
@@ -62,7 +91,7 @@ class Version(models.Model):
         name = self.name.replace(".", " ").replace("boost_", "")
         return slugify(name)[:50]
 
-    def get_dependency_diffs(self, library=None):
+    def compute_dependency_diffs(self, library=None):
         """Computes added, removed and unchanged dependencies.
 
         - Computed for all LibraryVersion models, between this Version and the
@@ -128,6 +157,85 @@ class Version(models.Model):
             raise BoostImportedDataException(msg)
         return diffs
 
+    def update_dependency_diffs(self):
+        """Store the result of compute_dependency_diffs() as DependencyDiff rows."""
+        from libraries.models import DependencyDiff
+
+        try:
+            diffs = self.compute_dependency_diffs()
+        except BoostImportedDataException:
+            diffs = {}
+        rows = []
+        for diff in diffs.values():
+            for dependency in diff["both"]:
+                if dependency.name in diff["added"]:
+                    change = DependencyDiff.ADDED
+                elif dependency.name in diff["removed"]:
+                    change = DependencyDiff.REMOVED
+                else:
+                    change = DependencyDiff.UNCHANGED
+                rows.append(
+                    DependencyDiff(
+                        version=self,
+                        library_id=diff["library_id"],
+                        dependency=dependency,
+                        change=change,
+                    )
+                )
+        with transaction.atomic():
+            DependencyDiff.objects.filter(version=self).delete()
+            DependencyDiff.objects.bulk_create(rows)
+            self.dependency_diffs_updated_at = timezone.now()
+            self.__class__.objects.filter(pk=self.pk).update(
+                dependency_diffs_updated_at=self.dependency_diffs_updated_at
+            )
+        return len(rows)
+
+    def get_dependency_diffs(self, library=None):
+        """Returns the added, removed and unchanged dependencies stored by
+        update_dependency_diffs(), in the format of compute_dependency_diffs().
+
+        If library is given, the query is constrained to only one library. The
+        diffs of a version they were never stored for are computed with
+        compute_dependency_diffs().
+
+        """
+        if self.dependency_diffs_updated_at is None:
+            return self.compute_dependency_diffs(library=library)
+        from libraries.models import DependencyDiff
+
+        rows = (
+            DependencyDiff.objects.filter(version=self)
+            .select_related("library", "dependency")
+            .order_by(Lower("dependency__name"))
+        )
+        if library:
+            rows = rows.filter(library=library)
+        diffs = {}
+        for row in rows:
+            diff = diffs.setdefault(
+                row.library.name,
+                {
+                    "library_id": row.library_id,
+                    "added": [],
+                    "removed": [],
+                    "previous_dependencies": [],
+                    "current_dependencies": [],
+                    "both": [],
+                },
+            )
+            diff["both"].append(row.dependency)
+            if row.change != DependencyDiff.ADDED:
+                diff["previous_dependencies"].append(row.dependency)
+            if row.change != DependencyDiff.REMOVED:
+                diff["current_dependencies"].append(row.dependency)
+            if row.change in (DependencyDiff.ADDED, DependencyDiff.REMOVED):
+                diff[row.change].append(row.dependency.name)
+        if not diffs and (library is None or not self.dependency_diffs.exists()):
+            msg = "No dependencies found for libraries in this version."
+            raise BoostImportedDataException(msg)
+        return diffs
+
     @cached_property
     def display_name(self):
         return self.name.replace("boost-", "")
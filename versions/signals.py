@@ -0,0 +1,29 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from libraries.cache import bump_library_data_generation
+from versions.cache import clear_current_release, clear_dropdown_versions
+from versions.models import Version
+
+
+@receiver(post_save, sender=Version)
+@receiver(post_delete, sender=Version)
+def invalidate_current_release(sender, instance, **kwargs):
+    """Make the next request look up the current release again."""
+    clear_current_release()
+
+
+@receiver(post_save, sender=Version)
+@receiver(post_delete, sender=Version)
+@receiver(post_save, sender="libraries.LibraryVersion")
+@receiver(post_delete, sender="libraries.LibraryVersion")
+def invalidate_dropdown_versions(sender, instance, **kwargs):
+    """Rebuild the version drop-down, which flags the libraries of each version."""
+    clear_dropdown_versions()
+
+
+@receiver(post_save, sender=Version)
+@receiver(post_delete, sender=Version)
+def invalidate_library_data(sender, instance, **kwargs):
+    """Make the cached library lists, which show version details, stale."""
+    bump_library_data_generation()
@@ -10,11 +10,19 @@ from django.core.management import call_command
 from fastcore.xtras import obj2dict
 
 from core.githubhelper import GithubAPIClient, GithubDataParser
+from libraries.cache import (
+    bump_library_data_generation,
+    clear_featured_library_versions,
+)
 from libraries.constants import SKIP_LIBRARY_VERSIONS
 from libraries.github import LibraryUpdater
 from libraries.models import Library, LibraryVersion
-from libraries.tasks import get_and_store_library_version_documentation_urls_for_version
+from libraries.tasks import (
+    get_and_store_library_version_documentation_urls_for_version,
+    queue_library_description,
+)
 from libraries.utils import version_within_range
+from versions.cache import clear_dropdown_versions
 from versions.models import Version
 from versions.releases import (
     store_release_notes_for_in_progress,
@@ -292,50 +300,42 @@ def import_library_versions(version_name, token=None, version_type="tag"):
 
     gitmodules = parser.parse_gitmodules(raw_gitmodules.decode("utf-8"))
 
-    # For each gitmodule, gets its libraries.json file and save the libraries
-    # to the version
+    gitmodules = [
+        gitmodule
+        for gitmodule in gitmodules
+        if gitmodule["module"] not in updater.skip_modules
+        and not skip_library_version(gitmodule["module"], version_name)
+    ]
+    # libraries.json files are fetched by the submodule commit the version points
+    # at, so files shared with previously imported versions aren't downloaded again.
+    try:
+        submodule_shas = client.get_submodule_shas(ref=ref)
+    except Exception as e:
+        logger.warning(
+            "import_library_versions_submodule_shas_failed",
+            version_name=version_name,
+            exc_msg=str(e),
+        )
+        submodule_shas = {}
+    all_libraries_json = updater.get_libraries_json_for_submodules(
+        [
+            (gitmodule["module"], submodule_shas.get(gitmodule.get("path")))
+            for gitmodule in gitmodules
+        ],
+        tag=version_name,
+    )
+
+    # Collect the libraries from each gitmodule's libraries.json file, then save them
+    # to the version in bulk
     library_keys = []
-    for gitmodule in gitmodules:
+    libraries_data = {}
+    library_modules = {}
+    modules_without_json = {}
+    for gitmodule, libraries_json in zip(gitmodules, all_libraries_json):
         library_name = gitmodule["module"]
-        if library_name in updater.skip_modules:
-            continue
-
-        if skip_library_version(library_name, version_name):
-            continue
-
-        try:
-            libraries_json = client.get_libraries_json(
-                repo_slug=library_name, tag=version_name
-            )
-        except (
-            requests.exceptions.JSONDecodeError,
-            requests.exceptions.HTTPError,
-            Exception,
-        ):
-            # Can happen with older releases
-            library_version = save_library_version_by_library_key(
-                library_name, version, gitmodule
-            )
-
-            logger.info(
-                f"import_library_versions_by_library {version_name=} "
-                f"{library_name=} {library_version=} "
-            )
-
-            continue
-
         if not libraries_json:
-            # Can happen with older releases -- we try to catch all exceptions
-            # so this is just in case
-            library_version = save_library_version_by_library_key(
-                library_name, version, gitmodule
-            )
-
-            if not library_version:
-                logger.info(
-                    f"import_library_versions_skipped_library "
-                    f"{version_name=} {library_name=}"
-                )
+            # Can happen with older releases
+            modules_without_json[library_name] = gitmodule
             continue
 
         libraries = (
@@ -361,27 +361,12 @@ def import_library_versions(version_name, token=None, version_type="tag"):
                     lib_data["name"] = exception.get("name", lib_data["name"])
                     break  # Stop checking exceptions if a match is found
 
-            library, _ = Library.objects.get_or_create(
-                key=lib_data["key"],
-                defaults={
-                    "name": lib_data.get("name"),
-                    "description": lib_data.get("description"),
-                    "data": lib_data,
-                },
-            )
-            library_version, _ = LibraryVersion.objects.update_or_create(
-                version=version,
-                library=library,
-                defaults={
-                    "data": lib_data,
-                    "cpp_standard_minimum": lib_data.get("cxxstd"),
-                    "description": lib_data.get("description"),
-                },
-            )
-            if not library.github_url:
-                github_data = client.get_repo(repo_slug=library_name)
-                library.github_url = github_data.get("html_url", "")
-                library.save()
+            libraries_data[lib_data["key"]] = lib_data
+            library_modules[lib_data["key"]] = library_name
+
+    save_library_versions(
+        version, libraries_data, library_modules, modules_without_json, client
+    )
 
     # For any libraries no longer in gitmodules we want to remove master and develop
     #  references from the library_versions list.
@@ -392,6 +377,10 @@ def import_library_versions(version_name, token=None, version_type="tag"):
     # Retrieve and store the docs url for each library-version in this release
     get_and_store_library_version_documentation_urls_for_version(version.pk)
 
+    # Render the library descriptions before the library pages are first viewed
+    for library in Library.objects.filter(library_version__version=version):
+        queue_library_description(library, version.name)
+
     # Load maintainers for library-versions
     call_command("update_maintainers", "--release", version.name)
 
@@ -490,16 +479,91 @@ def mark_fully_completed():
 # Helper functions
 
 
-def save_library_version_by_library_key(library_key, version, gitmodule={}):
-    """Saves a LibraryVersion instance by library key and version."""
-    try:
-        library = Library.objects.get(key=library_key)
-        library_version, _ = LibraryVersion.objects.update_or_create(
-            version=version, library=library, defaults={"data": gitmodule}
+def save_library_versions(
+    version, libraries_data, library_modules, modules_without_json, client
+):
+    """Create or update the LibraryVersions for a version in bulk.
+
+    :param version: the Version the libraries belong to
+    :param libraries_data: dict, parsed libraries.json data keyed by library key.
+        Libraries that don't exist yet are created.
+    :param library_modules: dict, the gitmodule name for each key in
+        `libraries_data`, used to look up the GitHub URL of new libraries
+    :param modules_without_json: dict, gitmodules without a libraries.json file keyed
+        by module name. Only libraries that already exist with that key are saved.
+    :param client: the GithubAPIClient used for the GitHub URL lookups
+    """
+    libraries = {
+        library.key: library
+        for library in Library.objects.filter(
+            key__in=[*libraries_data, *modules_without_json]
         )
-        return library_version
-    except Library.DoesNotExist:
-        return
+    }
+    for key, lib_data in libraries_data.items():
+        if key not in libraries:
+            # Saved one at a time, as Library.save() generates a unique slug
+            libraries[key] = Library.objects.create(
+                key=key,
+                name=lib_data.get("name"),
+                description=lib_data.get("description"),
+                data=lib_data,
+            )
+
+    library_version_fields = {}
+    for key, gitmodule in modules_without_json.items():
+        if key not in libraries:
+            logger.info(
+                f"import_library_versions_skipped_library {version.name=} {key=}"
+            )
+            continue
+        library_version_fields[libraries[key].pk] = {"data": gitmodule}
+    for key, lib_data in libraries_data.items():
+        library_version_fields[libraries[key].pk] = {
+            "data": lib_data,
+            "cpp_standard_minimum": lib_data.get("cxxstd"),
+            "description": lib_data.get("description"),
+        }
+
+    missing_github_url = [
+        libraries[key] for key in libraries_data if not libraries[key].github_url
+    ]
+    for library in missing_github_url:
+        github_data = client.get_repo(repo_slug=library_modules[library.key]) or {}
+        library.github_url = github_data.get("html_url", "")
+
+    existing = {
+        library_version.library_id: library_version
+        for library_version in LibraryVersion.objects.filter(
+            version=version, library_id__in=library_version_fields
+        )
+    }
+    to_create = []
+    for library_id, fields in library_version_fields.items():
+        library_version = existing.get(library_id)
+        if library_version is None:
+            to_create.append(
+                LibraryVersion(version=version, library_id=library_id, **fields)
+            )
+            continue
+        for field, value in fields.items():
+            setattr(library_version, field, value)
+
+    with transaction.atomic():
+        Library.objects.bulk_update(missing_github_url, ["github_url"])
+        LibraryVersion.objects.bulk_create(to_create)
+        LibraryVersion.objects.bulk_update(
+            existing.values(), ["data", "cpp_standard_minimum", "description"]
+        )
+    # bulk_create() doesn't send post_save
+    clear_dropdown_versions()
+    clear_featured_library_versions()
+    bump_library_data_generation()
+    logger.info(
+        "import_library_versions_saved",
+        version_name=version.name,
+        created=len(to_create),
+        updated=len(existing),
+    )
 
 
 def skip_tag(name, new=False):
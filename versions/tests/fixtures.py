@@ -5,6 +5,7 @@ import random
 
 from model_bakery import baker
 
+from versions.cache import clear_current_release, clear_dropdown_versions
 from versions.models import VersionFile
 
 
@@ -12,6 +13,16 @@ def fake_checksum():
     return hashlib.sha256(random.randbytes(200)).hexdigest()
 
 
+@pytest.fixture(autouse=True)
+def version_caches():
+    # Versions are rolled back between tests without sending signals
+    clear_current_release()
+    clear_dropdown_versions()
+    yield
+    clear_current_release()
+    clear_dropdown_versions()
+
+
 @pytest.fixture
 def beta_version(db):
     # Make version
@@ -0,0 +1,84 @@
+from django.test import RequestFactory
+from model_bakery import baker
+
+from libraries.cache import get_library_data_generation
+from versions.cache import get_current_release, get_dropdown_versions
+from versions.models import Version
+
+
+def test_get_current_release(
+    version, inactive_version, old_version, beta_version, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        assert get_current_release() == version
+        assert get_current_release() == version
+
+
+def test_get_current_release_memoized_on_request(version, django_assert_num_queries):
+    request = RequestFactory().get("/")
+    assert get_current_release(request) == version
+    with django_assert_num_queries(0):
+        assert get_current_release(request) == version
+
+
+def test_get_current_release_cleared_on_save(version):
+    assert get_current_release() == version
+    new_version = baker.make(
+        "versions.Version", name="boost-2.0.0", active=True, full_release=True
+    )
+    assert get_current_release() == new_version
+
+    new_version.delete()
+    assert get_current_release() == version
+
+
+def test_get_current_release_expires(version, settings):
+    settings.CURRENT_RELEASE_CACHE_TIMEOUT = 0
+    assert get_current_release() == version
+    # update() doesn't send post_save, so only the timeout refreshes the cache
+    Version.objects.filter(pk=version.pk).update(active=False)
+    assert get_current_release() is None
+
+
+def test_get_dropdown_versions(
+    version, old_version, inactive_version, library, django_assert_num_queries
+):
+    master = baker.make("versions.Version", name="master", full_release=False)
+    baker.make("libraries.LibraryVersion", library=library, version=old_version)
+
+    assert [v.name for v in get_dropdown_versions()] == [version.name, old_version.name]
+    assert [v.name for v in get_dropdown_versions(allow_master=True)] == [
+        master.name,
+        version.name,
+        old_version.name,
+    ]
+    with django_assert_num_queries(0):
+        versions = get_dropdown_versions(flag_versions_without_library=library)
+    assert [(v.slug, v.has_library) for v in versions] == [
+        (version.slug, 0),
+        (old_version.slug, 1),
+    ]
+
+
+def test_get_dropdown_versions_rebuilt_on_change(version, library):
+    assert (
+        get_dropdown_versions(flag_versions_without_library=library)[0].has_library == 0
+    )
+
+    baker.make("libraries.LibraryVersion", library=library, version=version)
+    assert (
+        get_dropdown_versions(flag_versions_without_library=library)[0].has_library == 1
+    )
+
+    new_version = baker.make("versions.Version", name="boost-2.0.0")
+    assert get_dropdown_versions()[0].id == new_version.id
+
+
+def test_library_data_generation_bumped_on_version_change(version):
+    generation = get_library_data_generation()
+    version.save()
+    assert get_library_data_generation() != generation
+
+    generation = get_library_data_generation()
+    version.delete()
+    assert get_library_data_generation() != generation
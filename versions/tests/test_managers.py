@@ -16,6 +16,16 @@ def test_most_recent_manager(version, inactive_version, old_version, beta_versio
     assert Version.objects.most_recent() == version
 
 
+def test_minor_versions_manager(version, beta_version):
+    baker.make("versions.Version", name="boost-1.79.1")
+    baker.make("versions.Version", name="develop")
+    assert list(Version.objects.minor_versions()) == [version]
+    assert (
+        Version.objects.minor_versions().filter(version_array__lt=[1, 80, 0]).get()
+        == version
+    )
+
+
 def test_most_recent_beta_manager(version, inactive_version, old_version, beta_version):
     assert Version.objects.most_recent_beta() == beta_version
 
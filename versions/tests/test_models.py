@@ -3,6 +3,8 @@ import pytest
 
 from model_bakery import baker
 
+from versions.exceptions import BoostImportedDataException
+
 
 def test_version_creation(version):
     today = datetime.date.today()
@@ -129,3 +131,72 @@ def test_review_results():
 
     pending_result.refresh_from_db()
     assert not pending_result.is_most_recent
+
+
+def test_dependency_diffs(django_assert_num_queries):
+    previous = baker.make("versions.Version", name="boost-1.84.0")
+    current = baker.make("versions.Version", name="boost-1.85.0")
+    library = baker.make("libraries.Library", name="Algorithm")
+    array, bind, core = [
+        baker.make("libraries.Library", name=name) for name in ["array", "Bind", "core"]
+    ]
+    baker.make(
+        "libraries.LibraryVersion",
+        library=library,
+        version=previous,
+        dependencies=[array, core],
+    )
+    baker.make(
+        "libraries.LibraryVersion",
+        library=library,
+        version=current,
+        dependencies=[bind, core],
+    )
+
+    # Computed when nothing is stored yet
+    assert current.get_dependency_diffs(
+        library=library
+    ) == current.compute_dependency_diffs(library=library)
+
+    assert current.update_dependency_diffs() == 3
+    with django_assert_num_queries(1):
+        diff = current.get_dependency_diffs(library=library)["Algorithm"]
+    assert diff == current.compute_dependency_diffs()["Algorithm"] | {
+        "added": ["Bind"],
+        "removed": ["array"],
+    }
+    assert diff["previous_dependencies"] == [array, core]
+    assert diff["current_dependencies"] == [bind, core]
+    assert diff["both"] == [array, bind, core]
+
+    with pytest.raises(BoostImportedDataException):
+        previous.get_dependency_diffs()
+
+    # Stored without any diffs, so not computed again
+    assert previous.update_dependency_diffs() == 0
+    with django_assert_num_queries(1), pytest.raises(BoostImportedDataException):
+        previous.get_dependency_diffs()
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("boost-1.85.0", [1, 85, 0]),
+        ("1.86.1", [1, 86, 1]),
+        ("boost-1.85.0.beta1", None),
+        ("develop", None),
+    ],
+)
+def test_version_array(name, expected):
+    version = baker.make("versions.Version", name=name)
+    version.refresh_from_db()
+    assert version.version_array == expected
+    assert [version.major, version.minor, version.patch] == (expected or [None] * 3)
+
+
+def test_version_array_updated_with_name(version):
+    version.name = "boost-2.0.0"
+    version.save(update_fields=["name"])
+    version.refresh_from_db()
+    assert version.version_array == [2, 0, 0]
+    assert version.major == 2
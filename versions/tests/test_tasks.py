@@ -1,6 +1,13 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
-from versions.tasks import get_release_date_for_version, skip_tag
+from model_bakery import baker
+from versions.tasks import (
+    get_release_date_for_version,
+    save_library_versions,
+    skip_tag,
+)
+
+from libraries.models import Library, LibraryVersion
 
 import pytest
 
@@ -49,3 +56,45 @@ def test_skip_tag(version):
 
     # Assert a random tag name is not skipped
     assert skip_tag("sample") is False
+
+
+def test_save_library_versions(
+    version, library_version, github_api_client, django_assert_max_num_queries
+):
+    library = library_version.library
+    library.key = "multi_array"
+    library.save()
+    old_library = baker.make("libraries.Library", key="old", github_url="url")
+    github_api_client.get_repo.return_value = {"html_url": "https://github.com/x"}
+    libraries_data = {
+        "multi_array": {"key": "multi_array", "name": "Multi Array", "cxxstd": "11"},
+        "new": {"key": "new", "name": "New", "description": "A new library"},
+    }
+
+    with django_assert_max_num_queries(12):
+        save_library_versions(
+            version,
+            libraries_data,
+            {"multi_array": "multi_array", "new": "new_module"},
+            {"old": {"module": "old"}, "unknown": {"module": "unknown"}},
+            github_api_client,
+        )
+
+    library_version.refresh_from_db()
+    assert library_version.data == libraries_data["multi_array"]
+    assert library_version.cpp_standard_minimum == "11"
+
+    new_library = Library.objects.get(key="new")
+    assert new_library.slug == "new"
+    assert new_library.github_url == "https://github.com/x"
+    github_api_client.get_repo.assert_called_once_with(repo_slug="new_module")
+    new_library_version = LibraryVersion.objects.get(
+        version=version, library=new_library
+    )
+    assert new_library_version.description == "A new library"
+
+    old_library_version = LibraryVersion.objects.get(
+        version=version, library=old_library
+    )
+    assert old_library_version.data == {"module": "old"}
+    assert not Library.objects.filter(key="unknown").exists()
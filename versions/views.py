@@ -4,7 +4,7 @@ from django.db.models.query import QuerySet
 from itertools import groupby
 from operator import attrgetter
 
-from django.db.models import Q, Count
+from django.db.models import F
 from django.http import HttpResponse
 from django.views import View
 from django.views.generic import DetailView, TemplateView, ListView
@@ -17,13 +17,14 @@ from django.views.decorators.csrf import csrf_exempt
 from core.models import RenderedContent
 from libraries.constants import LATEST_RELEASE_URL_PATH_STR
 from libraries.mixins import VersionAlertMixin, BoostVersionMixin
-from libraries.models import Commit, CommitAuthor
+from libraries.models import CommitAuthor
 from libraries.tasks import generate_release_report
 from libraries.utils import (
     set_selected_boost_version,
     determine_selected_boost_version,
     library_doc_latest_transform,
 )
+from versions.cache import get_current_release
 from versions.exceptions import BoostImportedDataException
 from versions.models import Review, Version
 
@@ -95,12 +96,12 @@ class VersionDetail(BoostVersionMixin, VersionAlertMixin, DetailView):
         }
 
     def get_top_contributors_release(self, version: Version):
-        version_commits = Commit.objects.filter(library_version__version=version)
         qs = (
-            CommitAuthor.objects.annotate(
-                count=Count("commit", filter=Q(commit__in=version_commits)),
+            CommitAuthor.objects.filter(
+                version_commit_authors__version=version,
+                version_commit_authors__commit_count__gte=1,
             )
-            .filter(count__gte=1)
+            .annotate(count=F("version_commit_authors__commit_count"))
             .order_by("-count")
         )
         return qs
@@ -146,7 +147,7 @@ class VersionDetail(BoostVersionMixin, VersionAlertMixin, DetailView):
         """Return the object that the view is displaying"""
         version_slug = self.kwargs.get("version_slug", LATEST_RELEASE_URL_PATH_STR)
         if version_slug == LATEST_RELEASE_URL_PATH_STR:
-            return Version.objects.most_recent()
+            return get_current_release(self.request)
 
         return get_object_or_404(Version, slug=version_slug)
 